@@ -61,7 +61,7 @@ def main():
 
             # Add mesh
             plotter.add_mesh(
-                world.mesh,
+                world.to_polydata(),
                 scalars=layer,
                 cmap=cmap,
                 show_edges=False,
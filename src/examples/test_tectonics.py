@@ -90,9 +90,10 @@ async def main():
 
         print("\nPlate Composition:")
         for i in range(min(3, tecto_meta['num_plates'])):  # Show first 3 plates
-            plate_stats = stats["plates"][f"plate_{i}"]
+            plate_stats = stats["plates"][i]
             print(
-                f"  Plate {i}: {plate_stats['total_points']} points "
+                f"  Plate {i}: {plate_stats['total_points']} points, "
+                f"{plate_stats['area'] / 1e6:,.0f} km² "
                 f"({plate_stats['land_percent']:.1f}% land)"
             )
 
@@ -176,7 +176,7 @@ class POIDetectorPlugin(AnalysisPlugin):
                 pois.append(
                     POIData(
                         poi_type="mountain",
-                        location=tuple(world.mesh.points[idx]),
+                        location=tuple(world.points[idx]),
                         mesh_index=int(idx),
                         name=self._generate_mountain_name(),
                         properties={
@@ -214,7 +214,7 @@ class POIDetectorPlugin(AnalysisPlugin):
                 pois.append(
                     POIData(
                         poi_type="valley",
-                        location=tuple(world.mesh.points[idx]),
+                        location=tuple(world.points[idx]),
                         mesh_index=int(idx),
                         name=f"{random.choice(['Deep', 'Great', 'Hidden'])} Valley",
                         properties={
@@ -238,31 +238,33 @@ class POIDetectorPlugin(AnalysisPlugin):
         pois = []
 
         # Find points near sea level with high elevation variance nearby
-        for idx in range(0, len(elevations), 100):  # Sample every 100th point
-            if abs(elevations[idx]) < 100:  # Near sea level
-                # Check neighbors
-                neighbors = world.get_neighbors(idx, radius=5000)  # 5km
-                if len(neighbors) > 5:
-                    land_count = np.sum(landforms[neighbors])
-                    ocean_count = len(neighbors) - land_count
-
-                    # Interesting coastline if mix of land and ocean
-                    if land_count > 0 and ocean_count > 0:
-                        ratio = min(land_count, ocean_count) / max(land_count, ocean_count)
-                        if ratio > 0.3:  # Significant mix
-                            pois.append(
-                                POIData(
-                                    poi_type="coastline",
-                                    location=tuple(world.mesh.points[idx]),
-                                    mesh_index=int(idx),
-                                    name=f"{random.choice(['Cape', 'Bay', 'Cove', 'Peninsula'])}",
-                                    properties={
-                                        "elevation": float(elevations[idx]),
-                                        "land_ocean_ratio": float(ratio),
-                                    },
-                                    importance=ratio,
-                                )
+        sampled = np.arange(0, len(elevations), 100)  # Sample every 100th point
+        candidates = sampled[np.abs(elevations[sampled]) < 100]  # Near sea level
+        indptr, indices = world.get_neighbors_many(candidates, radius=5000)  # 5km
+        for i, idx in enumerate(candidates):
+            # Check neighbors
+            neighbors = indices[indptr[i] : indptr[i + 1]]
+            if len(neighbors) > 5:
+                land_count = np.sum(landforms[neighbors])
+                ocean_count = len(neighbors) - land_count
+
+                # Interesting coastline if mix of land and ocean
+                if land_count > 0 and ocean_count > 0:
+                    ratio = min(land_count, ocean_count) / max(land_count, ocean_count)
+                    if ratio > 0.3:  # Significant mix
+                        pois.append(
+                            POIData(
+                                poi_type="coastline",
+                                location=tuple(world.points[idx]),
+                                mesh_index=int(idx),
+                                name=f"{random.choice(['Cape', 'Bay', 'Cove', 'Peninsula'])}",
+                                properties={
+                                    "elevation": float(elevations[idx]),
+                                    "land_ocean_ratio": float(ratio),
+                                },
+                                importance=ratio,
                             )
+                        )
 
         return pois
 
@@ -292,9 +294,11 @@ class POIDetectorPlugin(AnalysisPlugin):
         # Sample every Nth habitable point to avoid too many settlements
         sample_step = max(len(habitable_indices) // 50, 1)
 
-        for idx in habitable_indices[::sample_step]:
+        candidates = habitable_indices[::sample_step]
+        indptr, indices = world.get_neighbors_many(candidates, radius=10000)  # 10km
+        for i, idx in enumerate(candidates):
             # Calculate habitability score
-            neighbors = world.get_neighbors(idx, radius=10000)  # 10km
+            neighbors = indices[indptr[i] : indptr[i + 1]]
             if len(neighbors) > 10:
                 elevation_variance = np.var(elevations[neighbors])
 
@@ -310,7 +314,7 @@ class POIDetectorPlugin(AnalysisPlugin):
                     pois.append(
                         POIData(
                             poi_type="settlement",
-                            location=tuple(world.mesh.points[idx]),
+                            location=tuple(world.points[idx]),
                             mesh_index=int(idx),
                             name=self._generate_settlement_name(),
                             properties={
@@ -333,35 +337,37 @@ class POIDetectorPlugin(AnalysisPlugin):
         pois = []
 
         # Sample points
-        for idx in range(0, len(elevations), 200):  # Every 200th point
-            if elevations[idx] > 500:  # Must be reasonably high
-                neighbors = world.get_neighbors(idx, radius=15000)  # 15km
-                if len(neighbors) > 10:
-                    height_advantage = elevations[idx] - np.mean(elevations[neighbors])
-                    elevation_variance = np.var(elevations[neighbors])
-
-                    # Good viewpoint: high relative to surroundings with varied terrain
-                    if height_advantage > 300 and elevation_variance > 50000:
-                        scenic_score = min(
-                            (height_advantage / 1000) * (elevation_variance / 200000),
-                            1.0,
-                        )
+        sampled = np.arange(0, len(elevations), 200)  # Every 200th point
+        candidates = sampled[elevations[sampled] > 500]  # Must be reasonably high
+        indptr, indices = world.get_neighbors_many(candidates, radius=15000)  # 15km
+        for i, idx in enumerate(candidates):
+            neighbors = indices[indptr[i] : indptr[i + 1]]
+            if len(neighbors) > 10:
+                height_advantage = elevations[idx] - np.mean(elevations[neighbors])
+                elevation_variance = np.var(elevations[neighbors])
 
-                        if scenic_score > 0.5:
-                            pois.append(
-                                POIData(
-                                    poi_type="viewpoint",
-                                    location=tuple(world.mesh.points[idx]),
-                                    mesh_index=int(idx),
-                                    name=f"{random.choice(self.VIEWPOINT_NAMES)}",
-                                    properties={
-                                        "elevation": float(elevations[idx]),
-                                        "height_advantage": float(height_advantage),
-                                        "scenic_score": float(scenic_score),
-                                    },
-                                    importance=scenic_score,
-                                )
+                # Good viewpoint: high relative to surroundings with varied terrain
+                if height_advantage > 300 and elevation_variance > 50000:
+                    scenic_score = min(
+                        (height_advantage / 1000) * (elevation_variance / 200000),
+                        1.0,
+                    )
+
+                    if scenic_score > 0.5:
+                        pois.append(
+                            POIData(
+                                poi_type="viewpoint",
+                                location=tuple(world.points[idx]),
+                                mesh_index=int(idx),
+                                name=f"{random.choice(self.VIEWPOINT_NAMES)}",
+                                properties={
+                                    "elevation": float(elevations[idx]),
+                                    "height_advantage": float(height_advantage),
+                                    "scenic_score": float(scenic_score),
+                                },
+                                importance=scenic_score,
                             )
+                        )
 
         return pois
 
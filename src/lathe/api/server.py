@@ -1,16 +1,19 @@
 """FastAPI server for world generation and management."""
 
 import asyncio
+import json
 from typing import Any
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import numpy as np
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 from lathe.analysis.poi_detector import POIDetectorPlugin
 from lathe.core.engine import WorldGenerationEngine
 from lathe.core.events import Event, EventType, get_global_emitter
+from lathe.models.layers import layer_spec
 from lathe.models.world import WorldParameters
 from lathe.plugins.terrain.generator import TerrainGeneratorPlugin
 from lathe.plugins.tectonics.simulator import TectonicsSimulatorPlugin
@@ -320,15 +323,65 @@ async def get_pois(
 
 
 @app.get("/worlds/{world_id}/mesh/{layer}")
-async def get_mesh_layer(world_id: UUID, layer: str):
-    """Get a specific mesh data layer."""
+async def get_mesh_layer(world_id: UUID, layer: str, encoding: str = "json"):
+    """Get a specific mesh data layer.
+
+    With encoding=binary the body is the raw little-endian array in C
+    order (masks bitpacked), described by X-Layer-Dtype, X-Layer-Length
+    (points), X-Layer-Shape (JSON list, e.g. [N, 3] for Normals) and
+    X-Layer-Encoding headers.
+    """
+    if encoding not in ("json", "binary"):
+        raise HTTPException(status_code=400, detail="encoding must be 'json' or 'binary'")
+
     data = mesh_store.get_data_layer(world_id, layer)
 
     if data is None:
         raise HTTPException(status_code=404, detail=f"Layer '{layer}' not found")
 
-    # Convert to list for JSON serialization
-    return {"layer": layer, "data": data.tolist(), "length": len(data)}
+    spec = layer_spec(layer)
+    categories = list(spec.categories) if spec is not None and spec.categories is not None else None
+
+    if encoding == "binary":
+        if data.dtype == np.bool_:
+            body, layout = np.packbits(data).tobytes(), "bitpacked"
+        else:
+            data = data.astype(data.dtype.newbyteorder("<"), copy=False)
+            body, layout = data.tobytes(), "raw"
+        headers = {
+            "X-Layer-Dtype": data.dtype.str,
+            "X-Layer-Length": str(len(data)),
+            "X-Layer-Shape": json.dumps(list(data.shape)),
+            "X-Layer-Encoding": layout,
+        }
+        if categories is not None:
+            headers["X-Layer-Categories"] = json.dumps(categories)
+        return Response(content=body, media_type="application/octet-stream", headers=headers)
+
+    # Convert to list for JSON serialization (masks as 0/1)
+    return {
+        "layer": layer,
+        "dtype": str(data.dtype),
+        "categories": categories,
+        "data": (data.view(np.uint8) if data.dtype == np.bool_ else data).tolist(),
+        "length": len(data),
+        "shape": list(data.shape),
+    }
+
+
+@app.get("/worlds/{world_id}/tectonics/stats")
+async def get_tectonic_stats(world_id: UUID):
+    """Get per-plate and boundary statistics from the tectonics simulation."""
+    info = mesh_store.get_world_info(world_id)
+
+    if not info:
+        raise HTTPException(status_code=404, detail="World not found")
+
+    tectonics = info["metadata"].get("tectonic_plates")
+    if not tectonics or "stats" not in tectonics:
+        raise HTTPException(status_code=404, detail="World has no tectonics statistics")
+
+    return tectonics["stats"]
 
 
 @app.websocket("/ws/worlds/{world_id}")
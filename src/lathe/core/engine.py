@@ -1,6 +1,7 @@
 """Core world generation engine with plugin orchestration."""
 
 import asyncio
+import json
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
@@ -8,8 +9,10 @@ from typing import Any, Callable
 import os
 
 import networkx as nx
+import numpy as np
 
 from lathe.core.events import EventEmitter, EventType, get_global_emitter
+from lathe.models.layers import layer_digest
 from lathe.models.world import World, WorldParameters
 from lathe.plugins.base import AnalysisPlugin, PluginResult, SimulationPlugin
 
@@ -27,6 +30,9 @@ class WorldGenerationEngine:
     - Executes plugins in correct order
     - Handles parallelization where possible
     - Reports progress via events
+    - Records each plugin run (parameters, input and output layer hashes)
+      in world.metadata["plugin_runs"], so update_world() and
+      analyze_world() can skip work whose inputs have not changed
     """
 
     def __init__(
@@ -91,21 +97,46 @@ class WorldGenerationEngine:
         pipeline: list[str] | None = None,
         plugin_params: dict[str, dict[str, Any]] | None = None,
         progress_callback: Callable[[float, str], None] | None = None,
+        base_world: World | None = None,
     ) -> World:
         """Generate a complete world by running a plugin pipeline.
 
+        With base_world, the pipeline runs on a fork of that world (see
+        World.fork()) as update_world() would. Plugins not in plugin_params
+        keep the parameters of their runs on the base world, so only the
+        plugins given new parameters (and those depending on their output)
+        are executed, and only the layers they write take new memory. The
+        base world is unchanged.
+
         Args:
             params: World generation parameters
-            pipeline: Ordered list of plugin names to execute
+            pipeline: Ordered list of plugin names to execute (with
+                base_world, defaults to its recorded pipeline followed by
+                any other plugin in plugin_params)
             plugin_params: Parameters for each plugin {plugin_name: {param: value}}
             progress_callback: Optional callback for progress updates
+            base_world: Generated world to branch from
 
         Returns:
             Generated World object
 
         Raises:
             PipelineExecutionError: If pipeline execution fails
+            ValueError: If both params and base_world are given
         """
+        if base_world is not None:
+            if params is not None:
+                msg = "params cannot be combined with base_world; forks keep the base world's parameters"
+                raise ValueError(msg)
+
+            if pipeline is None:
+                pipeline = list(base_world.metadata.get("pipeline_steps") or ["terrain", "tectonics"])
+                pipeline += [name for name in plugin_params or {} if name not in pipeline]
+
+            world = base_world.fork()
+            world.metadata["created_at"] = datetime.now(timezone.utc).isoformat()
+            return await self.update_world(world, pipeline, plugin_params, progress_callback)
+
         # Create world
         world = World(params or WorldParameters())
 
@@ -153,6 +184,7 @@ class WorldGenerationEngine:
                     await self._execute_plugin(world, step, plugin_params.get(step, {}))
 
             # Mark generation as complete
+            self._record_layer_digests(world)
             world.metadata["generation_complete"] = True
             world.metadata["pipeline_steps"] = pipeline
             world.metadata["created_at"] = start_time.isoformat()
@@ -181,18 +213,161 @@ class WorldGenerationEngine:
             )
             raise PipelineExecutionError(f"Pipeline execution failed: {e}") from e
 
+    async def update_world(
+        self,
+        world: World,
+        pipeline: list[str] | None = None,
+        plugin_params: dict[str, dict[str, Any]] | None = None,
+        progress_callback: Callable[[float, str], None] | None = None,
+        rerun_from: str | None = None,
+    ) -> World:
+        """Rerun a pipeline on an existing world, skipping up-to-date plugins.
+
+        A plugin is skipped if its parameters are unchanged since its last
+        run, and no layer it reads or wrote then, nor the geometry it started
+        from or left, has since been changed, by a plugin rerun earlier in
+        this update or by code outside the engine. Plugins left out of
+        plugin_params keep the parameters of their last run, so an update
+        without parameters only repairs what changed.
+
+        Before a plugin reruns, inputs that later plugins overwrote are
+        restored from world.plugin_inputs. So rerun_from="tectonics" starts
+        tectonics from terrain's elevation, not from its own previous output.
+
+        Args:
+            world: World generated (or last updated) by a pipeline
+            pipeline: Ordered list of plugin names (default: the world's
+                recorded pipeline)
+            plugin_params: Parameters for each plugin {plugin_name: {param: value}};
+                plugins not listed rerun with the parameters of their last run
+            progress_callback: Optional callback for progress updates
+            rerun_from: Plugin to rerun unconditionally, together with every
+                plugin after it in execution order
+
+        Returns:
+            The updated world
+
+        Raises:
+            PipelineExecutionError: If execution fails, or a plugin must rerun
+                but inputs it needs were overwritten and are no longer in
+                memory (e.g. after reloading the world); rerun from an
+                earlier plugin instead, or pass its parameters if those
+                included worlds or arrays
+        """
+        if pipeline is None:
+            pipeline = world.metadata.get("pipeline_steps") or ["terrain", "tectonics"]
+
+        if rerun_from is not None and rerun_from not in pipeline:
+            msg = f"rerun_from plugin '{rerun_from}' is not in the pipeline"
+            raise PipelineExecutionError(msg)
+
+        plugin_params = plugin_params or {}
+
+        self.emitter.emit(
+            EventType.GENERATION_STARTED,
+            f"Updating world: {world.params.name or world.id}",
+            world_id=str(world.id),
+            pipeline=pipeline,
+        )
+
+        start_time = datetime.now(timezone.utc)
+
+        try:
+            graph = self._build_dependency_graph(pipeline)
+            self._validate_dependencies(graph, pipeline)
+            execution_plan = self._plan_execution(graph, pipeline)
+
+            # Layers whose current contents the recorded runs never saw
+            recorded = world.metadata.get("layer_digests", {})
+            rewritten = {
+                name for name in world.list_data_layers() if world.layer_digest(name) != recorded.get(name)
+            }
+            # Whether the points differ from what the recorded runs left
+            final_points = world.metadata.get("points_digest")
+            points_rewritten = layer_digest(world.points) != final_points
+
+            replaying = False
+            skipped: list[str] = []
+            total_steps = len(execution_plan)
+            for step_idx, step in enumerate(execution_plan):
+                if progress_callback:
+                    progress_callback(step_idx / total_steps, f"Step {step_idx + 1}/{total_steps}")
+
+                names = step if isinstance(step, list) else [step]
+                replaying = replaying or rerun_from in names
+                points = layer_digest(world.points) if points_rewritten else None
+                stale = [
+                    name
+                    for name in names
+                    if replaying
+                    or not self._is_current(world, name, plugin_params.get(name), rewritten, points)
+                ]
+                skipped += [name for name in names if name not in stale]
+                if not stale:
+                    continue
+
+                step_params = {
+                    name: plugin_params[name] if name in plugin_params else self._recorded_params(world, name)
+                    for name in stale
+                }
+                step_start = world.layer_clock
+                for name in stale:
+                    self._restore_inputs(world, name, rewritten)
+                if len(stale) == 1:
+                    await self._execute_plugin(world, stale[0], step_params[stale[0]])
+                else:
+                    await self._execute_parallel(world, stale, step_params)
+                rewritten.update(world.layers_changed_since(step_start))
+                points_rewritten = layer_digest(world.points) != final_points
+
+            self._record_layer_digests(world)
+            world.metadata["generation_complete"] = True
+            world.metadata["pipeline_steps"] = pipeline
+            world.metadata["skipped_steps"] = skipped
+            world.metadata["update_time_seconds"] = (
+                datetime.now(timezone.utc) - start_time
+            ).total_seconds()
+
+            if progress_callback:
+                progress_callback(1.0, "Update complete")
+
+            self.emitter.emit(
+                EventType.GENERATION_COMPLETED,
+                f"World update complete: {world.params.name or world.id} (skipped {skipped})",
+                world_id=str(world.id),
+                generation_time=world.metadata["update_time_seconds"],
+            )
+
+            return world
+
+        except Exception as e:
+            self.emitter.emit(
+                EventType.GENERATION_FAILED,
+                f"World update failed: {e}",
+                world_id=str(world.id),
+                error=str(e),
+            )
+            if isinstance(e, PipelineExecutionError):
+                raise
+            raise PipelineExecutionError(f"Pipeline execution failed: {e}") from e
+
     async def analyze_world(
         self,
         world: World,
         analyzers: list[str],
         analyzer_params: dict[str, dict[str, Any]] | None = None,
+        force: bool = False,
     ) -> dict[str, Any]:
         """Run analysis plugins on a world.
 
+        An analyzer whose parameters and input layers are unchanged since it
+        last ran on this world object returns its previous result instead.
+
         Args:
             world: World to analyze
             analyzers: List of analyzer plugin names
             analyzer_params: Parameters for each analyzer
+            force: Run every analyzer even if its inputs are unchanged
 
         Returns:
             Dictionary of analysis results {analyzer_name: result}
@@ -226,6 +401,19 @@ class WorldGenerationEngine:
                 )
                 continue
 
+            # Reuse the last result if nothing it depends on changed
+            run = {
+                "params": _params_record(params),
+                "points": layer_digest(world.points),
+                "inputs": {
+                    layer: world.layer_digest(layer) for layer in analyzer.get_required_data_layers()
+                },
+            }
+            cached = world.analysis_results.get(analyzer_name)
+            if not force and cached is not None and world.metadata.get("analysis_runs", {}).get(analyzer_name) == run:
+                results[analyzer_name] = cached
+                continue
+
             # Execute analyzer
             result = await analyzer.analyze(
                 world,
@@ -234,6 +422,9 @@ class WorldGenerationEngine:
             )
 
             results[analyzer_name] = result
+            if result.success:
+                world.analysis_results[analyzer_name] = result
+                world.metadata.setdefault("analysis_runs", {})[analyzer_name] = run
 
         self.emitter.emit(
             EventType.ANALYSIS_COMPLETED,
@@ -248,6 +439,7 @@ class WorldGenerationEngine:
         world: World,
         plugin_name: str,
         params: dict[str, Any],
+        exclusive: bool = True,
     ) -> PluginResult:
         """Execute a single plugin.
 
@@ -255,6 +447,8 @@ class WorldGenerationEngine:
             world: World to modify
             plugin_name: Name of plugin to execute
             params: Plugin parameters
+            exclusive: Whether no other plugin runs at the same time (every
+                layer written meanwhile is then attributed to this plugin)
 
         Returns:
             PluginResult
@@ -267,6 +461,10 @@ class WorldGenerationEngine:
             msg = f"Plugin '{plugin_name}' not found"
             raise PipelineExecutionError(msg)
 
+        # Plugins that parallelize internally size their pools from the engine
+        given_params = dict(params)
+        params = {"workers": self.workers, **params}
+
         # Validate parameters
         valid, error_msg = plugin.validate_params(params)
         if not valid:
@@ -280,6 +478,15 @@ class WorldGenerationEngine:
             msg = f"Plugin {plugin_name} requires missing data layers: {missing}"
             raise PipelineExecutionError(msg)
 
+        # Record what the plugin reads, to skip or replay it later
+        start_version = world.layer_clock
+        inputs = {layer: world.layer_digest(layer) for layer in required}
+        snapshot = {
+            layer: (world.get_data_layer(layer), world.layer_records[layer].producer) for layer in required
+        }
+        points_digest = layer_digest(world.points)
+        points = None if points_digest == layer_digest(world.topology.points) else world.shared_points()
+
         # Emit start event
         self.emitter.emit(
             EventType.PLUGIN_STARTED,
@@ -301,6 +508,27 @@ class WorldGenerationEngine:
                     f"Plugin {plugin_name} failed: {result.message}"
                 )
 
+            written = world.layers_changed_since(start_version)
+            if not exclusive:
+                # Plugins running alongside others only claim declared layers
+                declared = set(plugin.get_produced_data_layers()) | set(required)
+                written = [layer for layer in written if layer in declared]
+            for layer in written:
+                record = world.layer_records[layer]
+                if record.producer is None:
+                    record.producer = plugin_name
+
+            world.plugin_params[plugin_name] = given_params
+            world.plugin_inputs[plugin_name] = snapshot
+            world.plugin_points[plugin_name] = points
+            world.metadata.setdefault("plugin_runs", {})[plugin_name] = {
+                "params": _params_record(params),
+                "points": points_digest,
+                "points_out": layer_digest(world.points),
+                "inputs": inputs,
+                "outputs": {layer: world.layer_digest(layer) for layer in written},
+            }
+
             self.emitter.emit(
                 EventType.PLUGIN_COMPLETED,
                 f"Plugin complete: {plugin_name} - {result.message}",
@@ -337,11 +565,140 @@ class WorldGenerationEngine:
             List of PluginResults
         """
         tasks = [
-            self._execute_plugin(world, name, plugin_params.get(name, {}))
+            self._execute_plugin(world, name, plugin_params.get(name, {}), exclusive=False)
             for name in plugin_names
         ]
         return await asyncio.gather(*tasks)
 
+    def _is_current(
+        self,
+        world: World,
+        plugin_name: str,
+        params: dict[str, Any] | None,
+        rewritten: set[str],
+        points: str | None,
+    ) -> bool:
+        """Whether a plugin's last run on the world is still valid.
+
+        Args:
+            world: World being updated
+            plugin_name: Plugin name
+            params: Parameters the plugin would run with (None: those of its
+                last run)
+            rewritten: Layers changed since the recorded runs (by plugins
+                rerun in this update or outside the engine)
+            points: Hash of the current points if they differ from what the
+                recorded runs left, else None
+
+        Returns:
+            True if the plugin can be skipped
+        """
+        run = world.metadata.get("plugin_runs", {}).get(plugin_name)
+        if run is None or (params is not None and run["params"] != _params_record(params)):
+            return False
+
+        # With the geometry rewritten, only a plugin that starts from the
+        # current points and leaves them as they are still holds
+        if points is not None and not (run["points"] == points == run.get("points_out")):
+            return False
+
+        # Layers not rewritten hold what the recorded runs left, so only
+        # rewritten ones can differ from what the plugin saw and produced
+        for recorded in (run["inputs"], run["outputs"]):
+            for layer, digest in recorded.items():
+                if not world.has_data_layer(layer):
+                    return False
+                if layer in rewritten and world.layer_digest(layer) != digest:
+                    return False
+
+        return True
+
+    def _recorded_params(self, world: World, plugin_name: str) -> dict[str, Any]:
+        """Parameters of a plugin's last run on the world, to rerun it with.
+
+        Args:
+            world: World being updated
+            plugin_name: Plugin name
+
+        Returns:
+            The recorded parameters ({} if the plugin never ran on the world)
+
+        Raises:
+            PipelineExecutionError: If they included worlds or arrays that
+                are no longer in memory (e.g. after reloading the world)
+        """
+        params = world.plugin_params.get(plugin_name)
+        if params is not None:
+            return dict(params)
+
+        run = world.metadata.get("plugin_runs", {}).get(plugin_name)
+        if run is None:
+            return {}
+
+        recorded = run["params"]
+        if not isinstance(recorded, dict) or any(
+            marker in json.dumps(recorded) for marker in ('"__world__"', '"__array__"')
+        ):
+            msg = (
+                f"Cannot rerun {plugin_name}: the parameters of its last run are not in memory; "
+                "pass them in plugin_params"
+            )
+            raise PipelineExecutionError(msg)
+        return dict(recorded)
+
+    def _restore_inputs(self, world: World, plugin_name: str, rewritten: set[str]) -> None:
+        """Put back the inputs a plugin saw last run that later plugins overwrote.
+
+        Plugins sample the deformed geometry, so its points are restored too.
+
+        Args:
+            world: World being updated
+            plugin_name: Plugin about to rerun
+            rewritten: Layers changed since the recorded runs
+
+        Raises:
+            PipelineExecutionError: If an overwritten input is not in memory
+        """
+        run = world.metadata.get("plugin_runs", {}).get(plugin_name)
+        if run is None:
+            return
+
+        if layer_digest(world.points) != run["points"]:
+            points = world.plugin_points.get(plugin_name)
+            if points is not None:
+                world.set_points(points)
+            elif run["points"] == layer_digest(world.topology.points):
+                world.reset_mesh_geometry()
+            else:
+                msg = (
+                    f"Cannot rerun {plugin_name}: the geometry it started from is not in memory; "
+                    "rerun from an earlier plugin"
+                )
+                raise PipelineExecutionError(msg)
+
+        for layer, digest in run["inputs"].items():
+            if layer in rewritten or world.layer_digest(layer) == digest:
+                continue
+
+            saved = world.plugin_inputs.get(plugin_name, {}).get(layer)
+            if saved is None:
+                msg = (
+                    f"Cannot rerun {plugin_name}: its input '{layer}' was overwritten by a later "
+                    "plugin and its earlier state is not in memory; rerun from an earlier plugin"
+                )
+                raise PipelineExecutionError(msg)
+
+            data, producer = saved
+            world.add_data_layer(layer, data, overwrite=True, producer=producer)
+            world.layer_records[layer].digest = digest
+
+    def _record_layer_digests(self, world: World) -> None:
+        """Record the hash of every layer and of the points as left by the pipeline."""
+        world.metadata["layer_digests"] = {
+            name: world.layer_digest(name) for name in world.list_data_layers()
+        }
+        world.metadata["points_digest"] = layer_digest(world.points)
+
     def _build_dependency_graph(self, pipeline: list[str]) -> nx.DiGraph:
         """Build dependency graph from plugin dependencies.
 
@@ -464,3 +821,38 @@ class WorldGenerationEngine:
             )
 
         return callback
+
+
+def _params_record(params: dict[str, Any]) -> dict[str, Any]:
+    """JSON form of plugin parameters, as recorded in world.metadata.
+
+    The engine-supplied worker count is left out. Worlds are recorded by id
+    and layer hashes and arrays by dtype, shape and content hash, so
+    changing their contents counts as changing the parameters.
+
+    Args:
+        params: Plugin parameters
+
+    Returns:
+        JSON-serializable parameters
+
+    Raises:
+        TypeError: If a value is of any other type JSON can't represent
+    """
+    payload = json.dumps(
+        {k: v for k, v in params.items() if k != "workers"}, sort_keys=True, default=_encode_param
+    )
+    return json.loads(payload)
+
+
+def _encode_param(value: Any) -> Any:
+    """JSON stand-in for a parameter value json can't encode itself."""
+    if isinstance(value, World):
+        layers = {name: value.layer_digest(name) for name in sorted(value.list_data_layers())}
+        return {"__world__": str(value.id), "layers": layers}
+    if isinstance(value, np.ndarray):
+        return {"__array__": layer_digest(value), "dtype": value.dtype.str, "shape": list(value.shape)}
+    if isinstance(value, np.generic):
+        return value.item()
+    msg = f"Plugin parameter of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
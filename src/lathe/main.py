@@ -1,5 +1,49 @@
+"""Command line interface for lathe."""
+
+import argparse
+import time
+from pathlib import Path
+
+from lathe.models.topology import topology_dir, write_topology_pack
+from lathe.models.world import WorldParameters
+
+
+def build_topology(args: argparse.Namespace) -> None:
+    """Precompute topology packs for the requested recursion levels."""
+    directory = Path(args.dir) if args.dir else topology_dir()
+    for recursion in args.recursion:
+        start = time.perf_counter()
+        try:
+            pack_dir = write_topology_pack(recursion, args.radius, directory, overwrite=args.force)
+        except FileExistsError as e:
+            print(f"{e} (use --force to rebuild)")
+            continue
+
+        size_mb = sum(p.stat().st_size for p in pack_dir.iterdir()) / (1024 * 1024)
+        print(f"Wrote {pack_dir} ({size_mb:.1f} MB) in {time.perf_counter() - start:.1f}s")
+
+
 def main():
-    print("Hello from lathe!")
+    parser = argparse.ArgumentParser(prog="lathe", description="Procedural world generation tool")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    topology = commands.add_parser("topology", help="Manage precomputed icosphere topology packs")
+    topology_commands = topology.add_subparsers(dest="topology_command", required=True)
+
+    build = topology_commands.add_parser("build", help="Precompute topology packs")
+    build.add_argument("recursion", type=int, nargs="+", help="Icosphere recursion level(s)")
+    build.add_argument(
+        "--radius",
+        type=float,
+        default=WorldParameters.radius,
+        help="Sphere radius in meters (default: %(default)s)",
+    )
+    build.add_argument("--dir", help="Topology directory (default: $LATHE_TOPOLOGY_DIR or ./data/topology)")
+    build.add_argument("--force", action="store_true", help="Rebuild existing packs")
+    build.set_defaults(func=build_topology)
+
+    args = parser.parse_args()
+    args.func(args)
 
 
 if __name__ == "__main__":
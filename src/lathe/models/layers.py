@@ -0,0 +1,137 @@
+"""Storage types of world data layers.
+
+Each known layer has a LayerSpec giving the dtype it is held in, in memory
+and on disk, so layers take no more space than their values need:
+
+- Masks are bool (bitpacked in HDF5 files)
+- Categorical layers are small unsigned integers, optionally with a table
+  naming each code
+- Continuous fields are float32 unless they need more precision
+
+World and WorldPatch cast layers to their spec on add_data_layer(). Layers
+without a spec keep the dtype they were added with. Plugins producing new
+layers can declare them with register_layer().
+
+World also keeps a LayerRecord per layer (version, producer, content hash)
+so pipelines can tell which layers changed since a plugin last ran.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+# Names of the tectonic boundary type codes (index = code)
+BOUNDARY_TYPE_NAMES = ("none", "convergent", "divergent", "transform")
+
+
+@dataclass(frozen=True)
+class LayerSpec:
+    """How a data layer is stored.
+
+    Attributes:
+        dtype: Element type of the layer
+        categories: Name of each code of a categorical layer (index = code)
+    """
+
+    dtype: np.dtype
+    categories: tuple[str, ...] | None = None
+
+    @property
+    def kind(self) -> str:
+        """"mask", "category" or "continuous"."""
+        if self.dtype == np.bool_:
+            return "mask"
+        if np.issubdtype(self.dtype, np.integer):
+            return "category"
+        return "continuous"
+
+
+LAYER_SPECS: dict[str, LayerSpec] = {
+    # Terrain
+    "elevation_raw": LayerSpec(np.dtype(np.float32)),
+    # Spans ~1e-7 around 1.0; float32 cannot resolve it
+    "elevation_scalars": LayerSpec(np.dtype(np.float64)),
+    "elevation": LayerSpec(np.dtype(np.float32)),
+    "landforms": LayerSpec(np.dtype(np.bool_)),
+    "slope": LayerSpec(np.dtype(np.float32)),
+    "aspect": LayerSpec(np.dtype(np.float32)),
+    "Normals": LayerSpec(np.dtype(np.float32)),
+    # Tectonics (at most 100 plates)
+    "plate_id": LayerSpec(np.dtype(np.uint8)),
+    "plate_distance": LayerSpec(np.dtype(np.float32)),
+    "plate_boundary": LayerSpec(np.dtype(np.bool_)),
+    "boundary_type": LayerSpec(np.dtype(np.uint8), BOUNDARY_TYPE_NAMES),
+    "boundary_distance": LayerSpec(np.dtype(np.float32)),
+}
+
+
+@dataclass
+class LayerRecord:
+    """Provenance of a world's data layer.
+
+    Attributes:
+        version: World layer clock value when the layer was last written;
+            increases with every write to any layer of the world
+        producer: Name of the plugin that wrote it (None if unknown)
+        digest: Cached content hash (see layer_digest()), None until needed
+    """
+
+    version: int
+    producer: str | None = None
+    digest: str | None = None
+
+
+def layer_digest(data: NDArray) -> str:
+    """Content hash of a layer, covering its dtype, shape and values.
+
+    Args:
+        data: Layer values
+
+    Returns:
+        Hex digest (32 characters)
+    """
+    data = np.ascontiguousarray(data)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{data.dtype.str}{data.shape}".encode())
+    h.update(data.data)
+    return h.hexdigest()
+
+
+def register_layer(name: str, dtype: DTypeLike, categories: tuple[str, ...] | None = None) -> None:
+    """Declare (or replace) the storage type of a layer.
+
+    Args:
+        name: Layer name
+        dtype: Element type of the layer
+        categories: Name of each code, for categorical layers
+    """
+    LAYER_SPECS[name] = LayerSpec(np.dtype(dtype), categories)
+
+
+def layer_spec(name: str) -> LayerSpec | None:
+    """Storage type of a layer, or None if it has no spec."""
+    return LAYER_SPECS.get(name)
+
+
+def coerce_layer(name: str, data: NDArray) -> NDArray:
+    """Cast layer data to the layer's spec.
+
+    Masks are thresholded at 0.5, so 0/1 float masks convert exactly.
+
+    Args:
+        name: Layer name
+        data: Layer values
+
+    Returns:
+        Data in the spec dtype (the input itself if already in it or if the
+        layer has no spec)
+    """
+    data = np.asarray(data)
+    spec = LAYER_SPECS.get(name)
+    if spec is None or data.dtype == spec.dtype:
+        return data
+    if spec.dtype == np.bool_:
+        return data > 0.5
+    return data.astype(spec.dtype)
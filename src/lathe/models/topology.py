@@ -0,0 +1,579 @@
+"""Shared, read-only icosphere topology.
+
+Every World at the same recursion and radius starts from the same sphere:
+identical base points, faces, vertex adjacency, edge lengths, vertex areas
+and latitude/longitude. ``get_topology`` provides these once per process and
+hands the same ``SphereTopology`` to every world, which then only owns its
+deformed points and data layers.
+
+Topology packs:
+    ``write_topology_pack`` (or ``lathe topology build``) precomputes all of
+    the above into a directory of uncompressed ``.npy`` files. When a pack
+    for the requested sphere exists in the topology directory
+    (``LATHE_TOPOLOGY_DIR``, default ``./data/topology``), arrays are opened
+    lazily as read-only ``np.memmap`` instead of being computed, so new
+    processes start almost instantly and share the pages through the OS
+    page cache.
+
+    Pack layout (``<topology dir>/icosphere-r<recursion>-<radius>/``):
+        pack.json        - Format version, recursion, radius, array names
+        points.npy       - (N, 3) float64 base points
+        faces.npy        - (M, 3) int64 triangle vertex indices
+        indptr.npy       - (N + 1,) int64 CSR row pointers
+        indices.npy      - (2E,) int64 CSR column indices
+        edge_lengths.npy - (2E,) float64 length of each CSR edge
+        point_areas.npy  - (N,) float64 area per point
+        lat.npy, lon.npy - (N,) float64 latitude and longitude in degrees
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import csr_matrix, identity
+
+if TYPE_CHECKING:
+    from pyvista import CellArray, PolyData
+
+PACK_FORMAT_VERSION = 1
+DEFAULT_TOPOLOGY_DIR = "./data/topology"
+PACK_ARRAYS = (
+    "points",
+    "faces",
+    "indptr",
+    "indices",
+    "edge_lengths",
+    "point_areas",
+    "lat",
+    "lon",
+)
+
+# Unit icosahedron identical to pyvista.Icosahedron(): float32 coordinates,
+# same vertex and face order
+_A = 0.5257311121191336
+_B = 0.8506508083520399
+ICOSAHEDRON_POINTS: NDArray[np.float32] = np.array(
+    [
+        [0.0, _A, -_B], [0.0, _A, _B], [0.0, -_A, _B], [-_A, _B, 0.0],
+        [-_A, -_B, 0.0], [_A, _B, 0.0], [_A, -_B, 0.0], [0.0, -_A, -_B],
+        [_B, 0.0, _A], [-_B, 0.0, _A], [-_B, 0.0, -_A], [_B, 0.0, -_A],
+    ],
+    dtype=np.float32,
+)
+ICOSAHEDRON_FACES: NDArray[np.int64] = np.array(
+    [
+        [0, 3, 5], [1, 5, 3], [1, 9, 2], [1, 2, 8], [0, 11, 7],
+        [0, 7, 10], [2, 4, 6], [7, 6, 4], [3, 10, 9], [4, 9, 10],
+        [5, 8, 11], [6, 11, 8], [1, 3, 9], [1, 8, 5], [0, 10, 3],
+        [0, 5, 11], [7, 4, 10], [7, 11, 6], [2, 9, 4], [2, 6, 8],
+    ],
+    dtype=np.int64,
+)
+
+_registry: dict[tuple[int, float], "SphereTopology"] = {}
+_registry_lock = threading.Lock()
+
+
+class SphereTopology:
+    """Base geometry and connectivity of one icosphere.
+
+    Arrays are read-only and built (or mapped from a pack) on first use, so
+    a topology can be shared freely between worlds and threads.
+    """
+
+    def __init__(self, recursion: int, radius: float, pack_dir: Path | str | None = None):
+        """Initialize the topology; nothing is computed or loaded yet.
+
+        Args:
+            recursion: Subdivision level
+            radius: Sphere radius in meters
+            pack_dir: Topology pack to map arrays from (computed if None)
+        """
+        self.recursion = recursion
+        self.radius = radius
+        self.pack_dir = Path(pack_dir) if pack_dir is not None else None
+
+        self._lock = threading.RLock()
+        self._arrays: dict[str, NDArray] = {}
+        self._cells: "CellArray | None" = None
+        self._edge_lengths: csr_matrix | None = None
+        self._k_rings: dict[int, csr_matrix] = {}
+
+    @property
+    def points(self) -> NDArray[np.float64]:
+        """(N, 3) undeformed sphere points."""
+        return self._array("points")
+
+    @property
+    def faces(self) -> NDArray[np.int64]:
+        """(M, 3) triangle vertex indices."""
+        return self._array("faces")
+
+    @property
+    def num_points(self) -> int:
+        """Number of vertices."""
+        return icosphere_num_points(self.recursion)
+
+    @property
+    def num_faces(self) -> int:
+        """Number of triangles."""
+        return 20 * 4**self.recursion
+
+    def new_mesh(self, points: NDArray[np.float64] | None = None) -> "PolyData":
+        """Create a PyVista mesh over this topology's shared faces.
+
+        Args:
+            points: (N, 3) points for the mesh to use without copying (a
+                copy of the base points if None)
+
+        Returns:
+            PolyData that can be deformed without affecting other meshes
+        """
+        # VTK is only needed once a mesh is requested
+        from pyvista import CellArray, PolyData
+
+        with self._lock:
+            if self._cells is None:
+                # VTK cell array shared by every mesh created from this topology
+                self._cells = CellArray.from_regular_cells(np.ascontiguousarray(self.faces))
+
+        mesh = PolyData()
+        mesh.points = np.array(self.points) if points is None else points
+        mesh.SetPolys(self._cells)
+        return mesh
+
+    def vertex_adjacency(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Vertex adjacency in compressed sparse row form.
+
+        Returns:
+            Tuple of (indptr (N + 1,), indices (2E,)); see build_vertex_adjacency()
+        """
+        return self._array("indptr"), self._array("indices")
+
+    def edge_length_graph(self) -> csr_matrix:
+        """Sparse vertex graph weighted by edge length.
+
+        Returns:
+            (N, N) CSR matrix sharing the structure of vertex_adjacency()
+        """
+        with self._lock:
+            if self._edge_lengths is None:
+                indptr, indices = self.vertex_adjacency()
+                self._edge_lengths = csr_matrix(
+                    (self._array("edge_lengths"), indices, indptr),
+                    shape=(self.num_points, self.num_points),
+                )
+        return self._edge_lengths
+
+    def k_ring(self, k: int) -> csr_matrix:
+        """Neighborhoods of every vertex within k mesh edges.
+
+        Each k is built once (as powers of the adjacency plus identity
+        pattern) and cached; at recursion 8 a 3-ring holds ~37 entries per
+        vertex (~290 MB).
+
+        Args:
+            k: Number of edges (0 gives the identity)
+
+        Returns:
+            (N, N) CSR matrix of ones with sorted columns; row i holds the
+            vertices within k edges of vertex i, including i itself
+        """
+        if k < 0:
+            msg = f"k must be non-negative, got {k}"
+            raise ValueError(msg)
+
+        with self._lock:
+            ring = self._k_rings.get(k)
+            if ring is None:
+                n = self.num_points
+                step = identity(n, dtype=bool, format="csr")
+                if k > 0:
+                    indptr, indices = self.vertex_adjacency()
+                    adjacency = csr_matrix((np.ones(len(indices), dtype=bool), indices, indptr), shape=(n, n))
+                    step = (step + adjacency).tocsr()
+
+                pattern = step
+                for _ in range(k - 1):
+                    pattern = (pattern @ step).tocsr()
+                pattern.sort_indices()
+
+                ring = csr_matrix((np.ones(pattern.nnz), pattern.indices, pattern.indptr), shape=(n, n))
+                self._k_rings[k] = ring
+        return ring
+
+    def point_areas(self) -> NDArray[np.float64]:
+        """Surface area represented by each point.
+
+        Each triangle contributes a third of its area to each of its corners,
+        so the areas sum to the surface area of the mesh.
+
+        Returns:
+            Area in square meters per point
+        """
+        return self._array("point_areas")
+
+    def lat_lon(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Latitude and longitude of each point.
+
+        Returns:
+            Tuple of (lat, lon) in degrees
+        """
+        return self._array("lat"), self._array("lon")
+
+    def _array(self, name: str) -> NDArray:
+        """Get a topology array, mapping it from the pack or computing it."""
+        array = self._arrays.get(name)
+        if array is not None:
+            return array
+
+        with self._lock:
+            if name not in self._arrays:
+                if self.pack_dir is not None:
+                    self._arrays[name] = np.load(self.pack_dir / f"{name}.npy", mmap_mode="r")
+                else:
+                    for key, value in self._compute(name).items():
+                        self._arrays[key] = _read_only(value)
+            return self._arrays[name]
+
+    def _compute(self, name: str) -> dict[str, NDArray]:
+        """Compute an array (and any computed alongside it) from scratch."""
+        if name in ("points", "faces"):
+            points, faces = build_icosphere(self.recursion, self.radius)
+            return {"points": points, "faces": faces}
+
+        if name in ("indptr", "indices"):
+            indptr, indices = build_vertex_adjacency(self.faces, self.num_points)
+            return {"indptr": indptr, "indices": indices}
+
+        if name == "edge_lengths":
+            sources, targets = adjacency_edges(*self.vertex_adjacency())
+            return {"edge_lengths": np.linalg.norm(self.points[targets] - self.points[sources], axis=1)}
+
+        if name == "point_areas":
+            faces = self.faces
+            a, b, c = (self.points[faces[:, i]] for i in range(3))
+            face_areas = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+            areas = np.bincount(faces.ravel(), weights=np.repeat(face_areas / 3.0, 3), minlength=self.num_points)
+            return {"point_areas": areas}
+
+        if name in ("lat", "lon"):
+            lat, lon = lat_lon(self.points)
+            return {"lat": lat, "lon": lon}
+
+        msg = f"Unknown topology array: {name}"
+        raise KeyError(msg)
+
+
+def topology_dir() -> Path:
+    """Directory searched for topology packs (``LATHE_TOPOLOGY_DIR``)."""
+    return Path(os.environ.get("LATHE_TOPOLOGY_DIR", DEFAULT_TOPOLOGY_DIR))
+
+
+def pack_name(recursion: int, radius: float) -> str:
+    """Directory name of the topology pack for a sphere."""
+    return f"icosphere-r{int(recursion)}-{float(radius):.17g}"
+
+
+def get_topology(recursion: int, radius: float) -> SphereTopology:
+    """Return the shared topology for a recursion and radius.
+
+    The first call for a sphere uses its pack from topology_dir() if one
+    exists, otherwise arrays are computed on demand.
+
+    Args:
+        recursion: Subdivision level
+        radius: Sphere radius in meters
+
+    Returns:
+        SphereTopology shared by all callers with the same arguments
+    """
+    key = (int(recursion), float(radius))
+    with _registry_lock:
+        topology = _registry.get(key)
+        if topology is None:
+            pack_dir = topology_dir() / pack_name(*key)
+            if not _is_valid_pack(pack_dir, *key):
+                pack_dir = None
+            topology = SphereTopology(*key, pack_dir=pack_dir)
+            _registry[key] = topology
+    return topology
+
+
+def clear_topologies() -> None:
+    """Drop all registered topologies (worlds keep the ones they hold)."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def write_topology_pack(
+    recursion: int,
+    radius: float,
+    directory: Path | str | None = None,
+    overwrite: bool = False,
+) -> Path:
+    """Precompute a sphere's topology arrays into a memory-mappable pack.
+
+    Args:
+        recursion: Subdivision level
+        radius: Sphere radius in meters
+        directory: Topology directory (defaults to topology_dir())
+        overwrite: Replace an existing pack
+
+    Returns:
+        Path of the pack directory
+
+    Raises:
+        FileExistsError: If the pack exists and overwrite is False
+    """
+    directory = Path(directory) if directory is not None else topology_dir()
+    pack_dir = directory / pack_name(recursion, radius)
+    if pack_dir.exists() and not overwrite:
+        msg = f"Topology pack already exists: {pack_dir}"
+        raise FileExistsError(msg)
+
+    # Compute from scratch, never from an existing (possibly stale) pack
+    topology = SphereTopology(recursion, radius)
+
+    tmp_dir = directory / f".{pack_dir.name}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    for name in PACK_ARRAYS:
+        np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(topology._array(name)))
+
+    manifest = {
+        "format_version": PACK_FORMAT_VERSION,
+        "recursion": int(recursion),
+        "radius": float(radius),
+        "arrays": list(PACK_ARRAYS),
+    }
+    (tmp_dir / "pack.json").write_text(json.dumps(manifest, indent=2))
+
+    shutil.rmtree(pack_dir, ignore_errors=True)
+    tmp_dir.rename(pack_dir)
+    return pack_dir
+
+
+def _is_valid_pack(pack_dir: Path, recursion: int, radius: float) -> bool:
+    """Check that a pack exists and was written for this sphere and format.
+
+    Besides the manifest, every array's header must give the shape and dtype
+    expected at this recursion and its data must fit in the file, so
+    truncated or mismatched packs fall back to computing the topology.
+    """
+    try:
+        manifest = json.loads((pack_dir / "pack.json").read_text())
+    except (OSError, ValueError):
+        return False
+
+    if not (
+        manifest.get("format_version") == PACK_FORMAT_VERSION
+        and manifest.get("recursion") == recursion
+        and manifest.get("radius") == radius
+        and set(manifest.get("arrays", [])) >= set(PACK_ARRAYS)
+    ):
+        return False
+
+    for name, (shape, dtype) in _pack_array_specs(recursion).items():
+        try:
+            array = np.load(pack_dir / f"{name}.npy", mmap_mode="r")
+        except (OSError, ValueError):
+            return False
+        if array.shape != shape or array.dtype != dtype:
+            return False
+    return True
+
+
+def _pack_array_specs(recursion: int) -> dict[str, tuple[tuple[int, ...], np.dtype]]:
+    """Shape and dtype of each pack array at a recursion level."""
+    num_points = icosphere_num_points(recursion)
+    num_faces = 20 * 4**recursion
+    # Each face has three edges, each shared by two faces; CSR stores both directions
+    num_entries = 3 * num_faces
+    float64, int64 = np.dtype(np.float64), np.dtype(np.int64)
+    return {
+        "points": ((num_points, 3), float64),
+        "faces": ((num_faces, 3), int64),
+        "indptr": ((num_points + 1,), int64),
+        "indices": ((num_entries,), int64),
+        "edge_lengths": ((num_entries,), float64),
+        "point_areas": ((num_points,), float64),
+        "lat": ((num_points,), float64),
+        "lon": ((num_points,), float64),
+    }
+
+
+def build_icosphere(recursion: int, radius: float) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """Build an icosphere with NumPy only.
+
+    Reproduces ``pyvista.Icosphere(radius, nsub=recursion)`` bit for bit,
+    including vertex and face order: the icosahedron is split with float32
+    edge midpoints ``recursion`` times (see subdivide_triangles()) and the
+    points are projected to the sphere once at the end.
+
+    Args:
+        recursion: Subdivision level
+        radius: Sphere radius in meters
+
+    Returns:
+        Tuple of (points (N, 3), faces (M, 3))
+    """
+    flat, faces = ICOSAHEDRON_POINTS, ICOSAHEDRON_FACES
+    for _ in range(recursion):
+        flat, faces = subdivide_triangles(flat, faces)
+
+    return project_to_sphere(flat, radius), faces
+
+
+def subdivide_triangles(
+    flat: NDArray[np.float32],
+    faces: NDArray[np.int64],
+) -> tuple[NDArray[np.float32], NDArray[np.int64]]:
+    """Split every triangle into four, sharing midpoints along common edges.
+
+    Matches VTK's linear subdivision: triangle (p0, p1, p2) has edges
+    e0 = (p2, p0), e1 = (p0, p1), e2 = (p1, p2); a new vertex is appended
+    for each edge the first time it is met in face order, and the children
+    are (p0, e1, e0), (e1, p1, e2), (e2, p2, e0), (e1, e2, e0).
+
+    Args:
+        flat: (N, 3) float32 vertices (not yet projected to the sphere)
+        faces: (M, 3) triangle vertex indices
+
+    Returns:
+        Tuple of (vertices (N + E, 3), faces (4M, 3))
+    """
+    num_points = len(flat)
+    p0, p1, p2 = faces.T
+    starts = np.stack([p2, p0, p1], axis=1).ravel()
+    ends = np.stack([p0, p1, p2], axis=1).ravel()
+
+    # Group equal undirected edges; a stable sort keeps each group's first
+    # occurrence (in face order) at its front
+    keys = np.minimum(starts, ends) * num_points + np.maximum(starts, ends)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    is_first = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+    first_occurrence = order[is_first]
+
+    # Number new vertices by first occurrence
+    rank = np.empty(len(first_occurrence), dtype=np.int64)
+    rank[np.argsort(first_occurrence)] = np.arange(len(first_occurrence))
+    edge_vertex = np.empty(len(keys), dtype=np.int64)
+    edge_vertex[order] = num_points + rank[np.cumsum(is_first) - 1]
+
+    new_edges = np.sort(first_occurrence)
+    midpoints = (
+        (flat[starts[new_edges]].astype(np.float64) + flat[ends[new_edges]].astype(np.float64)) / 2
+    ).astype(np.float32)
+
+    e0, e1, e2 = edge_vertex.reshape(-1, 3).T
+    children = np.stack(
+        [
+            np.stack([p0, e1, e0], axis=1),
+            np.stack([e1, p1, e2], axis=1),
+            np.stack([e2, p2, e0], axis=1),
+            np.stack([e1, e2, e0], axis=1),
+        ],
+        axis=1,
+    ).reshape(-1, 3)
+
+    return np.vstack([flat, midpoints]), children
+
+
+def project_to_sphere(flat: NDArray[np.float32], radius: float) -> NDArray[np.float64]:
+    """Scale subdivided icosahedron vertices onto a sphere as pyvista does."""
+    dist = np.linalg.norm(flat, axis=1, keepdims=True)
+    return (flat * (radius / dist)).astype(np.float64)
+
+
+def lat_lon(points: NDArray) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Latitude and longitude in degrees of points on (or scaled from) a sphere."""
+    x, y, z = np.asarray(points, dtype=np.float64).T
+    lat = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lon = np.degrees(np.arctan2(y, x))
+    return lat, lon
+
+
+def _read_only(array: NDArray) -> NDArray:
+    """Mark an array read-only and return it."""
+    array.flags.writeable = False
+    return array
+
+
+def icosphere_num_points(recursion: int) -> int:
+    """Number of vertices of an icosphere at a given recursion level.
+
+    Args:
+        recursion: Subdivision level
+
+    Returns:
+        Vertex count (10 * 4**recursion + 2)
+    """
+    return 10 * 4**recursion + 2
+
+
+def build_vertex_adjacency(
+    faces: NDArray[np.int64],
+    num_points: int,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Build CSR vertex adjacency from triangle faces.
+
+    Args:
+        faces: (M, 3) triangle vertex indices
+        num_points: Number of vertices
+
+    Returns:
+        Tuple of (indptr (num_points + 1,), indices) with each vertex's
+        neighbors sorted ascending and without duplicates
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    a, b, c = faces.T
+    sources = np.concatenate([a, b, b, c, c, a])
+    targets = np.concatenate([b, a, c, b, a, c])
+
+    # Sorting on source * N + target groups rows; shared edges then repeat
+    keys = sources * num_points + targets
+    keys.sort()
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    indices = keys % num_points
+    counts = np.bincount(keys // num_points, minlength=num_points)
+
+    indptr = np.zeros(num_points + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr, indices
+
+
+def adjacency_edges(
+    indptr: NDArray[np.int64],
+    indices: NDArray[np.int64],
+    rows: NDArray[np.int64] | None = None,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Directed edges of a CSR adjacency, optionally restricted to some rows.
+
+    Args:
+        indptr: CSR row pointers
+        indices: CSR column indices
+        rows: Source vertices to include (all vertices if None)
+
+    Returns:
+        Tuple of (sources, targets), grouped by source in ``rows`` order
+    """
+    if rows is None:
+        sources = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        return sources, indices
+
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    sources = np.repeat(rows, counts)
+
+    # Position of each edge within its row, shifted to the row's start
+    row_offsets = np.cumsum(counts) - counts
+    positions = np.arange(len(sources)) + np.repeat(starts - row_offsets, counts)
+    return sources, indices[positions]
@@ -1,12 +1,40 @@
 """World model representing a generated planetary world."""
 
-from dataclasses import dataclass
-from typing import Any
+import copy
+import warnings
+import zlib
+from dataclasses import dataclass, field, replace
+from itertools import chain
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 import numpy as np
 from numpy.typing import NDArray
-from pyvista import Icosphere, PolyData
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from scipy.spatial import cKDTree
+
+from lathe.models.layers import LayerRecord, coerce_layer, layer_digest
+from lathe.models.topology import (
+    ICOSAHEDRON_FACES,
+    ICOSAHEDRON_POINTS,
+    SphereTopology,
+    get_topology,
+    icosphere_num_points,
+    lat_lon,
+    project_to_sphere,
+    subdivide_triangles,
+)
+
+if TYPE_CHECKING:
+    from pyvista import PolyData
+
+
+# Edge length of an icosahedron with unit circumradius
+ICOSAHEDRON_EDGE = 1.0514622242382672
+
+# Reductions supported by World.neighborhood_reduce()
+NEIGHBORHOOD_REDUCTIONS = ("mean", "var", "max", "min")
 
 
 @dataclass
@@ -24,34 +52,159 @@ class WorldParameters:
     ztilt: float = 23.4  # Axial tilt in degrees
 
 
+@dataclass
+class WorldPatch:
+    """High-resolution regional sub-mesh of a world.
+
+    Patch vertices are a subset of the vertices an icosphere of the patch's
+    recursion would have, so layers sampled on a patch are coherent with the
+    global world.
+    """
+
+    name: str
+    lat_range: tuple[float, float]  # Degrees (south, north)
+    lon_range: tuple[float, float]  # Degrees (west, east)
+    recursion: int
+    points: NDArray[np.float64]  # (N, 3) vertex positions
+    faces: NDArray[np.int64]  # (M, 3) triangle indices
+    layers: dict[str, NDArray[np.float64]] = field(default_factory=dict)
+
+    @property
+    def num_points(self) -> int:
+        """Number of patch points."""
+        return len(self.points)
+
+    @property
+    def num_faces(self) -> int:
+        """Number of patch faces."""
+        return len(self.faces)
+
+    def add_data_layer(
+        self,
+        name: str,
+        data: NDArray,
+        overwrite: bool = False,
+    ) -> None:
+        """Add a data layer to the patch.
+
+        Args:
+            name: Name of the data layer
+            data: Array of values (must match number of patch points); cast
+                to the layer's dtype (see lathe.models.layers)
+            overwrite: Whether to overwrite existing layer
+
+        Raises:
+            ValueError: If data length doesn't match patch points or layer exists
+        """
+        if len(data) != self.num_points:
+            msg = f"Data length {len(data)} doesn't match patch points {self.num_points}"
+            raise ValueError(msg)
+
+        if name in self.layers and not overwrite:
+            msg = f"Data layer '{name}' already exists. Set overwrite=True to replace."
+            raise ValueError(msg)
+
+        self.layers[name] = coerce_layer(name, data)
+
+    def get_data_layer(self, name: str) -> NDArray | None:
+        """Get a data layer from the patch."""
+        return self.layers.get(name)
+
+    def to_polydata(self) -> "PolyData":
+        """Build a PyVista mesh of the patch with its layers as point data."""
+        from pyvista import PolyData
+
+        cells = np.hstack([np.full((self.num_faces, 1), 3), self.faces]).ravel()
+        mesh = PolyData(self.points, cells)
+        for name, data in self.layers.items():
+            mesh.point_data[name] = data
+        return mesh
+
+
 class World:
     """Represents a generated planetary world.
 
     The World object contains:
-    - A 3D mesh (PyVista Icosphere)
-    - Data layers stored as point_data on the mesh
+    - Point positions over a shared icosphere topology (faces, adjacency)
+    - Data layers as a dict of per-point NumPy arrays
     - Generation parameters and metadata
+
+    Worlds are plain arrays and never need VTK; to_polydata() builds a
+    PyVista mesh for visualization and export on demand.
+
+    fork() makes a copy-on-write variant of a world: layers and points are
+    shared with the original until either side replaces them.
     """
 
-    def __init__(self, params: WorldParameters | None = None, world_id: UUID | None = None):
+    def __init__(
+        self,
+        params: WorldParameters | None = None,
+        world_id: UUID | None = None,
+        topology: SphereTopology | None = None,
+    ):
         """Initialize a new world.
 
         Args:
             params: World generation parameters
             world_id: Optional UUID for the world (generated if not provided)
+            topology: Sphere topology to build on (default: the shared one
+                from get_topology() for the params' recursion and radius)
+
+        Raises:
+            ValueError: If the topology doesn't match the params
         """
         self.id = world_id or uuid4()
         self.params = params or WorldParameters()
 
-        # Initialize mesh
-        self.mesh: PolyData = Icosphere(
-            radius=self.params.radius,
-            nsub=self.params.recursion,
-            center=(0.0, 0.0, 0.0),
-        )
+        # Sphere topology is shared with every world of the same size; the
+        # world owns only its (deformable) points and layers
+        if topology is None:
+            topology = get_topology(self.params.recursion, self.params.radius)
+        elif (topology.recursion, topology.radius) != (self.params.recursion, self.params.radius):
+            msg = (
+                f"Topology (recursion {topology.recursion}, radius {topology.radius}) doesn't match "
+                f"world (recursion {self.params.recursion}, radius {self.params.radius})"
+            )
+            raise ValueError(msg)
+        self.topology: SphereTopology = topology
+        # Read-only points are shared (see shared_points()) and copied
+        # before the next geometry change; a new world starts on the
+        # topology's own points
+        self.points: NDArray[np.float64] = self.topology.points
+        self.layers: dict[str, NDArray] = {}
+
+        # Version, producer and content hash of each layer; the clock counts
+        # layer writes so versions order all writes to this world
+        self.layer_records: dict[str, LayerRecord] = {}
+        self.layer_clock: int = 0
+
+        # Parameters each plugin last ran with (as given, so they may hold
+        # worlds or arrays; metadata["plugin_runs"] has their JSON form)
+        self.plugin_params: dict[str, dict[str, Any]] = {}
+
+        # Input layers (and their producers) each plugin saw on its last run,
+        # kept so it can rerun after later plugins overwrote them
+        self.plugin_inputs: dict[str, dict[str, tuple[NDArray, str | None]]] = {}
+        # ...and the points it started from (None for the undeformed sphere)
+        self.plugin_points: dict[str, NDArray[np.float64] | None] = {}
+
+        # Last result of each analysis plugin (see WorldGenerationEngine)
+        self.analysis_results: dict[str, Any] = {}
+
+        # Undeformed sphere points (shared, read-only)
+        self._original_points: NDArray[np.float64] = self.topology.points
+
+        # PyVista view of the world, built by to_polydata()
+        self._polydata: "PolyData | None" = None
 
-        # Store original points for potential reset
-        self._original_points: NDArray[np.float64] = self.mesh.points.copy()
+        # KD-tree over the current points, built by spatial_index()
+        self._spatial_index: cKDTree | None = None
+
+        # Reused per-point buffer for update_geometry()
+        self._scale_buffer: NDArray[np.float64] | None = None
+
+        # Regional high-resolution sub-meshes
+        self.patches: dict[str, WorldPatch] = {}
 
         # Metadata
         self.metadata: dict[str, Any] = {
@@ -61,28 +214,50 @@ class World:
             "generation_time_seconds": 0.0,
         }
 
+    @property
+    def faces(self) -> NDArray[np.int64]:
+        """(M, 3) triangle vertex indices (shared, read-only)."""
+        return self.topology.faces
+
     @property
     def num_points(self) -> int:
         """Number of mesh points."""
-        return len(self.mesh.points)
+        return len(self.points)
 
     @property
     def num_faces(self) -> int:
         """Number of mesh faces."""
-        return self.mesh.n_cells
+        return self.topology.num_faces
+
+    @property
+    def mesh(self) -> "PolyData":
+        """Deprecated: use self.points, self.layers or to_polydata()."""
+        warnings.warn(
+            "World.mesh is deprecated; use World.points, World.layers or World.to_polydata()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.to_polydata()
 
     def add_data_layer(
         self,
         name: str,
-        data: NDArray[np.float64],
+        data: NDArray,
         overwrite: bool = False,
+        producer: str | None = None,
     ) -> None:
-        """Add a data layer to the mesh.
+        """Add a per-point data layer.
+
+        Layers are treated as immutable once added: replace them through
+        this method rather than writing into the arrays, so their versions
+        and hashes stay correct.
 
         Args:
             name: Name of the data layer
-            data: Array of values (must match number of mesh points)
+            data: Array of values (must match number of mesh points); cast
+                to the layer's dtype (see lathe.models.layers)
             overwrite: Whether to overwrite existing layer
+            producer: Name of the plugin writing the layer
 
         Raises:
             ValueError: If data length doesn't match mesh points or layer exists
@@ -91,14 +266,16 @@ class World:
             msg = f"Data length {len(data)} doesn't match mesh points {self.num_points}"
             raise ValueError(msg)
 
-        if name in self.mesh.point_data and not overwrite:
+        if name in self.layers and not overwrite:
             msg = f"Data layer '{name}' already exists. Set overwrite=True to replace."
             raise ValueError(msg)
 
-        self.mesh.point_data[name] = data
+        self.layers[name] = coerce_layer(name, data)
+        self.layer_clock += 1
+        self.layer_records[name] = LayerRecord(version=self.layer_clock, producer=producer)
 
-    def get_data_layer(self, name: str) -> NDArray[np.float64] | None:
-        """Get a data layer from the mesh.
+    def get_data_layer(self, name: str) -> NDArray | None:
+        """Get a data layer.
 
         Args:
             name: Name of the data layer
@@ -106,7 +283,7 @@ class World:
         Returns:
             Data array or None if not found
         """
-        return self.mesh.point_data.get(name)
+        return self.layers.get(name)
 
     def has_data_layer(self, name: str) -> bool:
         """Check if a data layer exists.
@@ -117,7 +294,7 @@ class World:
         Returns:
             True if layer exists
         """
-        return name in self.mesh.point_data
+        return name in self.layers
 
     def list_data_layers(self) -> list[str]:
         """List all available data layers.
@@ -125,11 +302,133 @@ class World:
         Returns:
             List of data layer names
         """
-        return list(self.mesh.point_data.keys())
+        return list(self.layers.keys())
+
+    def layer_digest(self, name: str) -> str | None:
+        """Content hash of a data layer, cached until the layer is replaced.
+
+        Args:
+            name: Name of the data layer
+
+        Returns:
+            Hex digest or None if the layer doesn't exist
+        """
+        record = self.layer_records.get(name)
+        if record is None:
+            return None
+        if record.digest is None:
+            record.digest = layer_digest(self.layers[name])
+        return record.digest
+
+    def layers_changed_since(self, version: int) -> list[str]:
+        """Names of layers written after a given layer clock value.
+
+        Args:
+            version: Earlier value of self.layer_clock
+
+        Returns:
+            Layer names in write order
+        """
+        changed = [name for name, record in self.layer_records.items() if record.version > version]
+        return sorted(changed, key=lambda name: self.layer_records[name].version)
+
+    def fork(self, name: str | None = None) -> "World":
+        """Copy-on-write copy of the world, e.g. for parameter sweeps.
+
+        The fork shares every layer array, patch array and the points with
+        this world and copies only its bookkeeping (patches get their own
+        WorldPatch and layers dict), so it costs almost no memory up front.
+        Layers are replaced, never written in place, so a layer diverges only
+        when a plugin writes it on either side, and the points are copied on
+        the first geometry change. Plugin run records and input snapshots are
+        carried over, so WorldGenerationEngine.update_world() can rerun just
+        the plugins whose parameters differ.
+
+        Note that this world's current arrays become read-only as well, and
+        stay so after the fork is gone: an in-place write on either side
+        would otherwise show through on the other. The World and WorldPatch
+        methods never write shared arrays in place; code that does must copy
+        what get_data_layer() returns first.
+
+        Args:
+            name: Name of the fork (default: this world's name)
+
+        Returns:
+            New world with its own id
+        """
+        params = replace(self.params, name=name) if name is not None else replace(self.params)
+        # Built on this world's topology, so nothing is looked up or computed
+        # and the fork allocates no points of its own
+        fork = World(params, topology=self.topology)
+        fork.points = self.shared_points()
+        fork._spatial_index = self._spatial_index
+
+        self.layers = {layer: _read_only_view(data) for layer, data in self.layers.items()}
+        fork.layers = dict(self.layers)
+        fork.layer_records = {layer: replace(record) for layer, record in self.layer_records.items()}
+        fork.layer_clock = self.layer_clock
+
+        fork.plugin_params = dict(self.plugin_params)
+        fork.plugin_inputs = {plugin: dict(inputs) for plugin, inputs in self.plugin_inputs.items()}
+        fork.plugin_points = dict(self.plugin_points)
+        fork.analysis_results = dict(self.analysis_results)
+        for patch in self.patches.values():
+            patch.points = _read_only_view(patch.points)
+            patch.layers = {layer: _read_only_view(data) for layer, data in patch.layers.items()}
+        fork.patches = {
+            patch_name: replace(patch, layers=dict(patch.layers)) for patch_name, patch in self.patches.items()
+        }
+
+        fork.metadata = copy.deepcopy(self.metadata)
+        fork.metadata["forked_from"] = str(self.id)
+        return fork
+
+    def shared_points(self) -> NDArray[np.float64]:
+        """Current points as a read-only array safe to keep or share.
+
+        self.points becomes the same read-only array, so the next geometry
+        change copies it instead of writing through it.
+
+        Returns:
+            (N, 3) read-only point positions
+        """
+        if self.points.flags.writeable:
+            self.points = _read_only_view(self.points)
+        return self.points
+
+    def set_points(self, points: NDArray[np.float64]) -> None:
+        """Replace the point positions.
+
+        The array is shared, not copied, and never written through (the
+        next geometry change copies it).
+
+        Args:
+            points: (N, 3) point positions
+
+        Raises:
+            ValueError: If the shape doesn't match the mesh points
+        """
+        if points.shape != self.points.shape:
+            msg = f"Points shape {points.shape} doesn't match mesh points {self.points.shape}"
+            raise ValueError(msg)
+
+        self.points = _read_only_view(np.asarray(points, dtype=np.float64))
+        self.points_modified()
+
+    def _own_points(self, copy: bool = True) -> None:
+        """Make shared (read-only) points private before writing to them.
+
+        Args:
+            copy: Keep the current values; False allocates uninitialized
+                points for callers that overwrite all of them
+        """
+        if not self.points.flags.writeable:
+            self.points = self.points.copy() if copy else np.empty_like(self.points)
 
     def reset_mesh_geometry(self) -> None:
         """Reset mesh geometry to original sphere."""
-        self.mesh.points[:] = self._original_points.copy()
+        self.points = self._original_points
+        self.points_modified()
 
     def warp_by_elevation(self, layer_name: str = "elevation", factor: float | None = None) -> None:
         """Warp mesh geometry based on elevation data.
@@ -144,15 +443,380 @@ class World:
 
         factor = factor if factor is not None else -self.params.zscale
 
-        self.mesh.warp_by_scalar(
-            scalars=layer_name,
-            factor=factor,
-            inplace=True,
-        )
+        # Displace along the current point normals, as VTK's scalar warp does
+        if not self.has_data_layer("Normals"):
+            self.compute_normals()
+        normals = self.get_data_layer("Normals")
+        self._own_points()
+        self.points += (factor * self.get_data_layer(layer_name))[:, None] * normals
+        self.points_modified()
+
+    def points_modified(self) -> None:
+        """Drop geometry-derived caches after the points have changed.
+
+        The geometry methods call this themselves; code writing into
+        self.points directly must call it afterwards (or use set_points()).
+        """
+        self._spatial_index = None
+
+    def update_geometry(
+        self,
+        layer_name: str = "elevation",
+        factor: float | None = None,
+        scalars_layer: str = "elevation_scalars",
+        normals: NDArray[np.float64] | None = None,
+    ) -> None:
+        """Rebuild vertex positions from the original sphere in one pass.
+
+        Equivalent to resetting the mesh, scaling each point by its elevation
+        scalar and warping it along the radial direction by elevation, but
+        writes straight into the world's points through a single reused
+        per-point buffer instead of separate scale and warp passes. Normals
+        are recomputed for the final geometry unless supplied.
+
+        Args:
+            layer_name: Name of elevation data layer
+            factor: Warping factor (defaults to -self.params.zscale)
+            scalars_layer: Radial scale layer (1.0 everywhere if absent)
+            normals: Optional (N, 3) unit normals of the final geometry (e.g.
+                from analytic noise gradients); skips the mesh normals pass
+
+        Raises:
+            ValueError: If the elevation layer doesn't exist
+        """
+        elevation = self.get_data_layer(layer_name)
+        if elevation is None:
+            msg = f"Data layer '{layer_name}' not found"
+            raise ValueError(msg)
+
+        factor = factor if factor is not None else -self.params.zscale
+
+        if self._scale_buffer is None or len(self._scale_buffer) != self.num_points:
+            self._scale_buffer = np.empty(self.num_points, dtype=np.float64)
+        scale = self._scale_buffer
+
+        # Original points lie on the sphere, so the radial unit vector is
+        # point / radius: new = point * (scalar + factor * elevation / radius)
+        np.multiply(elevation, factor / self.params.radius, out=scale)
+        scalars = self.get_data_layer(scalars_layer)
+        if scalars is not None:
+            scale += scalars
+        else:
+            scale += 1.0
+
+        self._own_points(copy=False)
+        np.multiply(self._original_points, scale[:, None], out=self.points)
+        self.points_modified()
+
+        if normals is not None:
+            self.add_data_layer("Normals", np.asarray(normals, dtype=np.float32), overwrite=True)
+        else:
+            self.compute_normals()
 
     def compute_normals(self) -> None:
-        """Compute mesh normals."""
-        self.mesh.compute_normals(inplace=True)
+        """Compute point normals into the "Normals" layer.
+
+        Each point's normal is the normalized sum of the unit normals of its
+        faces, as VTK computes them (agreeing to float32 round-off).
+        Icosphere faces are consistently wound, so no reordering is needed.
+        """
+        faces = self.faces
+        p0, p1, p2 = (self.points[faces[:, i]] for i in range(3))
+        face_normals = np.cross(p1 - p0, p2 - p0)
+        face_normals /= np.linalg.norm(face_normals, axis=1, keepdims=True)
+
+        corners = faces.ravel()
+        normals = np.empty((self.num_points, 3), dtype=np.float64)
+        for axis in range(3):
+            normals[:, axis] = np.bincount(
+                corners, weights=np.repeat(face_normals[:, axis], 3), minlength=self.num_points
+            )
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+        self.add_data_layer("Normals", normals.astype(np.float32), overwrite=True)
+
+    def to_polydata(self) -> "PolyData":
+        """PyVista mesh of the world for visualization and export.
+
+        Built on first call and reused afterwards. Points and layers are
+        shared with the world rather than copied, and each call re-syncs
+        added, replaced or removed layers and flags the geometry as modified,
+        so call it again after changing the world.
+
+        Returns:
+            PolyData with layers as point data and "Normals" as active normals
+        """
+        mesh = self._polydata
+        if mesh is None:
+            mesh = self._polydata = self.topology.new_mesh(self.points)
+        elif not np.shares_memory(mesh.points, self.points):
+            mesh.points = self.points
+
+        point_data = mesh.point_data
+        for name in set(point_data.keys()) - set(self.layers):
+            point_data.remove(name)
+        for name, data in self.layers.items():
+            if name not in point_data or not np.shares_memory(point_data[name], data):
+                point_data[name] = data
+        if "Normals" in self.layers:
+            mesh.GetPointData().SetActiveNormals("Normals")
+
+        mesh.GetPoints().Modified()
+        mesh.Modified()
+        return mesh
+
+    def subdivision_parents(self, from_recursion: int) -> list[NDArray[np.int64]]:
+        """Map vertices added by subdivision back to the edges they bisect.
+
+        Icosphere vertex order is hierarchical: the first vertices of a level-k
+        sphere are exactly the vertices of the level k-1 sphere, followed by
+        one new vertex per bisected edge. For each subdivision level above
+        ``from_recursion``, this returns the two parent vertex indices of every
+        vertex that level introduces.
+
+        Args:
+            from_recursion: Recursion level of the coarser sphere
+
+        Returns:
+            One (M, 2) array per level from_recursion+1 .. params.recursion.
+            Row r of level l's array holds the parents of vertex
+            ``num_points(l - 1) + r``; parents always have lower indices.
+
+        Raises:
+            ValueError: If from_recursion is not below this world's recursion
+        """
+        if not 0 <= from_recursion < self.params.recursion:
+            msg = f"from_recursion must be in [0, {self.params.recursion}), got {from_recursion}"
+            raise ValueError(msg)
+
+        levels = []
+        for level in range(from_recursion + 1, self.params.recursion + 1):
+            faces = get_topology(level, self.params.radius).faces
+            num_previous = icosphere_num_points(level - 1)
+
+            # New vertices are adjacent to exactly two old ones: their edge endpoints
+            edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+            edges = np.concatenate([edges, edges[:, ::-1]])
+            edges = edges[(edges[:, 0] >= num_previous) & (edges[:, 1] < num_previous)]
+            keys = np.unique(edges[:, 0] * num_previous + edges[:, 1])
+
+            levels.append((keys % num_previous).reshape(-1, 2))
+
+        return levels
+
+    def create_patch(
+        self,
+        name: str,
+        lat_range: tuple[float, float],
+        lon_range: tuple[float, float],
+        recursion: int,
+    ) -> WorldPatch:
+        """Build a locally subdivided mesh covering a lat/lon region.
+
+        Only faces near the region are subdivided, so cost scales with the
+        region's area rather than with a whole sphere at that recursion. The
+        patch is registered on the world (replacing any patch of that name)
+        but has no data layers yet.
+
+        Args:
+            name: Patch name
+            lat_range: (south, north) latitude bounds in degrees
+            lon_range: (west, east) longitude bounds in degrees, west < east
+            recursion: Subdivision level of the patch
+
+        Returns:
+            The new patch
+
+        Raises:
+            ValueError: If the bounds are invalid or no faces fall inside them
+        """
+        points, faces = build_patch_geometry(self.params.radius, lat_range, lon_range, recursion)
+        patch = WorldPatch(
+            name=name,
+            lat_range=(float(lat_range[0]), float(lat_range[1])),
+            lon_range=(float(lon_range[0]), float(lon_range[1])),
+            recursion=recursion,
+            points=points,
+            faces=faces,
+        )
+        self.patches[name] = patch
+        return patch
+
+    def get_patch(self, name: str) -> WorldPatch | None:
+        """Get a regional patch by name."""
+        return self.patches.get(name)
+
+    def list_patches(self) -> list[str]:
+        """List names of all regional patches."""
+        return list(self.patches.keys())
+
+    def random_generator(self, stream: str) -> np.random.Generator:
+        """Create an independent random generator for one plugin run.
+
+        The generator is derived from ``params.seed`` and the stream name, so
+        each plugin gets its own deterministic sequence and concurrent
+        generations never share global RNG state. A seed of 0 draws fresh
+        entropy from the OS.
+
+        Args:
+            stream: Name identifying the consumer (e.g. the plugin name)
+
+        Returns:
+            Seeded numpy Generator
+        """
+        if self.params.seed == 0:
+            return np.random.default_rng()
+
+        seed_seq = np.random.SeedSequence(
+            [self.params.seed & 0xFFFFFFFFFFFFFFFF, zlib.crc32(stream.encode())]
+        )
+        return np.random.default_rng(seed_seq)
+
+    def vertex_adjacency(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Mesh vertex adjacency in compressed sparse row form.
+
+        The neighbors of vertex ``i`` are ``indices[indptr[i]:indptr[i + 1]]``,
+        sorted ascending. Shared through the world's topology.
+
+        Returns:
+            Tuple of (indptr (N + 1,), indices (2E,)) for E undirected edges
+        """
+        return self.topology.vertex_adjacency()
+
+    def edge_length_graph(self) -> csr_matrix:
+        """Sparse vertex graph weighted by edge length on the original sphere.
+
+        Returns:
+            (N, N) CSR matrix sharing the structure of vertex_adjacency()
+        """
+        return self.topology.edge_length_graph()
+
+    def k_ring(self, k: int) -> csr_matrix:
+        """Neighborhoods of every point within k mesh edges.
+
+        Unlike get_neighbors(), neighborhoods are topological, so they cover
+        the same share of the mesh at any resolution. Shared through the
+        world's topology.
+
+        Args:
+            k: Number of edges (0 gives each point alone)
+
+        Returns:
+            (N, N) CSR matrix of ones with sorted columns; the neighborhood
+            of point ``i`` is ``indices[indptr[i]:indptr[i + 1]]``, including i
+        """
+        return self.topology.k_ring(k)
+
+    def neighborhood_reduce(
+        self,
+        layer: str | NDArray,
+        k: int = 1,
+        reduction: str = "mean",
+    ) -> NDArray:
+        """Reduce a layer over the k-ring neighborhood of every point.
+
+        Sums (and so means and variances) are sparse matrix products with
+        k_ring(k); max and min reduce the gathered neighbor values per row.
+
+        Args:
+            layer: Layer name or (N,) / (N, C) array of per-point values
+            k: Neighborhood size in mesh edges
+            reduction: One of NEIGHBORHOOD_REDUCTIONS
+
+        Returns:
+            Reduced values, shaped like the layer (float64 for mean and var)
+
+        Raises:
+            ValueError: If the layer doesn't exist or the reduction is unknown
+        """
+        if reduction not in NEIGHBORHOOD_REDUCTIONS:
+            msg = f"Unknown reduction '{reduction}'; expected one of {NEIGHBORHOOD_REDUCTIONS}"
+            raise ValueError(msg)
+
+        values = self.get_data_layer(layer) if isinstance(layer, str) else np.asarray(layer)
+        if values is None:
+            msg = f"Data layer '{layer}' not found"
+            raise ValueError(msg)
+
+        ring = self.k_ring(k)
+        if reduction == "max":
+            return np.maximum.reduceat(values[ring.indices], ring.indptr[:-1])
+        if reduction == "min":
+            return np.minimum.reduceat(values[ring.indices], ring.indptr[:-1])
+
+        counts = np.diff(ring.indptr).reshape((-1,) + (1,) * (values.ndim - 1))
+        values = values.astype(np.float64, copy=False)
+        mean = (ring @ values) / counts
+        if reduction == "mean":
+            return mean
+
+        # Var = E[x^2] - E[x]^2, shifted by the global mean for precision
+        center = values.mean(axis=0)
+        shifted = values - center
+        shifted_mean = mean - center
+        return np.maximum((ring @ (shifted * shifted)) / counts - shifted_mean * shifted_mean, 0.0)
+
+    def point_areas(self) -> NDArray[np.float64]:
+        """Surface area represented by each point on the original sphere.
+
+        Each triangle contributes a third of its area to each of its corners,
+        so the areas sum to the surface area of the mesh.
+
+        Returns:
+            Area in square meters per point
+        """
+        return self.topology.point_areas()
+
+    def lat_lon(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Latitude and longitude of each point on the original sphere.
+
+        Returns:
+            Tuple of (lat, lon) in degrees
+        """
+        return self.topology.lat_lon()
+
+    def geodesic_distance(
+        self,
+        sources: NDArray[np.int64],
+        max_distance: float = np.inf,
+    ) -> NDArray[np.float64]:
+        """Distance along mesh edges from every point to the nearest source.
+
+        Runs a single multi-source Dijkstra over edge_length_graph(), so the
+        cost is O(N log N) regardless of the number of sources.
+
+        Args:
+            sources: Source point indices
+            max_distance: Stop expanding beyond this distance in meters;
+                points further away get inf
+
+        Returns:
+            Distance in meters per point (inf if unreachable or beyond
+            max_distance)
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        if len(sources) == 0:
+            return np.full(self.num_points, np.inf)
+
+        return dijkstra(
+            self.edge_length_graph(),
+            directed=True,
+            indices=sources,
+            min_only=True,
+            limit=max_distance,
+        )
+
+    def spatial_index(self) -> cKDTree:
+        """KD-tree over the current points.
+
+        Built on first use and reused until the points change.
+
+        Returns:
+            cKDTree whose data indices are point indices
+        """
+        if self._spatial_index is None:
+            self._spatial_index = cKDTree(self.points)
+        return self._spatial_index
 
     def get_neighbors(
         self,
@@ -163,14 +827,41 @@ class World:
 
         Args:
             point_index: Index of the center point
-            radius: Search radius in meters
+            radius: Search radius in meters (straight-line distance)
 
         Returns:
-            Array of point indices within radius
+            Sorted array of point indices within radius, including the point
         """
-        center = self.mesh.points[point_index]
-        distances = np.linalg.norm(self.mesh.points - center, axis=1)
-        return np.where(distances <= radius)[0]
+        neighbors = self.spatial_index().query_ball_point(
+            self.points[point_index], radius, return_sorted=True
+        )
+        return np.asarray(neighbors, dtype=np.int64)
+
+    def get_neighbors_many(
+        self,
+        point_indices: NDArray[np.int64],
+        radius: float,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Get the points within a given radius of each of several points.
+
+        Args:
+            point_indices: (K,) indices of the center points
+            radius: Search radius in meters (straight-line distance)
+
+        Returns:
+            Tuple of (indptr (K + 1,), indices) in CSR layout: the sorted
+            neighbors of point_indices[i] are indices[indptr[i]:indptr[i + 1]]
+        """
+        point_indices = np.asarray(point_indices, dtype=np.int64)
+        neighbors = self.spatial_index().query_ball_point(
+            self.points[point_indices], radius, return_sorted=True
+        )
+
+        counts = np.fromiter(map(len, neighbors), dtype=np.int64, count=len(point_indices))
+        indptr = np.zeros(len(point_indices) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.fromiter(chain.from_iterable(neighbors), dtype=np.int64, count=indptr[-1])
+        return indptr, indices
 
     def to_dict(self) -> dict[str, Any]:
         """Convert world to dictionary representation.
@@ -195,4 +886,104 @@ class World:
             "num_points": self.num_points,
             "num_faces": self.num_faces,
             "data_layers": self.list_data_layers(),
+            "patches": self.list_patches(),
         }
+
+
+def _read_only_view(array: NDArray) -> NDArray:
+    """Read-only view of an array (the array itself stays writable).
+
+    Arrays that are already read-only are returned as they are.
+    """
+    if not array.flags.writeable:
+        return array
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def build_patch_geometry(
+    radius: float,
+    lat_range: tuple[float, float],
+    lon_range: tuple[float, float],
+    recursion: int,
+) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """Subdivide the icosahedron only where it overlaps a lat/lon region.
+
+    Subdivision follows the same flat-space midpoint scheme (in float32) as
+    the global icosphere (see build_icosphere()), and points are projected to the sphere once
+    at the end, so every patch vertex coincides with a vertex of the global
+    icosphere at the same recursion.
+
+    Args:
+        radius: Sphere radius in meters
+        lat_range: (south, north) latitude bounds in degrees
+        lon_range: (west, east) longitude bounds in degrees, west < east
+        recursion: Subdivision level
+
+    Returns:
+        Tuple of (points (N, 3), faces (M, 3))
+
+    Raises:
+        ValueError: If the bounds are invalid or no faces fall inside them
+    """
+    south, north = lat_range
+    west, east = lon_range
+    if not -90.0 <= south < north <= 90.0:
+        msg = f"Invalid latitude range {lat_range}"
+        raise ValueError(msg)
+    if not -180.0 <= west < east <= 180.0:
+        msg = f"Invalid longitude range {lon_range}"
+        raise ValueError(msg)
+    if recursion < 0:
+        msg = f"recursion must be non-negative, got {recursion}"
+        raise ValueError(msg)
+
+    flat, faces = ICOSAHEDRON_POINTS, ICOSAHEDRON_FACES
+    for _ in range(recursion):
+        faces = faces[_faces_near_region(flat, faces, lat_range, lon_range)]
+        flat, faces = subdivide_triangles(flat, faces)
+
+    # Keep faces touching the region, then drop unused vertices
+    lat, lon = lat_lon(flat)
+    inside = (lat >= south) & (lat <= north) & (lon >= west) & (lon <= east)
+    faces = faces[inside[faces].any(axis=1)]
+    if len(faces) == 0:
+        msg = "Region contains no mesh faces at this recursion"
+        raise ValueError(msg)
+
+    used, faces = np.unique(faces, return_inverse=True)
+    faces = faces.reshape(-1, 3)
+    flat = flat[used]
+
+    return project_to_sphere(flat, radius), faces
+
+
+def _faces_near_region(
+    flat: NDArray[np.float32],
+    faces: NDArray[np.int64],
+    lat_range: tuple[float, float],
+    lon_range: tuple[float, float],
+) -> NDArray[np.bool_]:
+    """Conservatively select faces whose descendants may touch the region.
+
+    A face is kept if the great-circle distance from its centroid to the
+    nearest (lat/lon clamped) point of the region is within twice the face's
+    angular radius.
+    """
+    unit = flat / np.linalg.norm(flat, axis=1, keepdims=True)
+    corners = unit[faces]
+    centroid = corners.mean(axis=1)
+    centroid /= np.linalg.norm(centroid, axis=1, keepdims=True)
+    face_radius = np.arccos(np.clip(np.einsum("fkd,fd->fk", corners, centroid), -1.0, 1.0)).max(axis=1)
+
+    lat, lon = lat_lon(centroid)
+    lat_c = np.radians(np.clip(lat, *lat_range))
+    lon_c = np.radians(np.clip(lon, *lon_range))
+    nearest = np.stack(
+        [np.cos(lat_c) * np.cos(lon_c), np.cos(lat_c) * np.sin(lon_c), np.sin(lat_c)],
+        axis=1,
+    )
+    distance = np.arccos(np.clip(np.einsum("fd,fd->f", centroid, nearest), -1.0, 1.0))
+
+    return distance <= 2.0 * face_radius
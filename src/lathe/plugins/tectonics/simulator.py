@@ -1,15 +1,50 @@
 """Tectonic plate simulation plugin with realistic geological processes."""
 
 import asyncio
+import math
+from pathlib import Path
 from typing import Any, Callable
 
 import numpy as np
 from numpy.typing import NDArray
-from pyvista import LookupTable
-from scipy.spatial import KDTree
+from scipy.spatial import cKDTree
 
-from lathe.models.world import World
+from lathe.models.layers import BOUNDARY_TYPE_NAMES, layer_spec
+from lathe.models.topology import adjacency_edges
+from lathe.models.world import ICOSAHEDRON_EDGE, World
 from lathe.plugins.base import PluginMetadata, PluginResult, SimulationPlugin
+from lathe.storage.timelapse import TimelapseWriter
+
+# Boundary type codes stored in the boundary_type layer (see BOUNDARY_TYPE_NAMES)
+BOUNDARY_NONE = 0
+BOUNDARY_CONVERGENT = 1
+BOUNDARY_DIVERGENT = 2
+BOUNDARY_TRANSFORM = 3
+
+# Default uplift falloff width, in mesh edges; a fixed width in meters would
+# be narrower than one edge on coarse meshes (~105 km at recursion 6)
+UPLIFT_WIDTH_EDGES = 2.0
+
+# One row of per-plate statistics; areas are in square meters
+PLATE_STATS_DTYPE = np.dtype(
+    [
+        ("plate_id", np.int32),
+        ("total_points", np.int64),
+        ("land_points", np.int64),
+        ("ocean_points", np.int64),
+        ("land_percent", np.float64),
+        ("area", np.float64),
+        ("land_area", np.float64),
+        ("ocean_area", np.float64),
+        ("land_area_percent", np.float64),
+        ("convergent_points", np.int64),
+        ("divergent_points", np.int64),
+        ("transform_points", np.int64),
+        ("convergent_area", np.float64),
+        ("divergent_area", np.float64),
+        ("transform_area", np.float64),
+    ]
+)
 
 
 class TectonicsSimulatorPlugin(SimulationPlugin):
@@ -45,13 +80,40 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
         if not isinstance(simulation_steps, int) or simulation_steps < 1 or simulation_steps > 1000:
             return False, "simulation_steps must be an integer between 1 and 1000"
 
+        plate_roughness = params.get("plate_roughness", 0.5)
+        if not isinstance(plate_roughness, (int, float)) or not 0 <= plate_roughness < 1:
+            return False, "plate_roughness must be a number in [0, 1)"
+
+        rotation_rate = params.get("rotation_rate", 0.02)
+        if not isinstance(rotation_rate, (int, float)) or not 0 <= rotation_rate <= 10:
+            return False, "rotation_rate must be a number between 0 and 10"
+
+        uplift_width = params.get("uplift_width")
+        if uplift_width is not None and (not isinstance(uplift_width, (int, float)) or uplift_width < 0):
+            return False, "uplift_width must be a non-negative number"
+
+        falloff_interval = params.get("falloff_interval", 10)
+        if not isinstance(falloff_interval, int) or falloff_interval < 1:
+            return False, "falloff_interval must be a positive integer"
+
+        checkpoint_file = params.get("checkpoint_file")
+        if checkpoint_file is not None and not isinstance(checkpoint_file, (str, Path)):
+            return False, "checkpoint_file must be a path"
+
+        checkpoint_interval = params.get("checkpoint_interval", 10)
+        if not isinstance(checkpoint_interval, int) or checkpoint_interval < 1:
+            return False, "checkpoint_interval must be a positive integer"
+
+        if not isinstance(params.get("resume", True), bool):
+            return False, "resume must be a boolean"
+
         return True, ""
 
     def get_required_data_layers(self) -> list[str]:
         return ["elevation", "landforms"]
 
     def get_produced_data_layers(self) -> list[str]:
-        return ["plate_id", "plate_distance", "plate_boundary", "boundary_type"]
+        return ["plate_id", "plate_distance", "plate_boundary", "boundary_type", "boundary_distance"]
 
     async def execute(
         self,
@@ -66,9 +128,34 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
             params: Generation parameters:
                 - num_plates (int): Number of tectonic plates (default: 12)
                 - simulation_steps (int): Number of simulation iterations (default: 50)
+                - plate_roughness (float): Random variation of plate growth
+                  cost per mesh edge, in [0, 1); higher values give more
+                  ragged plate outlines (default: 0.5)
                 - mountain_strength (float): Strength of mountain formation (default: 1.0)
                 - trench_strength (float): Strength of trench formation (default: 0.8)
                 - ridge_strength (float): Strength of ridge formation (default: 0.5)
+                - rotation_rate (float): Degrees each plate rotates about its
+                  Euler pole per step, per unit plate speed (speeds are 0.5-2.0);
+                  0 keeps plates fixed (default: 0.02)
+                - uplift_width (float | None): Gaussian falloff width in meters of
+                  mountain, trench and ridge uplift away from their boundaries,
+                  measured along the mesh; 0 confines uplift to the boundary
+                  vertices themselves (default: None, UPLIFT_WIDTH_EDGES mesh
+                  edges)
+                - falloff_interval (int): While plates move, the uplift
+                  falloff is recomputed every this many steps (default: 10)
+                - checkpoint_file (str | Path): HDF5 file (typically the
+                  world file, see MeshStore.world_path) receiving elevation
+                  and plate_id time-lapse frames plus a resumable checkpoint
+                  under /timelapse/tectonics; disabled if None (default: None)
+                - checkpoint_interval (int): Steps between frames and
+                  checkpoints; the first and last step are always recorded
+                  (default: 10)
+                - resume (bool): Continue from the checkpoint in
+                  checkpoint_file if there is one; simulation_steps may be
+                  raised to extend a finished run. The checkpoint must match
+                  the parameters and input layers; unseeded worlds (seed 0)
+                  always start over (default: True)
             progress_callback: Optional progress callback
 
         Returns:
@@ -111,62 +198,202 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
             mountain_strength = params.get("mountain_strength", 1.0)
             trench_strength = params.get("trench_strength", 0.8)
             ridge_strength = params.get("ridge_strength", 0.5)
+            uplift_width = params.get("uplift_width")
+            if uplift_width is None:
+                uplift_width = UPLIFT_WIDTH_EDGES * self._mesh_edge_length(world)
+            falloff_interval = params.get("falloff_interval", 10)
+            plate_roughness = params.get("plate_roughness", 0.5)
+            checkpoint_interval = params.get("checkpoint_interval", 10)
+
+            # Per-run generator derived from the world seed
+            rng = world.random_generator(self.metadata.name)
 
             if progress_callback:
                 progress_callback(0.05, "Generating tectonic plates")
 
             # Step 1: Generate plates
-            plate_data = self._generate_plates(world, num_plates)
+            plate_data = self._generate_plates(world, num_plates, rng, plate_roughness)
 
             if progress_callback:
                 progress_callback(0.15, "Assigning plate velocities")
 
             # Step 2: Assign velocities
-            plate_velocities = self._assign_plate_velocities(world, num_plates, plate_data["plate_centers"])
+            plate_velocities = self._assign_plate_velocities(world, num_plates, plate_data["plate_centers"], rng)
+
+            # Rigid rotation of each plate about an Euler pole through the
+            # center, oriented so the center moves with its assigned velocity
+            angular_velocities = self._euler_poles(plate_data["plate_centers"], plate_velocities)
+            rotation_rate = math.radians(params.get("rotation_rate", 0.02))
 
             if progress_callback:
                 progress_callback(0.20, "Building neighbor graph")
 
-            # Step 3: Build neighbor graph for boundary detection
-            neighbors = self._build_neighbor_graph(world)
+            # Step 3: Vertex adjacency (CSR) for boundary detection
+            indptr, indices = world.vertex_adjacency()
 
             # Get initial elevation
-            elevation = world.get_data_layer("elevation").copy()
+            # Simulate in float64; the layer itself is stored as float32
+            elevation = world.get_data_layer("elevation").astype(np.float64)
             landforms = world.get_data_layer("landforms")
+            plate_ids = plate_data["plate_ids"]
+
+            # Step 4: Detect and classify boundaries. After this they are only
+            # updated around vertices whose plate changes.
+            boundary_edges = self._detect_boundaries(plate_ids, indptr, indices)
+            boundary_types = self._classify_boundaries(
+                world,
+                boundary_edges,
+                plate_ids,
+                angular_velocities,
+            )
+
+            # Per-step elevation change and its reused buffers
+            strengths = (mountain_strength, trench_strength, ridge_strength)
+            increments = self._force_increments(world, landforms, boundary_types, *strengths, uplift_width)
+            transform_points = np.flatnonzero(boundary_types == BOUNDARY_TRANSFORM)
+            fault_noise = np.empty(len(transform_points), dtype=np.float64)
+
+            # Plate motion: membership is tested against the initial plate map,
+            # so sub-edge motion accumulates exactly. Steps are split so no
+            # plate moves more than one mesh edge per substep.
+            motion = None
+            substeps = 1
+            if rotation_rate > 0:
+                unit_points = world._original_points / world.params.radius
+                motion = {
+                    "initial_ids": plate_ids.copy(),
+                    "tree": cKDTree(unit_points),
+                    "unit_points": unit_points,
+                    "mask": np.zeros(world.num_points, dtype=bool),
+                }
+                edge_angle = ICOSAHEDRON_EDGE / 2**world.params.recursion
+                max_angle = np.linalg.norm(angular_velocities, axis=1).max() * rotation_rate
+                substeps = max(1, math.ceil(max_angle / edge_angle))
+
+            reassigned = 0
+            boundaries_changed = False
+            start_step = 0
+
+            # Time-lapse frames and checkpoints; an earlier checkpoint
+            # replaces the state set up above
+            timelapse = None
+            if params.get("checkpoint_file") is not None:
+                timelapse = self._timelapse_writer(world, params)
+                initial_plate_ids = plate_ids.copy()
+                input_digests = {name: world.layer_digest(name) for name in self.get_required_data_layers()}
+                # An unseeded run can never continue an earlier one: its plates
+                # and RNG stream differ, so the old checkpoint is discarded
+                resume = params.get("resume", True) and world.params.seed != 0
+                checkpoint = timelapse.load_checkpoint() if resume else None
+                if checkpoint is None:
+                    timelapse.reset()
+                    timelapse.append(0, {"elevation": elevation, "plate_id": plate_ids})
+                else:
+                    start_step, arrays, state = checkpoint
+                    if start_step > simulation_steps:
+                        msg = f"checkpoint is at step {start_step}, beyond simulation_steps"
+                        raise ValueError(msg)
+                    if state.get("input_digests") != input_digests or not np.array_equal(
+                        arrays["initial_plate_id"], initial_plate_ids
+                    ):
+                        msg = "checkpoint was written for a different world"
+                        raise ValueError(msg)
+
+                    elevation = arrays["elevation"]
+                    plate_ids[:] = arrays["plate_id"]
+                    boundary_types = arrays["boundary_type"]
+                    increments = arrays["increments"]
+                    transform_points = np.flatnonzero(boundary_types == BOUNDARY_TRANSFORM)
+                    fault_noise = np.empty(len(transform_points), dtype=np.float64)
+                    rng.bit_generator.state = state["rng"]
+                    reassigned = state["reassigned"]
+                    boundaries_changed = state["boundaries_changed"]
 
             if progress_callback:
                 progress_callback(0.25, f"Simulating {simulation_steps} time steps")
 
-            # Step 4: Simulate plate movement and interactions
-            for step in range(simulation_steps):
+            # Step 5: Simulate plate movement and interactions
+            for step in range(start_step, simulation_steps):
                 if progress_callback and step % 10 == 0:
                     progress = 0.25 + (step / simulation_steps) * 0.50
                     progress_callback(progress, f"Simulating step {step + 1}/{simulation_steps}")
 
-                # Detect boundaries
-                boundaries = self._detect_boundaries(
-                    plate_data["plate_ids"],
-                    neighbors,
-                )
-
-                # Classify boundary types
-                boundary_types = self._classify_boundaries(
-                    world,
-                    boundaries,
-                    plate_data["plate_ids"],
-                    plate_velocities,
-                    neighbors,
+                for substep in range(substeps if motion else 0):
+                    elapsed = step + (substep + 1) / substeps
+                    changed = self._reassign_plates(
+                        plate_ids,
+                        boundary_types,
+                        landforms,
+                        angular_velocities,
+                        rotation_rate * elapsed,
+                        indptr,
+                        indices,
+                        motion,
+                    )
+                    if len(changed) == 0:
+                        continue
+                    reassigned += len(changed)
+                    boundaries_changed = True
+
+                    # Boundary status can only change at and next to moved vertices
+                    affected = self._ring(changed, indptr, indices, motion["mask"])
+                    affected_edges = self._detect_boundaries(plate_ids, indptr, indices, rows=affected)
+                    boundary_types[affected] = self._classify_boundaries(
+                        world,
+                        affected_edges,
+                        plate_ids,
+                        angular_velocities,
+                        rows=affected,
+                    )
+                    transform_points = np.flatnonzero(boundary_types == BOUNDARY_TRANSFORM)
+                    fault_noise = np.empty(len(transform_points), dtype=np.float64)
+
+                # Uplift follows the moving boundaries; with a falloff this
+                # needs distance fields, so it is refreshed periodically
+                refresh = uplift_width <= 0 or (step + 1) % falloff_interval == 0
+                if boundaries_changed and refresh:
+                    increments = self._force_increments(
+                        world, landforms, boundary_types, *strengths, uplift_width
+                    )
+                    boundaries_changed = False
+
+                # Modify elevation based on boundary interactions (in place)
+                self._apply_tectonic_forces(
+                    elevation,
+                    increments,
+                    transform_points,
+                    fault_noise,
+                    rng,
+                    out=elevation,
                 )
 
-                # Modify elevation based on boundary interactions
-                elevation = self._apply_tectonic_forces(
-                    elevation,
-                    landforms,
-                    boundaries,
-                    boundary_types,
-                    mountain_strength,
-                    trench_strength,
-                    ridge_strength,
+                completed = step + 1
+                if timelapse and (completed % checkpoint_interval == 0 or completed == simulation_steps):
+                    timelapse.append(
+                        completed,
+                        {"elevation": elevation, "plate_id": plate_ids},
+                        arrays={
+                            "elevation": elevation,
+                            "plate_id": plate_ids,
+                            "boundary_type": boundary_types,
+                            "increments": increments,
+                            "initial_plate_id": initial_plate_ids,
+                        },
+                        state={
+                            "rng": rng.bit_generator.state,
+                            "reassigned": reassigned,
+                            "boundaries_changed": boundaries_changed,
+                            "input_digests": input_digests,
+                        },
+                    )
+
+            # Final plate centers after rotation
+            total_angle = rotation_rate * simulation_steps
+            plate_centers = plate_data["plate_centers"]
+            if motion is not None:
+                plate_centers = self._rotate(plate_centers, angular_velocities, total_angle)
+                plate_data["plate_distances"] = np.linalg.norm(
+                    world.points - plate_centers[plate_ids], axis=1
                 )
 
             if progress_callback:
@@ -175,44 +402,34 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
             # Update world with modified elevation
             world.add_data_layer("elevation", elevation, overwrite=True)
 
-            # Warp mesh by new elevation
-            world.warp_by_elevation(layer_name="elevation", factor=10.0)
-            world.compute_normals()
+            # Rebuild geometry from the sphere with the new elevation
+            world.update_geometry(layer_name="elevation", factor=10.0)
 
             if progress_callback:
                 progress_callback(0.85, "Storing plate data")
 
             # Store plate data
-            world.add_data_layer("plate_id", plate_data["plate_ids"].astype(np.float64), overwrite=True)
-            world.add_data_layer("plate_distance", plate_data["plate_distances"].astype(np.float64), overwrite=True)
-
-            # Create boundary mask
-            boundary_mask = np.zeros(world.num_points)
-            for boundary_point in boundaries:
-                boundary_mask[boundary_point] = 1.0
-            world.add_data_layer("plate_boundary", boundary_mask, overwrite=True)
-
-            # Store boundary types (0=none, 1=convergent, 2=divergent, 3=transform)
-            boundary_type_layer = np.zeros(world.num_points)
-            for point, btype in boundary_types.items():
-                if btype == "convergent":
-                    boundary_type_layer[point] = 1.0
-                elif btype == "divergent":
-                    boundary_type_layer[point] = 2.0
-                elif btype == "transform":
-                    boundary_type_layer[point] = 3.0
-            world.add_data_layer("boundary_type", boundary_type_layer, overwrite=True)
+            world.add_data_layer("plate_id", plate_ids, overwrite=True)
+            world.add_data_layer("plate_distance", plate_data["plate_distances"], overwrite=True)
+
+            # Boundary mask and types (0=none, 1=convergent, 2=divergent, 3=transform)
+            world.add_data_layer("plate_boundary", boundary_types > 0, overwrite=True)
+            world.add_data_layer("boundary_type", boundary_types, overwrite=True)
+
+            # Distance along the mesh to the nearest boundary of any type
+            boundary_distance = world.geodesic_distance(np.flatnonzero(boundary_types))
+            world.add_data_layer("boundary_distance", boundary_distance, overwrite=True)
 
             if progress_callback:
                 progress_callback(0.90, "Computing statistics")
 
             # Calculate statistics
             stats = self._calculate_stats(
-                plate_data["plate_ids"],
+                plate_ids,
                 landforms,
-                boundaries,
                 boundary_types,
                 num_plates,
+                world.point_areas(),
             )
 
             # Store metadata
@@ -220,23 +437,31 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
                 "num_plates": num_plates,
                 "simulation_steps": simulation_steps,
                 "plate_centers": plate_data["plate_centers"].tolist(),
+                "final_plate_centers": plate_centers.tolist(),
                 "plate_velocities": {int(k): v.tolist() for k, v in plate_velocities.items()},
-                "stats": stats,
+                "euler_poles": (
+                    angular_velocities / np.linalg.norm(angular_velocities, axis=1, keepdims=True)
+                ).tolist(),
+                "rotation_degrees_per_step": np.degrees(
+                    np.linalg.norm(angular_velocities, axis=1) * rotation_rate
+                ).tolist(),
+                "reassigned_vertices": reassigned,
+                "uplift_width": uplift_width,
+                "resumed_from_step": start_step,
+                # Metadata must stay JSON-serializable: plates as row dicts
+                "stats": {**stats, "plates": _plate_rows(stats["plates"])},
             }
 
             if progress_callback:
                 progress_callback(0.95, "Creating visualization colormap")
 
-            # Create colormap for visualization
-            annotations = {i: f"Plate {i}" for i in range(num_plates)}
-            color_map = LookupTable(
-                cmap="Accent",
-                n_values=num_plates,
-                scalar_range=(0, num_plates - 1),
-                annotations=annotations,
-            )
-
-            world.metadata["tectonic_colormap"] = color_map
+            # Colormap spec for visualization (pyvista.LookupTable arguments)
+            world.metadata["tectonic_colormap"] = {
+                "cmap": "Accent",
+                "n_values": num_plates,
+                "scalar_range": (0, num_plates - 1),
+                "annotations": {i: f"Plate {i}" for i in range(num_plates)},
+            }
 
             return PluginResult(
                 success=True,
@@ -244,10 +469,11 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
                 data={
                     "num_plates": num_plates,
                     "simulation_steps": simulation_steps,
-                    "boundaries_created": len(boundaries),
+                    "boundaries_created": stats["total_boundaries"],
                     "convergent_boundaries": stats["boundary_counts"]["convergent"],
                     "divergent_boundaries": stats["boundary_counts"]["divergent"],
                     "transform_boundaries": stats["boundary_counts"]["transform"],
+                    "plate_stats": stats["plates"],
                 },
             )
 
@@ -257,38 +483,160 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
                 message=f"Tectonic simulation failed: {e}",
             )
 
-    def _generate_plates(self, world: World, num_plates: int) -> dict[str, Any]:
-        """Generate tectonic plates using Voronoi segmentation.
+    def _timelapse_writer(self, world: World, params: dict[str, Any]) -> TimelapseWriter:
+        """Create the time-lapse writer for a run.
+
+        A checkpoint is only resumed by a run with the same world seed and
+        the same simulation parameters, apart from simulation_steps. The
+        caller also checks the input layers against the checkpoint state.
+
+        Args:
+            world: World object
+            params: Simulation parameters
+
+        Returns:
+            Writer for elevation and plate_id frames
+        """
+        run_params = {
+            "seed": world.params.seed,
+            "num_plates": params.get("num_plates", 12),
+            "plate_roughness": params.get("plate_roughness", 0.5),
+            "mountain_strength": params.get("mountain_strength", 1.0),
+            "trench_strength": params.get("trench_strength", 0.8),
+            "ridge_strength": params.get("ridge_strength", 0.5),
+            "rotation_rate": params.get("rotation_rate", 0.02),
+            "uplift_width": params.get("uplift_width"),
+            "falloff_interval": params.get("falloff_interval", 10),
+        }
+        return TimelapseWriter(
+            params["checkpoint_file"],
+            self.metadata.name,
+            world.num_points,
+            # Frames use the same dtypes as the layers they snapshot
+            layers={name: layer_spec(name).dtype for name in ("elevation", "plate_id")},
+            params=run_params,
+        )
+
+    def _generate_plates(
+        self,
+        world: World,
+        num_plates: int,
+        rng: np.random.Generator,
+        roughness: float = 0.5,
+    ) -> dict[str, Any]:
+        """Generate tectonic plates by flood fill over the mesh.
+
+        Plates grow outward from random seed points along mesh edges. Each
+        plate has its own growth rate and each edge a random cost factor, so
+        plates differ in size and get irregular outlines; every point joins
+        the plate that reaches it first.
 
         Args:
             world: World object
             num_plates: Number of plates to create
+            rng: Random generator for this run
+            roughness: Edge cost variation in [0, 1)
 
         Returns:
             Dictionary with plate_ids, plate_distances, and plate_centers
         """
-        # Generate random plate centers from mesh points
-        plate_centers = world.mesh.points[
-            np.random.choice(world.num_points, num_plates, replace=False)
-        ]
-
-        # Build KDTree for nearest-neighbor assignment
-        tree = KDTree(data=plate_centers)
+        indptr, indices = world.vertex_adjacency()
+        seeds = rng.choice(world.num_points, num_plates, replace=False)
+        rates = rng.uniform(0.5, 1.5, num_plates)
+        costs = world.edge_length_graph().data * rng.uniform(
+            1.0 - roughness, 1.0 + roughness, len(indices)
+        )
 
-        # Assign each mesh point to nearest plate
-        distances, plate_indices = tree.query(x=world.mesh.points)
+        plate_ids, _ = self._flood_fill(indptr, indices, costs, seeds, rates)
+        plate_centers = world.points[seeds]
+        distances = np.linalg.norm(world.points - plate_centers[plate_ids], axis=1)
 
         return {
-            "plate_ids": plate_indices,
+            "plate_ids": plate_ids,
             "plate_distances": distances,
             "plate_centers": plate_centers,
         }
 
+    @staticmethod
+    def _flood_fill(
+        indptr: NDArray[np.int64],
+        indices: NDArray[np.int64],
+        costs: NDArray[np.float64],
+        seeds: NDArray[np.int64],
+        rates: NDArray[np.float64],
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """Multi-source flood fill where each region grows at its own rate.
+
+        Equivalent to a heap-based Dijkstra in which region ``r`` crosses
+        edge ``k`` in ``costs[k] / rates[r]`` and a point is settled by the
+        first region to arrive (the lowest region index on ties). Instead of
+        popping one entry at a time, the frontier is processed as a bucket
+        queue: every entry arriving before ``earliest + min_step`` (the
+        cheapest possible edge crossing) is final, so the whole bucket is
+        settled and relaxed in array operations.
+
+        Args:
+            indptr: CSR row pointers from World.vertex_adjacency()
+            indices: CSR column indices from World.vertex_adjacency()
+            costs: Positive cost of each CSR edge
+            seeds: Starting point of each region
+            rates: Growth rate of each region
+
+        Returns:
+            Tuple of (region index per point, arrival time per point)
+        """
+        num_points = len(indptr) - 1
+        region = np.full(num_points, -1, dtype=np.int64)
+        arrival = np.full(num_points, np.inf)
+        degree = np.diff(indptr)
+        inverse_rates = 1.0 / rates
+        min_step = costs.min() * inverse_rates.min()
+
+        # Frontier entries: (arrival time, point, region)
+        times = np.zeros(len(seeds))
+        points = np.asarray(seeds, dtype=np.int64)
+        owners = np.arange(len(seeds))
+        arrival[points] = 0.0
+
+        while len(times):
+            bucket = times < times.min() + min_step
+            b_times, b_points, b_owners = times[bucket], points[bucket], owners[bucket]
+            times, points, owners = times[~bucket], points[~bucket], owners[~bucket]
+
+            # Earliest arrival per point wins, then the lowest region; skip
+            # points settled earlier
+            order = np.lexsort((b_owners, b_times, b_points))
+            b_times, b_points, b_owners = b_times[order], b_points[order], b_owners[order]
+            first = np.concatenate(([True], b_points[1:] != b_points[:-1]))
+            first &= region[b_points] < 0
+            b_times, b_points, b_owners = b_times[first], b_points[first], b_owners[first]
+            region[b_points] = b_owners
+
+            # Relax all edges out of the newly settled points
+            counts = degree[b_points]
+            entry = np.repeat(np.arange(len(b_points)), counts)
+            offsets = np.arange(len(entry)) - np.repeat(np.cumsum(counts) - counts, counts)
+            edge = indptr[b_points][entry] + offsets
+            targets = indices[edge]
+            reached = b_times[entry] + costs[edge] * inverse_rates[b_owners[entry]]
+
+            # Equal arrivals are kept so the tie-break above sees them all
+            improved = (region[targets] < 0) & (reached <= arrival[targets])
+            targets, reached = targets[improved], reached[improved]
+            np.minimum.at(arrival, targets, reached)
+
+            times = np.concatenate((times, reached))
+            points = np.concatenate((points, targets))
+            owners = np.concatenate((owners, b_owners[entry[improved]]))
+
+        return region, arrival
+
     def _assign_plate_velocities(
         self,
         world: World,
         num_plates: int,
         plate_centers: NDArray,
+        rng: np.random.Generator,
     ) -> dict[int, NDArray]:
         """Assign random tangent velocities to each plate.
 
@@ -298,6 +646,7 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
             world: World object
             num_plates: Number of plates
             plate_centers: Center points of each plate
+            rng: Random generator for this run
 
         Returns:
             Dictionary mapping plate_id to velocity vector (3D)
@@ -312,7 +661,7 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
 
             # Generate a random tangent vector
             # Start with a random vector
-            random_vec = np.random.randn(3)
+            random_vec = rng.standard_normal(3)
 
             # Make it tangent by removing radial component
             tangent = random_vec - np.dot(random_vec, radial) * radial
@@ -321,242 +670,444 @@ class TectonicsSimulatorPlugin(SimulationPlugin):
             tangent = tangent / np.linalg.norm(tangent)
 
             # Random speed between 0.5 and 2.0
-            speed = np.random.uniform(0.5, 2.0)
+            speed = rng.uniform(0.5, 2.0)
             velocity = tangent * speed
 
             velocities[plate_id] = velocity
 
         return velocities
 
-    def _build_neighbor_graph(self, world: World) -> dict[int, list[int]]:
-        """Build graph of neighboring points on the mesh.
+    def _euler_poles(
+        self,
+        plate_centers: NDArray,
+        plate_velocities: dict[int, NDArray],
+    ) -> NDArray[np.float64]:
+        """Angular velocity vector of each plate.
+
+        The pole is perpendicular to the plate center and its velocity, so the
+        center moves with exactly its assigned tangent velocity; the magnitude
+        is the plate speed.
 
         Args:
-            world: World object
+            plate_centers: Center points of each plate
+            plate_velocities: Dictionary of plate velocities
+
+        Returns:
+            (num_plates, 3) angular velocity vectors
+        """
+        centers = plate_centers / np.linalg.norm(plate_centers, axis=1, keepdims=True)
+        velocities = np.array([plate_velocities[i] for i in range(len(plate_centers))])
+        return np.cross(centers, velocities)
+
+    @staticmethod
+    def _rotate(
+        vectors: NDArray[np.float64],
+        angular_velocities: NDArray[np.float64],
+        time: float,
+    ) -> NDArray[np.float64]:
+        """Rotate each vector about its angular velocity for the given time.
+
+        Args:
+            vectors: (N, 3) vectors
+            angular_velocities: (N, 3) angular velocity per vector
+            time: Elapsed time (negative rotates backwards)
 
         Returns:
-            Dictionary mapping point index to list of neighbor indices
+            (N, 3) rotated vectors (Rodrigues' formula)
         """
-        neighbors = {i: [] for i in range(world.num_points)}
+        rates = np.linalg.norm(angular_velocities, axis=1, keepdims=True)
+        axes = angular_velocities / rates
+        angles = rates * time
+        cos = np.cos(angles)
+        return (
+            vectors * cos
+            + np.cross(axes, vectors) * np.sin(angles)
+            + axes * (np.einsum("ij,ij->i", axes, vectors)[:, None] * (1.0 - cos))
+        )
 
-        # Extract faces (triangles)
-        faces = world.mesh.faces.reshape(-1, 4)[:, 1:]  # Skip the "3" prefix
+    @staticmethod
+    def _ring(
+        rows: NDArray[np.int64],
+        indptr: NDArray[np.int64],
+        indices: NDArray[np.int64],
+        mask: NDArray[np.bool_],
+    ) -> NDArray[np.int64]:
+        """Sorted union of some vertices and their neighbors.
 
-        # For each face, all three vertices are neighbors
-        for face in faces:
-            a, b, c = face
-            neighbors[a].extend([b, c])
-            neighbors[b].extend([a, c])
-            neighbors[c].extend([a, b])
+        Args:
+            rows: Vertex indices
+            indptr: CSR row pointers from World.vertex_adjacency()
+            indices: CSR neighbor indices from World.vertex_adjacency()
+            mask: All-False scratch mask of length N (left all-False)
+
+        Returns:
+            Sorted vertex indices
+        """
+        _, targets = adjacency_edges(indptr, indices, rows)
+        mask[rows] = True
+        mask[targets] = True
+        ring = np.flatnonzero(mask)
+        mask[ring] = False
+        return ring
+
+    def _reassign_plates(
+        self,
+        plate_ids: NDArray,
+        boundary_types: NDArray[np.uint8],
+        landforms: NDArray,
+        angular_velocities: NDArray[np.float64],
+        time: float,
+        indptr: NDArray[np.int64],
+        indices: NDArray[np.int64],
+        motion: dict[str, Any],
+    ) -> NDArray[np.int64]:
+        """Reassign vertices near plate boundaries after the plates rotate.
+
+        A plate claims a vertex if rotating the vertex back by that plate's
+        total rotation lands inside the plate's initial region. A vertex can
+        only change to a plate among its neighbors, so only boundary vertices
+        are tested, against their own and their neighbors' plates; callers
+        keep motion per call under one mesh edge. Where plates
+        overlap, continental crust overrides oceanic crust and otherwise the
+        current plate keeps the vertex (the other plate subducts); where no
+        plate claims a vertex (a spreading gap) it keeps its plate.
 
-        # Remove duplicates
-        for point in neighbors:
-            neighbors[point] = list(set(neighbors[point]))
+        Args:
+            plate_ids: Current plate IDs, updated in place
+            boundary_types: Per-point boundary type codes
+            landforms: Landform mask (1=land, 0=ocean)
+            angular_velocities: (num_plates, 3) angular velocities
+            time: Elapsed time since the initial configuration
+            indptr: CSR row pointers from World.vertex_adjacency()
+            indices: CSR neighbor indices from World.vertex_adjacency()
+            motion: Initial plate map and KD-tree of unit sphere points
 
-        return neighbors
+        Returns:
+            Indices of vertices whose plate changed
+        """
+        num_plates = len(angular_velocities)
+        band = np.flatnonzero(boundary_types)
+
+        # Candidate (vertex, plate) pairs: the vertex's plate and its neighbors'
+        sources, targets = adjacency_edges(indptr, indices, band)
+        keys = np.concatenate([band, sources]) * num_plates + np.concatenate(
+            [plate_ids[band], plate_ids[targets]]
+        )
+        keys.sort()
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        vertices = keys // num_plates
+        plates = keys % num_plates
+
+        # Where each plate's material at these vertices started out
+        upstream = self._rotate(
+            motion["unit_points"][vertices],
+            angular_velocities[plates],
+            -time,
+        )
+        _, origin = motion["tree"].query(upstream)
+        claims = motion["initial_ids"][origin] == plates
+
+        vertices = vertices[claims]
+        plates = plates[claims]
+        score = 2 * (landforms[origin[claims]] > 0.5) + (plates == plate_ids[vertices])
+
+        # Best claim per vertex: highest score, then lowest plate id
+        order = np.lexsort((plates, -score, vertices))
+        vertices = vertices[order]
+        plates = plates[order]
+        first = np.concatenate(([True], vertices[1:] != vertices[:-1]))
+        vertices = vertices[first]
+        plates = plates[first]
+
+        moved = plates != plate_ids[vertices]
+        changed = vertices[moved]
+        plate_ids[changed] = plates[moved]
+        return changed
 
     def _detect_boundaries(
         self,
         plate_ids: NDArray,
-        neighbors: dict[int, list[int]],
-    ) -> set[int]:
-        """Detect plate boundary points.
+        indptr: NDArray[np.int64],
+        indices: NDArray[np.int64],
+        rows: NDArray[np.int64] | None = None,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Detect plate boundary edges.
 
         A point is on a boundary if any of its neighbors belong to a different plate.
 
         Args:
             plate_ids: Array of plate IDs for each point
-            neighbors: Neighbor graph
+            indptr: CSR row pointers from World.vertex_adjacency()
+            indices: CSR neighbor indices from World.vertex_adjacency()
+            rows: Sorted points to examine (all points if None)
 
         Returns:
-            Set of point indices that are on plate boundaries
+            Tuple of (sources, targets) for every directed cross-plate edge,
+            ordered by source then target
         """
-        boundaries = set()
-
-        for point, neighbor_list in neighbors.items():
-            point_plate = plate_ids[point]
+        sources, targets = adjacency_edges(indptr, indices, rows)
+        cross_plate = plate_ids[sources] != plate_ids[targets]
 
-            for neighbor in neighbor_list:
-                if plate_ids[neighbor] != point_plate:
-                    boundaries.add(point)
-                    break
-
-        return boundaries
+        return sources[cross_plate], targets[cross_plate]
 
     def _classify_boundaries(
         self,
         world: World,
-        boundaries: set[int],
+        boundary_edges: tuple[NDArray[np.int64], NDArray[np.int64]],
         plate_ids: NDArray,
-        plate_velocities: dict[int, NDArray],
-        neighbors: dict[int, list[int]],
-    ) -> dict[int, str]:
+        angular_velocities: NDArray[np.float64],
+        rows: NDArray[np.int64] | None = None,
+    ) -> NDArray[np.uint8]:
         """Classify boundary points as convergent, divergent, or transform.
 
+        For each neighboring plate of a boundary point, convergence is the
+        closing speed of the two plates at that point, along the direction to
+        the first (lowest index) neighbor in that plate. Scores are averaged
+        over the neighboring plates.
+
         Args:
             world: World object
-            boundaries: Set of boundary point indices
+            boundary_edges: Cross-plate edges from _detect_boundaries()
             plate_ids: Array of plate IDs
-            plate_velocities: Dictionary of plate velocities
-            neighbors: Neighbor graph
+            angular_velocities: (num_plates, 3) angular velocities
+            rows: Sorted points the edges were detected for (all if None)
 
         Returns:
-            Dictionary mapping boundary point to boundary type
+            Boundary type codes for ``rows`` (BOUNDARY_NONE for interior points)
         """
-        boundary_types = {}
-
-        for point in boundaries:
-            point_plate = plate_ids[point]
-            point_pos = world.mesh.points[point]
-            point_vel = plate_velocities[point_plate]
-
-            # Find neighbors in different plates
-            neighboring_plates = set()
-            for neighbor in neighbors[point]:
-                neighbor_plate = plate_ids[neighbor]
-                if neighbor_plate != point_plate:
-                    neighboring_plates.add(neighbor_plate)
-
-            # Check each neighboring plate
-            convergence_scores = []
-            for neighbor_plate in neighboring_plates:
-                neighbor_vel = plate_velocities[neighbor_plate]
-
-                # Relative velocity
-                relative_vel = point_vel - neighbor_vel
-
-                # Direction from point to neighbor plate center
-                # (approximate - just use first neighbor in that plate)
-                neighbor_point = None
-                for n in neighbors[point]:
-                    if plate_ids[n] == neighbor_plate:
-                        neighbor_point = n
-                        break
-
-                if neighbor_point is not None:
-                    neighbor_pos = world.mesh.points[neighbor_point]
-                    direction = neighbor_pos - point_pos
-
-                    # Normalize
-                    direction = direction / (np.linalg.norm(direction) + 1e-10)
-
-                    # Dot product: positive = moving apart, negative = moving together
-                    convergence = -np.dot(relative_vel, direction)
-                    convergence_scores.append(convergence)
-
-            # Average convergence across all neighboring plates
-            if convergence_scores:
-                avg_convergence = np.mean(convergence_scores)
-
-                if avg_convergence > 0.3:
-                    boundary_types[point] = "convergent"
-                elif avg_convergence < -0.3:
-                    boundary_types[point] = "divergent"
-                else:
-                    boundary_types[point] = "transform"
-            else:
-                boundary_types[point] = "transform"
+        sources, targets = boundary_edges
+        num_rows = len(plate_ids) if rows is None else len(rows)
+        boundary_types = np.full(num_rows, BOUNDARY_NONE, dtype=np.uint8)
+        if len(sources) == 0:
+            return boundary_types
+
+        target_plates = plate_ids[targets]
+
+        # Keep the first edge of each (point, neighboring plate) pair; edges
+        # are ordered by target within each source, so a stable sort keeps it
+        pair_keys = sources * len(angular_velocities) + target_plates
+        order = np.argsort(pair_keys, kind="stable")
+        sorted_keys = pair_keys[order]
+        first = order[np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))]
+        sources = sources[first]
+        targets = targets[first]
+
+        points = world.points
+        direction = points[targets] - points[sources]
+        direction /= np.linalg.norm(direction, axis=1, keepdims=True) + 1e-10
+
+        # Relative surface velocity of the two plates at the point; positive
+        # convergence = moving together
+        up = points[sources] / np.linalg.norm(points[sources], axis=1, keepdims=True)
+        relative_vel = np.cross(
+            angular_velocities[plate_ids[sources]] - angular_velocities[plate_ids[targets]],
+            up,
+        )
+        convergence = -np.einsum("ij,ij->i", relative_vel, direction)
+
+        # Average convergence across all neighboring plates
+        local = sources if rows is None else np.searchsorted(rows, sources)
+        total = np.bincount(local, weights=convergence, minlength=num_rows)
+        counts = np.bincount(local, minlength=num_rows)
+        is_boundary = counts > 0
+        avg_convergence = total[is_boundary] / counts[is_boundary]
+
+        boundary_types[is_boundary] = np.select(
+            [avg_convergence > 0.3, avg_convergence < -0.3],
+            [BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT],
+            default=BOUNDARY_TRANSFORM,
+        )
 
         return boundary_types
 
-    def _apply_tectonic_forces(
+    def _force_increments(
         self,
-        elevation: NDArray,
+        world: World,
         landforms: NDArray,
-        boundaries: set[int],
-        boundary_types: dict[int, str],
+        boundary_types: NDArray[np.uint8],
         mountain_strength: float,
         trench_strength: float,
         ridge_strength: float,
-    ) -> NDArray:
-        """Apply tectonic forces to modify elevation.
+        uplift_width: float,
+    ) -> NDArray[np.float64]:
+        """Deterministic per-step elevation change at each point.
+
+        Convergent boundaries build mountains on land and trenches at sea;
+        divergent boundaries build mid-ocean ridges at sea and rifts on land.
+        Each effect has full strength on its boundary and falls off as
+        exp(-(d / uplift_width)**2) with mesh distance d from the nearest
+        boundary of that type (cut off at 3 widths). Transform boundaries get
+        random fault noise each step instead (see _apply_tectonic_forces).
 
         Args:
-            elevation: Current elevation array
+            world: World object
             landforms: Landform mask (1=land, 0=ocean)
-            boundaries: Set of boundary points
-            boundary_types: Dictionary of boundary types
+            boundary_types: Per-point boundary type codes
             mountain_strength: Strength of mountain formation
             trench_strength: Strength of trench formation
             ridge_strength: Strength of ridge formation
+            uplift_width: Falloff width in meters (0 = boundary points only)
+
+        Returns:
+            Per-point elevation increment in meters
+        """
+        is_land = landforms > 0.5
+        convergent = np.where(is_land, mountain_strength * 50.0, -trench_strength * 80.0)
+        divergent = np.where(is_land, -ridge_strength * 20.0, ridge_strength * 30.0)
+
+        if uplift_width > 0:
+            convergent *= self._falloff(world, boundary_types == BOUNDARY_CONVERGENT, uplift_width)
+            divergent *= self._falloff(world, boundary_types == BOUNDARY_DIVERGENT, uplift_width)
+        else:
+            convergent *= boundary_types == BOUNDARY_CONVERGENT
+            divergent *= boundary_types == BOUNDARY_DIVERGENT
+
+        convergent += divergent
+        return convergent
+
+    @staticmethod
+    def _mesh_edge_length(world: World) -> float:
+        """Typical mesh edge length in meters at the world's recursion."""
+        return world.params.radius * ICOSAHEDRON_EDGE / 2**world.params.recursion
+
+    @staticmethod
+    def _falloff(
+        world: World,
+        sources: NDArray[np.bool_],
+        width: float,
+    ) -> NDArray[np.float64]:
+        """Gaussian weight of the mesh distance to the nearest source point.
+
+        Args:
+            world: World object
+            sources: Mask of source points
+            width: Falloff width in meters
+
+        Returns:
+            Per-point weight in [0, 1] (1 at sources, 0 beyond 3 widths)
+        """
+        distance = world.geodesic_distance(np.flatnonzero(sources), max_distance=3.0 * width)
+        distance /= width
+        np.square(distance, out=distance)
+        np.negative(distance, out=distance)
+        return np.exp(distance, out=distance)
+
+    def _apply_tectonic_forces(
+        self,
+        elevation: NDArray[np.float64],
+        increments: NDArray[np.float64],
+        transform_points: NDArray[np.int64],
+        fault_noise: NDArray[np.float64],
+        rng: np.random.Generator,
+        out: NDArray[np.float64] | None = None,
+    ) -> NDArray[np.float64]:
+        """Apply one step of tectonic forces to elevation.
+
+        The deterministic increments are added in one array operation, then
+        fault noise for all transform points is drawn in one batch into
+        ``fault_noise`` and added at those points. With ``out`` supplied the
+        step allocates nothing.
+
+        Args:
+            elevation: Current elevation array
+            increments: Per-point increments from _force_increments()
+            transform_points: Unique indices of transform boundary points
+            fault_noise: Buffer with one slot per transform point
+            rng: Random generator for this run
+            out: Output array (may be ``elevation`` itself); allocated if None
 
         Returns:
             Modified elevation array
         """
-        new_elevation = elevation.copy()
-
-        for point in boundaries:
-            boundary_type = boundary_types.get(point, "transform")
-            is_land = landforms[point] > 0.5
-            current_elev = elevation[point]
-
-            if boundary_type == "convergent":
-                # Convergent boundaries: collision creates mountains or trenches
-                if is_land:
-                    # Continental-continental collision → Mountains
-                    new_elevation[point] += mountain_strength * 50.0
-                else:
-                    # Oceanic-oceanic or oceanic-continental → Trench
-                    new_elevation[point] -= trench_strength * 80.0
-
-            elif boundary_type == "divergent":
-                # Divergent boundaries: spreading creates ridges
-                if not is_land:
-                    # Mid-ocean ridge
-                    new_elevation[point] += ridge_strength * 30.0
-                else:
-                    # Continental rift
-                    new_elevation[point] -= ridge_strength * 20.0
+        out = np.add(elevation, increments, out=out)
 
-            elif boundary_type == "transform":
-                # Transform boundaries: minimal elevation change
-                # Add small random noise to simulate fault activity
-                new_elevation[point] += np.random.uniform(-5.0, 5.0)
+        # uniform(-5, 5) per transform point, same values as rng.uniform
+        rng.random(out=fault_noise)
+        fault_noise *= 10.0
+        fault_noise -= 5.0
+        # Transform points are unique, so a plain fancy-index add is safe
+        out[transform_points] += fault_noise
 
-        return new_elevation
+        return out
 
     def _calculate_stats(
         self,
         plate_ids: NDArray,
         landforms: NDArray,
-        boundaries: set[int],
-        boundary_types: dict[int, str],
+        boundary_types: NDArray[np.uint8],
         num_plates: int,
+        point_areas: NDArray[np.float64],
     ) -> dict[str, Any]:
         """Calculate statistics for tectonic simulation.
 
+        Every point is binned once by (plate, land/ocean, boundary type), as
+        counts and as area, and all totals are sums over those bins.
+
         Args:
             plate_ids: Array of plate IDs
             landforms: Landform mask
-            boundaries: Set of boundary points
-            boundary_types: Dictionary of boundary types
+            boundary_types: Per-point boundary type codes
             num_plates: Number of plates
+            point_areas: Surface area per point from World.point_areas()
 
         Returns:
-            Dictionary of statistics
+            Dictionary of statistics; "plates" is a PLATE_STATS_DTYPE
+            structured array with one row per plate
         """
-        stats = {"plates": {}, "boundary_counts": {}}
+        num_types = len(BOUNDARY_TYPE_NAMES)
+        codes = (plate_ids * 2 + (landforms > 0.5)) * num_types + boundary_types
+        shape = (num_plates, 2, num_types)
+        counts = np.bincount(codes, minlength=np.prod(shape)).reshape(shape)
+        areas = np.bincount(codes, weights=point_areas, minlength=np.prod(shape)).reshape(shape)
+
+        # Collapse boundary types for land/ocean totals, and land/ocean for
+        # boundary type totals
+        surface_counts = counts.sum(axis=2)
+        surface_areas = areas.sum(axis=2)
+        type_counts = counts.sum(axis=1)
+        type_areas = areas.sum(axis=1)
+
+        plates = np.zeros(num_plates, dtype=PLATE_STATS_DTYPE)
+        plates["plate_id"] = np.arange(num_plates)
+        plates["land_points"] = surface_counts[:, 1]
+        plates["ocean_points"] = surface_counts[:, 0]
+        plates["total_points"] = surface_counts.sum(axis=1)
+        plates["land_area"] = surface_areas[:, 1]
+        plates["ocean_area"] = surface_areas[:, 0]
+        plates["area"] = surface_areas.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            plates["land_percent"] = np.nan_to_num(plates["land_points"] / plates["total_points"] * 100)
+            plates["land_area_percent"] = np.nan_to_num(plates["land_area"] / plates["area"] * 100)
+        for code, name in enumerate(BOUNDARY_TYPE_NAMES):
+            if code != BOUNDARY_NONE:
+                plates[f"{name}_points"] = type_counts[:, code]
+                plates[f"{name}_area"] = type_areas[:, code]
+
+        total_counts = type_counts.sum(axis=0)
+        total_areas = type_areas.sum(axis=0)
+        return {
+            "plates": plates,
+            "boundary_counts": {
+                name: int(total_counts[code])
+                for code, name in enumerate(BOUNDARY_TYPE_NAMES)
+                if code != BOUNDARY_NONE
+            },
+            "boundary_areas": {
+                name: float(total_areas[code])
+                for code, name in enumerate(BOUNDARY_TYPE_NAMES)
+                if code != BOUNDARY_NONE
+            },
+            "total_boundaries": int(total_counts[BOUNDARY_NONE + 1 :].sum()),
+        }
 
-        # Plate statistics
-        for plate_id in range(num_plates):
-            mask = plate_ids == plate_id
-            plate_points = np.sum(mask)
-            land_points = np.sum(mask & (landforms > 0.5))
-            ocean_points = plate_points - land_points
-
-            stats["plates"][f"plate_{plate_id}"] = {
-                "total_points": int(plate_points),
-                "land_points": int(land_points),
-                "ocean_points": int(ocean_points),
-                "land_percent": float(land_points / plate_points * 100) if plate_points > 0 else 0.0,
-            }
 
-        # Boundary type counts
-        boundary_counts = {"convergent": 0, "divergent": 0, "transform": 0}
-        for btype in boundary_types.values():
-            boundary_counts[btype] += 1
+def _plate_rows(plates: NDArray) -> list[dict[str, Any]]:
+    """Per-plate statistics as JSON-serializable dicts, one per plate.
 
-        stats["boundary_counts"] = boundary_counts
-        stats["total_boundaries"] = len(boundaries)
+    Args:
+        plates: PLATE_STATS_DTYPE structured array
 
-        return stats
+    Returns:
+        List of {field: value} dicts in plate order
+    """
+    return [dict(zip(plates.dtype.names, row)) for row in plates.tolist()]
@@ -0,0 +1,203 @@
+"""Per-octave noise field cache for terrain parameter sweeps.
+
+A single octave's raw noise field depends only on the noise seed, the mesh
+(recursion and radius), the octave frequency and the noise backend. Sweeps
+over amplitude-only parameters (``init_strength``, ``persistence``,
+``ocean_percent``) can therefore reuse every octave and only redo the
+weighted sum.
+
+Fields are sampled on the undeformed icosphere, which is what terrain sees
+on a freshly created world. They are kept in an in-memory LRU and,
+optionally, as ``.npy`` files in a cache directory. Both tiers have
+independent byte budgets.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024  # 512 MiB
+
+
+class NoiseFieldCache:
+    """Two-tier (memory + disk) LRU cache of per-octave noise arrays."""
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        max_memory_bytes: int = DEFAULT_MEMORY_BUDGET,
+        max_disk_bytes: int | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for on-disk fields (memory-only if None)
+            max_memory_bytes: Byte budget for the in-memory tier
+            max_disk_bytes: Byte budget for the on-disk tier (unbounded if None)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: OrderedDict[str, NDArray[np.float64]] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        seed: int,
+        recursion: int,
+        radius: float,
+        frequency: float,
+        backend: str,
+    ) -> str:
+        """Build the cache key for one octave field.
+
+        Args:
+            seed: Noise seed
+            recursion: Icosphere subdivision level
+            radius: World radius in meters
+            frequency: Octave frequency multiplier applied to vertex positions
+            backend: Noise backend name
+
+        Returns:
+            Hex digest identifying the field
+        """
+        raw = f"{seed}:{recursion}:{float(radius).hex()}:{float(frequency).hex()}:{backend}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes currently held in the in-memory tier."""
+        return self._memory_bytes
+
+    def get(self, key: str) -> NDArray[np.float64] | None:
+        """Look up a field, promoting disk hits into memory.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Read-only field array or None if not cached
+        """
+        with self._lock:
+            field = self._memory.get(key)
+            if field is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return field
+
+        path = self._disk_path(key)
+        if path is not None and path.exists():
+            try:
+                field = np.load(path)
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+            else:
+                # Refresh the LRU time; touch() would recreate an evicted file
+                try:
+                    os.utime(path)
+                except FileNotFoundError:
+                    pass
+                field.flags.writeable = False
+                with self._lock:
+                    self._store_in_memory(key, field)
+                    self.hits += 1
+                return field
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, field: NDArray[np.float64]) -> None:
+        """Store a field in both tiers.
+
+        Args:
+            key: Key from make_key()
+            field: Noise field (copied and marked read-only)
+        """
+        field = np.array(field, dtype=np.float64, copy=True)
+        field.flags.writeable = False
+
+        with self._lock:
+            self._store_in_memory(key, field)
+
+        path = self._disk_path(key)
+        if path is not None:
+            # Unique temporary name per writer (not *.npy, so eviction and
+            # clear() never see a partial file), then an atomic rename
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, field)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            self._evict_disk()
+
+    def clear(self) -> None:
+        """Remove all cached fields from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.npy"):
+                path.unlink(missing_ok=True)
+
+    def _store_in_memory(self, key: str, field: NDArray[np.float64]) -> None:
+        """Insert into the memory tier and evict down to budget (lock held)."""
+        if field.nbytes > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+
+        self._memory[key] = field
+        self._memory_bytes += field.nbytes
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the disk tier fits its budget."""
+        if self.cache_dir is None or self.max_disk_bytes is None:
+            return
+
+        # Other writers may replace or delete files while we scan
+        files = []
+        for path in self.cache_dir.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            total -= size
+            path.unlink(missing_ok=True)
+
+    def _disk_path(self, key: str) -> Path | None:
+        """Path of the on-disk file for a key (None when memory-only)."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.npy"
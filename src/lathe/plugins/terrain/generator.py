@@ -1,19 +1,51 @@
 """Terrain generation plugin using OpenSimplex noise."""
 
 import asyncio
+import time
 from typing import Any, Callable
 
 import numpy as np
 import opensimplex as osi
 from numpy.typing import NDArray
 
-from lathe.models.world import World
+from lathe.models.world import ICOSAHEDRON_EDGE, World, WorldPatch
 from lathe.plugins.base import PluginMetadata, PluginResult, SimulationPlugin
+from lathe.plugins.terrain.cache import NoiseFieldCache
+from lathe.plugins.terrain.noise import SimplexNoise
+from lathe.plugins.terrain.parallel import (
+    accumulate_octaves,
+    generate_octave_fields_parallel,
+    generate_raw_elevations_parallel,
+    generate_raw_elevations_with_gradient_parallel,
+)
+
+NOISE_BACKENDS = ("vectorized", "scalar")
+
+# Terrain settings recorded in world.metadata["terrain"] and reused by refinement
+TERRAIN_SETTINGS = (
+    "octaves",
+    "init_roughness",
+    "init_strength",
+    "roughness",
+    "persistence",
+    "noise_backend",
+)
 
 
 class TerrainGeneratorPlugin(SimulationPlugin):
     """Generates terrain elevations using multi-octave OpenSimplex noise."""
 
+    def __init__(self, noise_cache: NoiseFieldCache | None = None):
+        """Initialize the plugin.
+
+        Args:
+            noise_cache: Optional per-octave noise field cache. When set, octave
+                fields are reused across runs with the same seed, recursion,
+                radius and frequency, so only the weighted sum is recomputed
+                when amplitude-only parameters change.
+        """
+        self.noise_cache = noise_cache
+
     @property
     def metadata(self) -> PluginMetadata:
         return PluginMetadata(
@@ -38,6 +70,34 @@ class TerrainGeneratorPlugin(SimulationPlugin):
         if not isinstance(init_strength, (int, float)) or init_strength <= 0:
             return False, "init_strength must be a positive number"
 
+        noise_backend = params.get("noise_backend", "vectorized")
+        if noise_backend not in NOISE_BACKENDS:
+            return False, f"noise_backend must be one of {NOISE_BACKENDS}"
+
+        workers = params.get("workers", 1)
+        if not isinstance(workers, int) or workers < 1:
+            return False, "workers must be a positive integer"
+
+        if params.get("parallel", False) and noise_backend != "vectorized":
+            return False, "parallel mode requires the vectorized noise backend"
+
+        refine_from = params.get("refine_from")
+        if refine_from is not None:
+            if not isinstance(refine_from, World):
+                return False, "refine_from must be a World"
+            if "terrain" not in refine_from.metadata or not refine_from.has_data_layer("elevation_raw"):
+                return False, "refine_from world has no terrain to refine"
+
+        refine_smoothness = params.get("refine_smoothness", 16.0)
+        if not isinstance(refine_smoothness, (int, float)) or refine_smoothness < 0:
+            return False, "refine_smoothness must be a non-negative number"
+
+        if params.get("gradients", False):
+            if noise_backend != "vectorized":
+                return False, "gradients require the vectorized noise backend"
+            if refine_from is not None:
+                return False, "gradients cannot be combined with refine_from"
+
         return True, ""
 
     def get_produced_data_layers(self) -> list[str]:
@@ -59,17 +119,50 @@ class TerrainGeneratorPlugin(SimulationPlugin):
                 - init_strength (float): Initial amplitude multiplier (default: 0.4)
                 - roughness (float): Frequency multiplier per octave (default: 2.5)
                 - persistence (float): Amplitude multiplier per octave (default: 0.5)
+                - noise_backend (str): "vectorized" evaluates each octave for all
+                  vertices at once; "scalar" calls opensimplex.noise4 per vertex
+                  and is kept as the reference implementation (default: "vectorized")
+                - parallel (bool): Split vertices across a process pool; output is
+                  bit-identical to serial execution (default: False)
+                - workers (int): Process count for parallel mode (default: supplied
+                  by WorldGenerationEngine.workers)
+                - refine_from (World): Lower-recursion world to upscale. Inherited
+                  vertices reuse its elevation_raw and only the new midpoint
+                  vertices are evaluated; octave settings and seed are taken
+                  from the parent (default: None)
+                - refine_smoothness (float): Octaves whose wavelength spans at
+                  least this many parent edge lengths are interpolated from the
+                  parent vertices instead of evaluated at new vertices; 0
+                  evaluates every octave, matching a full regeneration
+                  (default: 16.0)
+                - gradients (bool): Accumulate analytic noise gradients across
+                  octaves to produce slope and aspect layers (degrees; aspect
+                  is the downslope compass bearing) and surface normals
+                  without a mesh normals pass. Bypasses the noise cache
+                  (default: False)
             progress_callback: Optional progress callback
 
         Returns:
             PluginResult with success status
         """
+        refine_from: World | None = params.get("refine_from")
+        seed: int | None = None
+        if refine_from is not None:
+            # Refinement must reproduce the parent's noise field exactly
+            parent_terrain = refine_from.metadata["terrain"]
+            params = {**params, **{key: parent_terrain[key] for key in TERRAIN_SETTINGS}}
+            seed = parent_terrain["seed"]
+
         # Extract parameters
         octaves = params.get("octaves", 8)
         init_roughness = params.get("init_roughness", 1.5)
         init_strength = params.get("init_strength", 0.4)
         roughness = params.get("roughness", 2.5)
         persistence = params.get("persistence", 0.5)
+        noise_backend = params.get("noise_backend", "vectorized")
+        workers = params.get("workers", 1) if params.get("parallel", False) else 1
+        refine_smoothness = params.get("refine_smoothness", 16.0)
+        gradients = params.get("gradients", False)
 
         if progress_callback:
             progress_callback(0.0, "Initializing terrain generation")
@@ -86,6 +179,12 @@ class TerrainGeneratorPlugin(SimulationPlugin):
             roughness,
             persistence,
             progress_callback,
+            noise_backend,
+            workers,
+            seed,
+            refine_from,
+            refine_smoothness,
+            gradients,
         )
 
         if progress_callback:
@@ -102,54 +201,104 @@ class TerrainGeneratorPlugin(SimulationPlugin):
         roughness: float,
         persistence: float,
         progress_callback: Callable[[float, str], None] | None,
+        noise_backend: str = "vectorized",
+        workers: int = 1,
+        seed: int | None = None,
+        refine_from: World | None = None,
+        refine_smoothness: float = 16.0,
+        gradients: bool = False,
     ) -> PluginResult:
         """Synchronous terrain generation (runs in thread pool)."""
         try:
-            # Initialize noise generator seed
-            if world.params.seed == 0:
-                osi.random_seed()
-            else:
-                osi.seed(seed=world.params.seed)
+            # Per-run noise generator; never touches opensimplex's module state,
+            # so concurrent generations cannot race on the seed
+            if seed is None:
+                seed = world.params.seed if world.params.seed != 0 else time.time_ns()
+            noise = self._make_noise(seed, noise_backend)
 
             radius = world.params.radius
             num_points = world.num_points
 
             # Initialize raw elevations array
             raw_elevations: NDArray[np.float64] = np.zeros(num_points, dtype=np.float64)
+            raw_gradient: NDArray[np.float64] | None = None
 
             # Pre-compute roughness and strength values for each octave
-            roughness_values: NDArray[np.float64] = np.array(
-                [(init_roughness * (roughness**i)) / radius for i in range(octaves)]
-            )
-            strength_values: NDArray[np.float64] = np.array(
-                [(init_strength * (persistence**i)) / radius for i in range(octaves)]
+            roughness_values, strength_values = self._octave_weights(
+                octaves, init_roughness, init_strength, roughness, persistence, radius
             )
 
             if progress_callback:
                 progress_callback(0.1, "Generating noise octaves")
 
-            # Generate noise for each octave
-            for i in range(octaves):
-                octave_progress = 0.1 + (0.7 * (i / octaves))
-                if progress_callback:
-                    progress_callback(octave_progress, f"Processing octave {i + 1}/{octaves}")
-
-                rough_verts: NDArray[np.float64] = world.mesh.points * roughness_values[i]
-                octave_elevations: NDArray[np.float64] = np.ones(num_points, dtype=np.float64)
-
-                # Generate noise for each vertex
-                for v in range(len(rough_verts)):
-                    octave_elevations[v] = osi.noise4(
-                        x=rough_verts[v][0],
-                        y=rough_verts[v][1],
-                        z=rough_verts[v][2],
-                        w=1,
-                    )
-
-                raw_elevations += octave_elevations * strength_values[i] * radius
-
-            # Store raw elevations
+            # Noise is sampled on the undeformed sphere, never on geometry warped
+            # by an earlier run, so values always agree with the noise cache keys
+            if refine_from is not None:
+                raw_elevations = self._refine_raw_elevations(
+                    world,
+                    refine_from,
+                    noise,
+                    roughness_values,
+                    strength_values,
+                    refine_smoothness,
+                    progress_callback,
+                )
+            elif gradients:
+                raw_elevations, raw_gradient = self._accumulate_octaves_with_gradient(
+                    world,
+                    noise,
+                    roughness_values,
+                    strength_values,
+                    workers,
+                    progress_callback,
+                )
+            elif self.noise_cache is not None:
+                raw_elevations = self._accumulate_cached_octaves(
+                    world,
+                    noise,
+                    roughness_values,
+                    strength_values,
+                    noise_backend,
+                    workers,
+                    progress_callback,
+                )
+            elif workers > 1 and isinstance(noise, SimplexNoise):
+                # Split vertices across worker processes via shared memory
+                raw_elevations = generate_raw_elevations_parallel(
+                    world.topology.points,
+                    noise.seed,
+                    roughness_values,
+                    strength_values,
+                    radius,
+                    workers,
+                    progress_callback,
+                )
+            else:
+                # Generate noise for each octave
+                for i in range(octaves):
+                    octave_progress = 0.1 + (0.7 * (i / octaves))
+                    if progress_callback:
+                        progress_callback(octave_progress, f"Processing octave {i + 1}/{octaves}")
+
+                    octave_elevations = self._octave_field(world.topology.points, roughness_values[i], noise)
+                    raw_elevations += octave_elevations * strength_values[i] * radius
+
+            # Store raw elevations, and derive the rest from the stored
+            # (float32) values: refinement inherits those, so refined and
+            # fully generated terrain stay identical
             world.add_data_layer("elevation_raw", raw_elevations, overwrite=True)
+            raw_elevations = world.get_data_layer("elevation_raw").astype(np.float64)
+            world.metadata["terrain"] = {
+                "octaves": octaves,
+                "init_roughness": init_roughness,
+                "init_strength": init_strength,
+                "roughness": roughness,
+                "persistence": persistence,
+                "noise_backend": noise_backend,
+                "seed": int(seed),
+            }
+            if refine_from is not None:
+                world.metadata["terrain"]["refined_from"] = str(refine_from.id)
 
             if progress_callback:
                 progress_callback(0.8, "Computing elevation scalars")
@@ -158,11 +307,6 @@ class TerrainGeneratorPlugin(SimulationPlugin):
             elevation_scalars = (raw_elevations + radius) / radius
             world.add_data_layer("elevation_scalars", elevation_scalars, overwrite=True)
 
-            # Apply scalars to mesh geometry
-            world.mesh.points[:, 0] *= elevation_scalars
-            world.mesh.points[:, 1] *= elevation_scalars
-            world.mesh.points[:, 2] *= elevation_scalars
-
             if progress_callback:
                 progress_callback(0.9, "Rescaling elevations")
 
@@ -176,20 +320,33 @@ class TerrainGeneratorPlugin(SimulationPlugin):
                 + world.params.zmin
             )
             world.add_data_layer("elevation", rescaled_elevations, overwrite=True)
+            world.metadata["terrain"]["scalar_range"] = [float(emin), float(emax)]
 
             # Create landform mask (land vs ocean)
             sea_level = world.params.zmin + (world.params.zmax - world.params.zmin) * world.params.ocean_percent
             landforms = rescaled_elevations >= sea_level
-            world.add_data_layer("landforms", landforms.astype(np.float64), overwrite=True)
+            world.add_data_layer("landforms", landforms, overwrite=True)
 
             if progress_callback:
-                progress_callback(0.95, "Computing normals and warping mesh")
-
-            # Compute normals
-            world.compute_normals()
-
-            # Warp mesh by elevations
-            world.warp_by_elevation(layer_name="elevation")
+                progress_callback(0.95, "Updating mesh geometry")
+
+            factor = -world.params.zscale
+            normals = None
+            if raw_gradient is not None:
+                slope, aspect, normals = self._surface_from_gradient(
+                    world,
+                    raw_gradient,
+                    elevation_scalars,
+                    rescaled_elevations,
+                    emin,
+                    emax,
+                    factor,
+                )
+                world.add_data_layer("slope", slope, overwrite=True)
+                world.add_data_layer("aspect", aspect, overwrite=True)
+
+            # Scale and warp the mesh by elevation in a single pass
+            world.update_geometry(layer_name="elevation", factor=factor, normals=normals)
 
             # Calculate statistics
             land_percent = np.sum(landforms) / num_points * 100
@@ -200,6 +357,7 @@ class TerrainGeneratorPlugin(SimulationPlugin):
                 "std": float(np.std(rescaled_elevations)),
                 "land_percent": float(land_percent),
                 "ocean_percent": float(100 - land_percent),
+                "seed": int(seed),
             }
 
             return PluginResult(
@@ -213,3 +371,409 @@ class TerrainGeneratorPlugin(SimulationPlugin):
                 success=False,
                 message=f"Terrain generation failed: {e}",
             )
+
+    def _accumulate_cached_octaves(
+        self,
+        world: World,
+        noise: SimplexNoise | osi.OpenSimplex,
+        roughness_values: NDArray[np.float64],
+        strength_values: NDArray[np.float64],
+        noise_backend: str,
+        workers: int,
+        progress_callback: Callable[[float, str], None] | None,
+    ) -> NDArray[np.float64]:
+        """Weighted octave sum using fields from the noise cache.
+
+        Missing octave fields are computed (in parallel if workers > 1) and
+        stored before summing. The sum runs in the same order as the uncached
+        loop, so results are bit-identical.
+
+        Returns:
+            Raw elevations array
+        """
+        cache = self.noise_cache
+        radius = world.params.radius
+        keys = [
+            cache.make_key(noise.get_seed(), world.params.recursion, radius, frequency, noise_backend)
+            for frequency in roughness_values
+        ]
+        fields = [cache.get(key) for key in keys]
+        missing = [i for i, field in enumerate(fields) if field is None]
+
+        if missing:
+            if workers > 1 and isinstance(noise, SimplexNoise):
+                computed = generate_octave_fields_parallel(
+                    world.topology.points,
+                    noise.seed,
+                    roughness_values[missing],
+                    workers,
+                    progress_callback,
+                )
+            else:
+                computed = []
+                for n, i in enumerate(missing):
+                    if progress_callback:
+                        progress_callback(
+                            0.1 + 0.7 * (n / len(missing)),
+                            f"Processing octave {i + 1}/{len(roughness_values)}",
+                        )
+                    computed.append(self._octave_field(world.topology.points, roughness_values[i], noise))
+
+            for i, field in zip(missing, computed):
+                cache.put(keys[i], field)
+                fields[i] = field
+        elif progress_callback:
+            progress_callback(0.8, "Reused cached noise octaves")
+
+        raw_elevations: NDArray[np.float64] = np.zeros(world.num_points, dtype=np.float64)
+        for i, field in enumerate(fields):
+            raw_elevations += field * strength_values[i] * radius
+
+        return raw_elevations
+
+    def _accumulate_octaves_with_gradient(
+        self,
+        world: World,
+        noise: SimplexNoise,
+        roughness_values: NDArray[np.float64],
+        strength_values: NDArray[np.float64],
+        workers: int,
+        progress_callback: Callable[[float, str], None] | None,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Raw elevations and their analytic spatial gradient.
+
+        Returns:
+            Tuple of (raw elevations (N,), gradients (N, 3) in meters per meter)
+        """
+        radius = world.params.radius
+        if workers > 1:
+            return generate_raw_elevations_with_gradient_parallel(
+                world.topology.points,
+                noise.seed,
+                roughness_values,
+                strength_values,
+                radius,
+                workers,
+                progress_callback,
+            )
+
+        octaves = len(roughness_values)
+        raw_elevations = np.zeros(world.num_points, dtype=np.float64)
+        raw_gradient = np.zeros((world.num_points, 3), dtype=np.float64)
+        for i in range(octaves):
+            if progress_callback:
+                progress_callback(0.1 + 0.7 * (i / octaves), f"Processing octave {i + 1}/{octaves}")
+            accumulate_octaves(
+                noise,
+                world.topology.points,
+                roughness_values[i : i + 1],
+                strength_values[i : i + 1],
+                radius,
+                raw_elevations,
+                raw_gradient,
+            )
+        return raw_elevations, raw_gradient
+
+    @staticmethod
+    def _surface_from_gradient(
+        world: World,
+        raw_gradient: NDArray[np.float64],
+        elevation_scalars: NDArray[np.float64],
+        elevations: NDArray[np.float64],
+        emin: float,
+        emax: float,
+        factor: float,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Derive slope, aspect and final-geometry normals from noise gradients.
+
+        Args:
+            world: World whose mesh points are still the undeformed sphere
+            raw_gradient: (N, 3) gradient of elevation_raw
+            elevation_scalars: Radial scale per point
+            elevations: Rescaled elevation layer
+            emin: Minimum elevation scalar used for rescaling
+            emax: Maximum elevation scalar used for rescaling
+            factor: Warping factor passed to update_geometry()
+
+        Returns:
+            Tuple of (slope in degrees, aspect in degrees clockwise from north,
+            unit normals (N, 3))
+        """
+        radius = world.params.radius
+        points = world.topology.points
+        up = points / np.linalg.norm(points, axis=1, keepdims=True)
+
+        # Surface gradient: drop the radial component
+        tangent = raw_gradient - np.einsum("ij,ij->i", raw_gradient, up)[:, None] * up
+
+        # The elevation layer is a linear rescale of elevation_raw
+        elevation_per_raw = (world.params.zmax - world.params.zmin) / (radius * (emax - emin))
+        slope = np.degrees(np.arctan(elevation_per_raw * np.linalg.norm(tangent, axis=1)))
+
+        lon = np.arctan2(up[:, 1], up[:, 0])
+        east = np.stack([-np.sin(lon), np.cos(lon), np.zeros_like(lon)], axis=1)
+        north = np.cross(up, east)
+        aspect = (
+            np.degrees(
+                np.arctan2(
+                    -np.einsum("ij,ij->i", tangent, east),
+                    -np.einsum("ij,ij->i", tangent, north),
+                )
+            )
+            % 360.0
+        )
+
+        # Final radius is radius * scalar + factor * elevation; for r(u) over
+        # the unit sphere the normal is u - grad_S(r) / r
+        displacement_gradient = tangent * (1.0 + factor * elevation_per_raw)
+        final_radius = radius * elevation_scalars + factor * elevations
+        normals = up - (radius / final_radius)[:, None] * displacement_gradient
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+        return slope, aspect, normals
+
+    async def generate_patch(
+        self,
+        world: World,
+        name: str,
+        lat_range: tuple[float, float],
+        lon_range: tuple[float, float],
+        recursion: int,
+        extra_octaves: int = 0,
+    ) -> WorldPatch:
+        """Generate a high-resolution terrain patch for a lat/lon region.
+
+        The patch is sampled from the same seeded noise field as the world
+        (settings from world.metadata["terrain"]) and rescaled with the
+        world's elevation range, so it lines up with the global terrain.
+        Only faces near the region are subdivided, so cost scales with the
+        region's area.
+
+        Args:
+            world: World with generated terrain
+            name: Patch name (stored under world.patches)
+            lat_range: (south, north) latitude bounds in degrees
+            lon_range: (west, east) longitude bounds in degrees
+            recursion: Subdivision level of the patch
+            extra_octaves: Additional finer octaves continuing the world's
+                roughness/persistence sequence, for detail the global mesh
+                cannot resolve
+
+        Returns:
+            Patch with elevation_raw, elevation and landforms layers
+
+        Raises:
+            ValueError: If the world has no terrain or the region is invalid
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            self._generate_patch_sync,
+            world,
+            name,
+            lat_range,
+            lon_range,
+            recursion,
+            extra_octaves,
+        )
+
+    def _generate_patch_sync(
+        self,
+        world: World,
+        name: str,
+        lat_range: tuple[float, float],
+        lon_range: tuple[float, float],
+        recursion: int,
+        extra_octaves: int,
+    ) -> WorldPatch:
+        """Synchronous patch generation (runs in thread pool)."""
+        terrain = world.metadata.get("terrain")
+        if not terrain or "scalar_range" not in terrain:
+            msg = "World has no terrain; run terrain generation first"
+            raise ValueError(msg)
+        if extra_octaves < 0:
+            msg = f"extra_octaves must be non-negative, got {extra_octaves}"
+            raise ValueError(msg)
+
+        patch = world.create_patch(name, lat_range, lon_range, recursion)
+
+        radius = world.params.radius
+        noise = self._make_noise(terrain["seed"], terrain["noise_backend"])
+        roughness_values, strength_values = self._octave_weights(
+            terrain["octaves"] + extra_octaves,
+            terrain["init_roughness"],
+            terrain["init_strength"],
+            terrain["roughness"],
+            terrain["persistence"],
+            radius,
+        )
+
+        raw_elevations: NDArray[np.float64] = np.zeros(patch.num_points, dtype=np.float64)
+        for i in range(len(roughness_values)):
+            octave_elevations = self._octave_field(patch.points, roughness_values[i], noise)
+            raw_elevations += octave_elevations * strength_values[i] * radius
+
+        # Same scalar-to-elevation mapping as the global world
+        emin, emax = terrain["scalar_range"]
+        elevation_scalars = (raw_elevations + radius) / radius
+        elevations = (
+            ((elevation_scalars - emin) / (emax - emin)) * (world.params.zmax - world.params.zmin)
+            + world.params.zmin
+        )
+        sea_level = world.params.zmin + (world.params.zmax - world.params.zmin) * world.params.ocean_percent
+
+        patch.add_data_layer("elevation_raw", raw_elevations, overwrite=True)
+        patch.add_data_layer("elevation", elevations, overwrite=True)
+        patch.add_data_layer("landforms", elevations >= sea_level, overwrite=True)
+
+        return patch
+
+    @staticmethod
+    def _octave_weights(
+        octaves: int,
+        init_roughness: float,
+        init_strength: float,
+        roughness: float,
+        persistence: float,
+        radius: float,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Per-octave frequency and amplitude multipliers.
+
+        Returns:
+            Tuple of (roughness_values, strength_values)
+        """
+        roughness_values: NDArray[np.float64] = np.array(
+            [(init_roughness * (roughness**i)) / radius for i in range(octaves)]
+        )
+        strength_values: NDArray[np.float64] = np.array(
+            [(init_strength * (persistence**i)) / radius for i in range(octaves)]
+        )
+        return roughness_values, strength_values
+
+    def _refine_raw_elevations(
+        self,
+        world: World,
+        parent: World,
+        noise: SimplexNoise | osi.OpenSimplex,
+        roughness_values: NDArray[np.float64],
+        strength_values: NDArray[np.float64],
+        smoothness: float,
+        progress_callback: Callable[[float, str], None] | None,
+    ) -> NDArray[np.float64]:
+        """Upscale a lower-recursion world's raw elevations.
+
+        Inherited vertices copy the parent's values. Octaves too fine for the
+        parent mesh are evaluated at the new vertices only; coarser octaves
+        are evaluated at the parent vertices and interpolated to the new ones
+        by recursive midpoint averaging (linear interpolation over the parent
+        triangles).
+
+        Returns:
+            Raw elevations array
+        """
+        if parent.params.radius != world.params.radius:
+            msg = "refine_from world has a different radius"
+            raise ValueError(msg)
+        if parent.params.recursion >= world.params.recursion:
+            msg = (
+                f"refine_from recursion {parent.params.recursion} must be lower than "
+                f"{world.params.recursion}"
+            )
+            raise ValueError(msg)
+
+        radius = world.params.radius
+        num_parent = parent.num_points
+        points = world.topology.points
+
+        # An octave is resolved by the parent mesh if its wavelength spans
+        # `smoothness` parent edges
+        parent_edge = radius * ICOSAHEDRON_EDGE / 2**parent.params.recursion
+        wavelengths = 1.0 / roughness_values
+        if smoothness > 0:
+            smooth = wavelengths >= smoothness * parent_edge
+        else:
+            smooth = np.zeros(len(wavelengths), dtype=bool)
+
+        raw_elevations: NDArray[np.float64] = np.zeros(world.num_points, dtype=np.float64)
+        raw_elevations[:num_parent] = parent.get_data_layer("elevation_raw")
+
+        if smooth.any():
+            if progress_callback:
+                progress_callback(0.15, "Interpolating coarse octaves from parent")
+
+            coarse: NDArray[np.float64] = np.zeros(world.num_points, dtype=np.float64)
+            for i in np.flatnonzero(smooth):
+                field = self._octave_field(points[:num_parent], roughness_values[i], noise)
+                coarse[:num_parent] += field * strength_values[i] * radius
+
+            start = num_parent
+            for parents in world.subdivision_parents(parent.params.recursion):
+                stop = start + len(parents)
+                coarse[start:stop] = 0.5 * (coarse[parents[:, 0]] + coarse[parents[:, 1]])
+                start = stop
+
+            raw_elevations[num_parent:] = coarse[num_parent:]
+
+        fine = np.flatnonzero(~smooth)
+        for n, i in enumerate(fine):
+            if progress_callback:
+                progress_callback(0.2 + 0.6 * (n / len(fine)), f"Refining octave {i + 1}/{len(smooth)}")
+
+            field = self._octave_field(points[num_parent:], roughness_values[i], noise)
+            raw_elevations[num_parent:] += field * strength_values[i] * radius
+
+        return raw_elevations
+
+    def _octave_field(
+        self,
+        points: NDArray[np.float64],
+        frequency: float,
+        noise: SimplexNoise | osi.OpenSimplex,
+    ) -> NDArray[np.float64]:
+        """Raw noise for one octave."""
+        rough_verts: NDArray[np.float64] = points * frequency
+
+        if isinstance(noise, SimplexNoise):
+            return noise.noise4(rough_verts, w=1.0)
+        return self._scalar_noise4(rough_verts, noise)
+
+    @staticmethod
+    def _make_noise(seed: int, noise_backend: str) -> SimplexNoise | osi.OpenSimplex:
+        """Create the noise generator for a single run.
+
+        Args:
+            seed: Noise seed
+            noise_backend: "vectorized" or "scalar"
+
+        Returns:
+            Vectorized kernel, or an opensimplex instance for the reference path
+        """
+        if noise_backend == "vectorized":
+            return SimplexNoise(seed)
+        return osi.OpenSimplex(seed)
+
+    @staticmethod
+    def _scalar_noise4(
+        points: NDArray[np.float64],
+        generator: osi.OpenSimplex,
+    ) -> NDArray[np.float64]:
+        """Reference per-vertex noise using an opensimplex instance.
+
+        Args:
+            points: (N, 3) array of scaled vertex positions
+            generator: Seeded opensimplex generator
+
+        Returns:
+            Array of N noise values
+        """
+        values: NDArray[np.float64] = np.ones(len(points), dtype=np.float64)
+
+        for v in range(len(points)):
+            values[v] = generator.noise4(
+                x=points[v][0],
+                y=points[v][1],
+                z=points[v][2],
+                w=1,
+            )
+
+        return values
@@ -0,0 +1,280 @@
+"""Process-parallel octave accumulation for terrain generation.
+
+Vertex positions and the raw elevation accumulator live in shared memory, so
+worker processes read and write them in place instead of pickling arrays.
+Each worker handles a contiguous chunk of vertices and runs every octave in
+the same order as the serial loop, which keeps results bit-identical to
+serial execution for a given seed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from lathe.plugins.terrain.noise import SimplexNoise
+
+# Chunks submitted per worker; more than one evens out load imbalance
+CHUNKS_PER_WORKER = 4
+
+
+def accumulate_octaves(
+    noise: SimplexNoise,
+    points: NDArray[np.float64],
+    roughness_values: NDArray[np.float64],
+    strength_values: NDArray[np.float64],
+    radius: float,
+    out: NDArray[np.float64],
+    gradient_out: NDArray[np.float64] | None = None,
+) -> None:
+    """Add the weighted sum of all noise octaves into ``out``.
+
+    Args:
+        noise: Seeded noise generator
+        points: (N, 3) vertex positions
+        roughness_values: Per-octave frequency multipliers
+        strength_values: Per-octave amplitude multipliers
+        radius: World radius in meters
+        out: Length-N accumulator, updated in place
+        gradient_out: Optional (N, 3) accumulator for the spatial gradient of
+            the weighted sum, updated in place
+    """
+    for i in range(len(roughness_values)):
+        rough_verts = points * roughness_values[i]
+        if gradient_out is None:
+            out += noise.noise4(rough_verts, w=1.0) * strength_values[i] * radius
+        else:
+            values, gradients = noise.noise4_grad(rough_verts, w=1.0)
+            out += values * strength_values[i] * radius
+            gradient_out += gradients * (roughness_values[i] * strength_values[i] * radius)
+
+
+def _evaluate_chunk(
+    points_name: str,
+    out_name: str,
+    num_points: int,
+    start: int,
+    stop: int,
+    seed: int,
+    roughness_values: NDArray[np.float64],
+    strength_values: NDArray[np.float64] | None,
+    radius: float,
+    gradients: bool = False,
+) -> int:
+    """Worker entry point: evaluate octaves for one vertex chunk.
+
+    When ``strength_values`` is given the octaves are accumulated into a
+    length-N output, or an (N, 4) output of value and x, y, z gradient when
+    ``gradients`` is set; otherwise each octave's raw field is written to its
+    own row of an (octaves, N) output.
+
+    Returns:
+        Number of vertices processed
+    """
+    points_shm = shared_memory.SharedMemory(name=points_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    try:
+        points = np.ndarray((num_points, 3), dtype=np.float64, buffer=points_shm.buf)
+        noise = SimplexNoise(seed)
+
+        if strength_values is not None and gradients:
+            out = np.ndarray((num_points, 4), dtype=np.float64, buffer=out_shm.buf)
+            accumulate_octaves(
+                noise,
+                points[start:stop],
+                roughness_values,
+                strength_values,
+                radius,
+                out[start:stop, 0],
+                out[start:stop, 1:],
+            )
+        elif strength_values is not None:
+            out = np.ndarray((num_points,), dtype=np.float64, buffer=out_shm.buf)
+            accumulate_octaves(
+                noise,
+                points[start:stop],
+                roughness_values,
+                strength_values,
+                radius,
+                out[start:stop],
+            )
+        else:
+            out = np.ndarray((len(roughness_values), num_points), dtype=np.float64, buffer=out_shm.buf)
+            for i, frequency in enumerate(roughness_values):
+                out[i, start:stop] = noise.noise4(points[start:stop] * frequency, w=1.0)
+
+        # Drop views before closing the shared buffers
+        del points, out
+    finally:
+        points_shm.close()
+        out_shm.close()
+
+    return stop - start
+
+
+def generate_raw_elevations_parallel(
+    points: NDArray[np.float64],
+    seed: int,
+    roughness_values: NDArray[np.float64],
+    strength_values: NDArray[np.float64],
+    radius: float,
+    workers: int,
+    progress_callback: Callable[[float, str], None] | None = None,
+) -> NDArray[np.float64]:
+    """Compute raw elevations by splitting vertices across a process pool.
+
+    Args:
+        points: (N, 3) vertex positions
+        seed: Noise seed
+        roughness_values: Per-octave frequency multipliers
+        strength_values: Per-octave amplitude multipliers
+        radius: World radius in meters
+        workers: Number of worker processes
+        progress_callback: Optional callback, reported between 0.1 and 0.8
+
+    Returns:
+        Length-N array of raw elevations
+    """
+    return _run_chunked(
+        points,
+        (len(points),),
+        seed,
+        roughness_values,
+        strength_values,
+        radius,
+        workers,
+        progress_callback,
+    )
+
+
+def generate_raw_elevations_with_gradient_parallel(
+    points: NDArray[np.float64],
+    seed: int,
+    roughness_values: NDArray[np.float64],
+    strength_values: NDArray[np.float64],
+    radius: float,
+    workers: int,
+    progress_callback: Callable[[float, str], None] | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Compute raw elevations and their analytic gradient across a process pool.
+
+    Args:
+        points: (N, 3) vertex positions
+        seed: Noise seed
+        roughness_values: Per-octave frequency multipliers
+        strength_values: Per-octave amplitude multipliers
+        radius: World radius in meters
+        workers: Number of worker processes
+        progress_callback: Optional callback, reported between 0.1 and 0.8
+
+    Returns:
+        Tuple of (raw elevations (N,), gradients (N, 3))
+    """
+    out = _run_chunked(
+        points,
+        (len(points), 4),
+        seed,
+        roughness_values,
+        strength_values,
+        radius,
+        workers,
+        progress_callback,
+        gradients=True,
+    )
+    return out[:, 0].copy(), out[:, 1:].copy()
+
+
+def generate_octave_fields_parallel(
+    points: NDArray[np.float64],
+    seed: int,
+    roughness_values: NDArray[np.float64],
+    workers: int,
+    progress_callback: Callable[[float, str], None] | None = None,
+) -> NDArray[np.float64]:
+    """Compute each octave's raw noise field across a process pool.
+
+    Args:
+        points: (N, 3) vertex positions
+        seed: Noise seed
+        roughness_values: Per-octave frequency multipliers
+        workers: Number of worker processes
+        progress_callback: Optional callback, reported between 0.1 and 0.8
+
+    Returns:
+        (octaves, N) array of noise values
+    """
+    return _run_chunked(
+        points,
+        (len(roughness_values), len(points)),
+        seed,
+        roughness_values,
+        None,
+        0.0,
+        workers,
+        progress_callback,
+    )
+
+
+def _run_chunked(
+    points: NDArray[np.float64],
+    out_shape: tuple[int, ...],
+    seed: int,
+    roughness_values: NDArray[np.float64],
+    strength_values: NDArray[np.float64] | None,
+    radius: float,
+    workers: int,
+    progress_callback: Callable[[float, str], None] | None,
+    gradients: bool = False,
+) -> NDArray[np.float64]:
+    """Share inputs and output with a process pool and run _evaluate_chunk."""
+    num_points = len(points)
+    bounds = np.linspace(0, num_points, workers * CHUNKS_PER_WORKER + 1, dtype=np.int64)
+    out_bytes = int(np.prod(out_shape)) * 8
+
+    points_shm = shared_memory.SharedMemory(create=True, size=max(points.nbytes, 1))
+    out_shm = shared_memory.SharedMemory(create=True, size=max(out_bytes, 1))
+    try:
+        shared_points = np.ndarray((num_points, 3), dtype=np.float64, buffer=points_shm.buf)
+        shared_points[:] = points
+        shared_out = np.ndarray(out_shape, dtype=np.float64, buffer=out_shm.buf)
+        shared_out[:] = 0.0
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _evaluate_chunk,
+                    points_shm.name,
+                    out_shm.name,
+                    num_points,
+                    int(start),
+                    int(stop),
+                    seed,
+                    roughness_values,
+                    strength_values,
+                    radius,
+                    gradients,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+
+            done = 0
+            for future in as_completed(futures):
+                done += future.result()
+                if progress_callback:
+                    progress_callback(
+                        0.1 + 0.7 * (done / num_points),
+                        f"Processed {done}/{num_points} vertices",
+                    )
+
+        result = shared_out.copy()
+        del shared_points, shared_out
+    finally:
+        points_shm.close()
+        points_shm.unlink()
+        out_shm.close()
+        out_shm.unlink()
+
+    return result
@@ -9,7 +9,8 @@ import h5py
 import numpy as np
 from numpy.typing import NDArray
 
-from lathe.models.world import World, WorldParameters
+from lathe.models.layers import coerce_layer, layer_spec
+from lathe.models.world import World, WorldParameters, WorldPatch
 
 
 class MeshStore:
@@ -21,10 +22,21 @@ class MeshStore:
             faces           - Mx3 array of face indices
             original_points - Nx3 array of original sphere points
         /scalars/
-            <layer_name>    - N-length arrays for each data layer
+            <layer_name>    - N-length arrays for each data layer, in the
+                              layer's dtype (lathe.models.layers); masks are
+                              bitpacked (attrs: encoding, length) and
+                              categorical layers carry their categories;
+                              (attrs: digest, producer - see LayerRecord)
         /metadata/
             parameters      - JSON string of WorldParameters
             world_metadata  - JSON string of world.metadata dict
+        /patches/<name>/    - Regional high-resolution patches
+            points          - Px3 array of patch vertex positions
+            faces           - Qx3 array of patch face indices
+            scalars/<layer> - P-length arrays for each patch layer
+            (attrs: lat_range, lon_range, recursion)
+        /timelapse/<name>/  - Simulation frames and checkpoints (see
+                              lathe.storage.timelapse), kept across saves
     """
 
     def __init__(self, storage_dir: Path | str = "./data/worlds"):
@@ -47,6 +59,20 @@ class MeshStore:
         """
         return self.storage_dir / f"world_{world_id}.h5"
 
+    def world_path(self, world_id: UUID) -> Path:
+        """Path of a world's HDF5 file, whether or not it exists yet.
+
+        Simulations can record time-lapse data into this file before the
+        world itself is saved.
+
+        Args:
+            world_id: World UUID
+
+        Returns:
+            Path to HDF5 file
+        """
+        return self._get_file_path(world_id)
+
     def save_world(self, world: World, compress: bool = True) -> Path:
         """Save a world to HDF5.
 
@@ -62,7 +88,9 @@ class MeshStore:
         compression = "gzip" if compress else None
         compression_opts = 9 if compress else None
 
-        with h5py.File(file_path, "w") as f:
+        # Write a fresh file and swap it in, keeping any time-lapse data
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+        with h5py.File(tmp_path, "w") as f:
             # Create groups
             mesh_group = f.create_group("mesh")
             scalars_group = f.create_group("scalars")
@@ -71,16 +99,15 @@ class MeshStore:
             # Save mesh geometry
             mesh_group.create_dataset(
                 "points",
-                data=world.mesh.points,
+                data=world.points,
                 compression=compression,
                 compression_opts=compression_opts,
             )
 
-            # Save faces (convert to numpy array)
-            faces_array = self._extract_faces(world)
+            # Save faces
             mesh_group.create_dataset(
                 "faces",
-                data=faces_array,
+                data=world.faces,
                 compression=compression,
                 compression_opts=compression_opts,
             )
@@ -97,12 +124,17 @@ class MeshStore:
             for layer_name in world.list_data_layers():
                 layer_data = world.get_data_layer(layer_name)
                 if layer_data is not None:
-                    scalars_group.create_dataset(
-                        layer_name,
-                        data=layer_data,
-                        compression=compression,
-                        compression_opts=compression_opts,
-                    )
+                    dataset = _write_layer(scalars_group, layer_name, layer_data, compression, compression_opts)
+                    dataset.attrs["digest"] = world.layer_digest(layer_name)
+                    producer = world.layer_records[layer_name].producer
+                    if producer is not None:
+                        dataset.attrs["producer"] = producer
+
+            # Save regional patches
+            if world.patches:
+                patches_group = f.create_group("patches")
+                for patch in world.patches.values():
+                    self._save_patch(patches_group, patch, compression, compression_opts)
 
             # Save metadata
             params_dict = {
@@ -121,9 +153,15 @@ class MeshStore:
             metadata_group.attrs["world_id"] = str(world.id)
             metadata_group.attrs["world_metadata"] = json.dumps(
                 world.metadata,
-                default=str,  # Convert non-serializable types to strings
+                default=_json_default,
             )
 
+            if file_path.exists():
+                with h5py.File(file_path, "r") as previous:
+                    if "timelapse" in previous:
+                        previous.copy(previous["timelapse"], f)
+
+        tmp_path.replace(file_path)
         return file_path
 
     def load_world(self, world_id: UUID) -> World:
@@ -154,27 +192,39 @@ class MeshStore:
             world = World(params=params, world_id=world_id)
 
             # Load mesh geometry
-            world.mesh.points[:] = f["mesh/points"][:]
+            world.set_points(f["mesh/points"][:])
 
-            # Note: We don't reload faces as PyVista creates them automatically
-            # based on the Icosphere topology
+            # Faces are not read back: the world takes them from the shared
+            # topology for its recursion (world.faces), and the stored
+            # mesh/faces dataset serves file summaries and external readers
 
-            # Load original points
-            world._original_points = f["mesh/original_points"][:]
+            # Original points come from the shared topology, which matches
+            # the stored mesh/original_points for the same parameters
 
             # Load all scalar data layers
             if "scalars" in f:
-                for layer_name in f["scalars"].keys():
-                    layer_data = f[f"scalars/{layer_name}"][:]
-                    world.add_data_layer(layer_name, layer_data, overwrite=True)
+                for layer_name, dataset in f["scalars"].items():
+                    world.add_data_layer(
+                        layer_name,
+                        _read_layer(dataset),
+                        overwrite=True,
+                        producer=dataset.attrs.get("producer"),
+                    )
+                    world.layer_records[layer_name].digest = dataset.attrs.get("digest")
+
+            # Load regional patches
+            if "patches" in f:
+                for patch_name, patch_group in f["patches"].items():
+                    world.patches[patch_name] = self._load_patch(patch_name, patch_group)
 
             # Load metadata
             if "world_metadata" in f["metadata"].attrs:
                 metadata_json = f["metadata"].attrs["world_metadata"]
                 world.metadata = json.loads(metadata_json)
 
-            # Recompute normals
-            world.compute_normals()
+            # Normals are saved with the layers; compute them for older files
+            if not world.has_data_layer("Normals"):
+                world.compute_normals()
 
         return world
 
@@ -228,6 +278,8 @@ class MeshStore:
                             "file_size_mb": file_path.stat().st_size / (1024 * 1024),
                             "num_points": f["mesh/points"].shape[0],
                             "data_layers": list(f["scalars"].keys()) if "scalars" in f else [],
+                            "patches": list(f["patches"].keys()) if "patches" in f else [],
+                            "timelapse": list(f["timelapse"].keys()) if "timelapse" in f else [],
                         }
                     )
             except Exception as e:
@@ -267,35 +319,72 @@ class MeshStore:
                     "num_points": f["mesh/points"].shape[0],
                     "num_faces": f["mesh/faces"].shape[0] if "mesh/faces" in f else 0,
                     "data_layers": list(f["scalars"].keys()) if "scalars" in f else [],
+                    "patches": list(f["patches"].keys()) if "patches" in f else [],
+                    "timelapse": list(f["timelapse"].keys()) if "timelapse" in f else [],
                 }
         except Exception as e:
             print(f"Error reading world info: {e}")
             return None
 
-    def _extract_faces(self, world: World) -> NDArray[np.int64]:
-        """Extract face indices from PyVista mesh.
+    def _save_patch(
+        self,
+        patches_group: h5py.Group,
+        patch: WorldPatch,
+        compression: str | None,
+        compression_opts: int | None,
+    ) -> None:
+        """Write one patch under /patches/<name>.
 
         Args:
-            world: World with mesh
-
-        Returns:
-            Nx3 array of face indices
+            patches_group: The /patches group
+            patch: Patch to save
+            compression: HDF5 compression filter
+            compression_opts: Compression level
         """
-        # PyVista stores faces as [n_points, i1, i2, ..., in, n_points, ...]
-        # We need to extract just the triangle indices
-        faces_flat = world.mesh.faces
-        n_faces = world.num_faces
-
-        faces_array = np.zeros((n_faces, 3), dtype=np.int64)
+        group = patches_group.create_group(patch.name)
+        group.attrs["lat_range"] = patch.lat_range
+        group.attrs["lon_range"] = patch.lon_range
+        group.attrs["recursion"] = patch.recursion
+
+        group.create_dataset(
+            "points",
+            data=patch.points,
+            compression=compression,
+            compression_opts=compression_opts,
+        )
+        group.create_dataset(
+            "faces",
+            data=patch.faces,
+            compression=compression,
+            compression_opts=compression_opts,
+        )
+
+        scalars_group = group.create_group("scalars")
+        for layer_name, layer_data in patch.layers.items():
+            _write_layer(scalars_group, layer_name, layer_data, compression, compression_opts)
+
+    def _load_patch(self, name: str, group: h5py.Group) -> WorldPatch:
+        """Read one patch from its /patches/<name> group.
 
-        idx = 0
-        for i in range(n_faces):
-            n_points = faces_flat[idx]
-            if n_points == 3:  # Triangle
-                faces_array[i] = faces_flat[idx + 1 : idx + 4]
-            idx += n_points + 1
+        Args:
+            name: Patch name
+            group: The patch's HDF5 group
 
-        return faces_array
+        Returns:
+            Loaded WorldPatch
+        """
+        patch = WorldPatch(
+            name=name,
+            lat_range=tuple(float(v) for v in group.attrs["lat_range"]),
+            lon_range=tuple(float(v) for v in group.attrs["lon_range"]),
+            recursion=int(group.attrs["recursion"]),
+            points=group["points"][:],
+            faces=group["faces"][:],
+        )
+        if "scalars" in group:
+            for layer_name, dataset in group["scalars"].items():
+                patch.add_data_layer(layer_name, _read_layer(dataset), overwrite=True)
+        return patch
 
     def export_to_vtk(self, world_id: UUID, output_path: Path | str) -> None:
         """Export a world to VTK format for external visualization.
@@ -305,13 +394,13 @@ class MeshStore:
             output_path: Path to output VTK file
         """
         world = self.load_world(world_id)
-        world.mesh.save(str(output_path))
+        world.to_polydata().save(str(output_path))
 
     def get_data_layer(
         self,
         world_id: UUID,
         layer_name: str,
-    ) -> NDArray[np.float64] | None:
+    ) -> NDArray | None:
         """Load a single data layer without loading entire world.
 
         Args:
@@ -319,7 +408,9 @@ class MeshStore:
             layer_name: Name of data layer
 
         Returns:
-            Data array or None if not found
+            Data array in the layer's dtype (files written before the
+            layer had a spec are cast on read, as by load_world()), or
+            None if not found
         """
         file_path = self._get_file_path(world_id)
 
@@ -329,8 +420,112 @@ class MeshStore:
         try:
             with h5py.File(file_path, "r") as f:
                 if f"scalars/{layer_name}" in f:
-                    return f[f"scalars/{layer_name}"][:]
+                    return coerce_layer(layer_name, _read_layer(f[f"scalars/{layer_name}"]))
         except Exception as e:
             print(f"Error loading data layer: {e}")
 
         return None
+
+    def get_timelapse_steps(self, world_id: UUID, name: str) -> NDArray[np.int64] | None:
+        """Step index of every recorded frame of a time-lapse.
+
+        Args:
+            world_id: World UUID
+            name: Time-lapse name (the simulation plugin name)
+
+        Returns:
+            Array of steps or None if not found
+        """
+        file_path = self._get_file_path(world_id)
+
+        if not file_path.exists():
+            return None
+
+        with h5py.File(file_path, "r") as f:
+            if f"timelapse/{name}/steps" in f:
+                return f[f"timelapse/{name}/steps"][:]
+
+        return None
+
+    def get_timelapse_frame(
+        self,
+        world_id: UUID,
+        name: str,
+        layer_name: str,
+        frame: int,
+    ) -> NDArray | None:
+        """Load one frame of a time-lapse layer.
+
+        Only the requested frame is read from disk, so playback can step
+        through long runs without loading them.
+
+        Args:
+            world_id: World UUID
+            name: Time-lapse name (the simulation plugin name)
+            layer_name: Frame layer, e.g. "elevation"
+            frame: Frame index (negative counts from the end)
+
+        Returns:
+            Per-point array or None if not found
+        """
+        file_path = self._get_file_path(world_id)
+
+        if not file_path.exists():
+            return None
+
+        with h5py.File(file_path, "r") as f:
+            key = f"timelapse/{name}/{layer_name}"
+            if key in f:
+                # Cast frames from older files to the layer spec dtype
+                return coerce_layer(layer_name, f[key][frame])
+
+        return None
+
+
+def _write_layer(
+    group: h5py.Group,
+    name: str,
+    data: NDArray,
+    compression: str | None,
+    compression_opts: int | None,
+) -> h5py.Dataset:
+    """Write a data layer, bitpacking masks and recording categories."""
+    attrs: dict[str, Any] = {}
+    if data.dtype == np.bool_:
+        attrs = {"encoding": "bitpacked", "length": len(data)}
+        data = np.packbits(data)
+
+    dataset = group.create_dataset(
+        name,
+        data=data,
+        compression=compression,
+        compression_opts=compression_opts,
+    )
+    dataset.attrs.update(attrs)
+
+    spec = layer_spec(name)
+    if spec is not None and spec.categories is not None:
+        dataset.attrs["categories"] = json.dumps(spec.categories)
+    return dataset
+
+
+def _read_layer(dataset: h5py.Dataset) -> NDArray:
+    """Read a data layer written by _write_layer() (or a plain dataset)."""
+    if dataset.attrs.get("encoding") == "bitpacked":
+        return np.unpackbits(dataset[:], count=int(dataset.attrs["length"])).astype(np.bool_)
+    return dataset[:]
+
+
+def _json_default(value: Any) -> Any:
+    """Convert metadata values that json cannot serialize.
+
+    Structured arrays become lists of row dicts, other arrays and NumPy
+    scalars become plain Python values, and anything else falls back to str.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.names is not None:
+            return [dict(zip(value.dtype.names, row.tolist())) for row in value]
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
@@ -0,0 +1,165 @@
+"""Time-lapse snapshots and resumable checkpoints in HDF5 files.
+
+Long simulations periodically append per-point layers as frames and replace
+a checkpoint holding everything needed to continue the run. The data lives
+in its own group, so it can share a file with MeshStore's world data
+(MeshStore keeps it when the world is saved again).
+
+HDF5 structure:
+    /timelapse/<name>/
+        steps           - (F,) step index of each frame
+        <layer>         - (F, N) frames, chunked along the point axis
+        checkpoint_0/   - Two checkpoint slots, written alternately in
+        checkpoint_1/     place so a crash mid-write leaves the other intact
+            <array>     - State arrays
+            (attrs: step, state - JSON of scalar state)
+        (attrs: num_points, params - JSON of the run parameters,
+                checkpoint - name of the slot holding the latest state)
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import h5py
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+# Upper bound on points per frame chunk (float32: 512 KiB)
+FRAME_CHUNK_POINTS = 131072
+
+
+class TimelapseWriter:
+    """Appends frames and checkpoints for one simulation run."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        name: str,
+        num_points: int,
+        layers: dict[str, DTypeLike],
+        params: dict[str, Any],
+    ):
+        """Initialize the writer.
+
+        Nothing is written until reset() or append() is called.
+
+        Args:
+            path: HDF5 file (created if missing)
+            name: Run name, the group under /timelapse
+            num_points: Points per frame
+            layers: Frame layer names and their stored dtypes
+            params: Parameters that must match for a checkpoint to be resumed
+        """
+        self.path = Path(path)
+        self.name = name
+        self.num_points = num_points
+        self.layers = {layer: np.dtype(dtype) for layer, dtype in layers.items()}
+        self.params_json = json.dumps(params, sort_keys=True, default=str)
+
+    @property
+    def group_name(self) -> str:
+        """Path of the run's group inside the file."""
+        return f"timelapse/{self.name}"
+
+    def load_checkpoint(self) -> tuple[int, dict[str, NDArray], dict[str, Any]] | None:
+        """Read the latest checkpoint and drop frames recorded after it.
+
+        Returns:
+            Tuple of (step, arrays, state) or None if there is no checkpoint
+
+        Raises:
+            ValueError: If the checkpoint was written by an incompatible run
+        """
+        if not self.path.exists():
+            return None
+
+        with h5py.File(self.path, "a") as f:
+            group = f.get(self.group_name)
+            if group is None or "checkpoint" not in group.attrs:
+                return None
+
+            if group.attrs["num_points"] != self.num_points or group.attrs["params"] != self.params_json:
+                msg = f"Checkpoint '{self.name}' in {self.path} was written with different parameters"
+                raise ValueError(msg)
+
+            checkpoint = group[group.attrs["checkpoint"]]
+            step = int(checkpoint.attrs["step"])
+            arrays = {key: dataset[:] for key, dataset in checkpoint.items()}
+            state = json.loads(checkpoint.attrs["state"])
+
+            # Frames written after the checkpoint belong to the lost run
+            keep = int(np.searchsorted(group["steps"][:], step, side="right"))
+            for key in ("steps", *self.layers):
+                group[key].resize(keep, axis=0)
+
+        return step, arrays, state
+
+    def reset(self) -> None:
+        """Discard any previous run under this name and start an empty one."""
+        with h5py.File(self.path, "a") as f:
+            if self.group_name in f:
+                del f[self.group_name]
+
+            group = f.create_group(self.group_name)
+            group.attrs["num_points"] = self.num_points
+            group.attrs["params"] = self.params_json
+
+            group.create_dataset("steps", shape=(0,), maxshape=(None,), dtype=np.int64)
+            chunk = (1, min(self.num_points, FRAME_CHUNK_POINTS))
+            for layer, dtype in self.layers.items():
+                group.create_dataset(
+                    layer,
+                    shape=(0, self.num_points),
+                    maxshape=(None, self.num_points),
+                    chunks=chunk,
+                    dtype=dtype,
+                )
+
+    def append(
+        self,
+        step: int,
+        frames: dict[str, NDArray],
+        arrays: dict[str, NDArray] | None = None,
+        state: dict[str, Any] | None = None,
+    ) -> None:
+        """Append one frame and optionally replace the checkpoint.
+
+        Args:
+            step: Number of completed simulation steps
+            frames: Array per frame layer (cast to the layer dtype)
+            arrays: Checkpoint arrays (stored at full precision)
+            state: JSON-serializable scalar checkpoint state
+        """
+        with h5py.File(self.path, "a") as f:
+            group = f[self.group_name]
+
+            steps = group["steps"]
+            index = len(steps)
+            steps.resize(index + 1, axis=0)
+            steps[index] = step
+            for layer, dtype in self.layers.items():
+                dataset = group[layer]
+                dataset.resize(index + 1, axis=0)
+                dataset[index] = np.asarray(frames[layer], dtype=dtype)
+
+            if arrays is not None:
+                # Fill the slot not holding the latest state, then switch.
+                # Rewriting datasets in place keeps the file from growing.
+                slot = "checkpoint_1" if group.attrs.get("checkpoint") == "checkpoint_0" else "checkpoint_0"
+                staging = group.require_group(slot)
+                for key, value in arrays.items():
+                    value = np.asarray(value)
+                    dataset = staging.get(key)
+                    if dataset is None or dataset.shape != value.shape or dataset.dtype != value.dtype:
+                        if dataset is not None:
+                            del staging[key]
+                        dataset = staging.create_dataset(key, shape=value.shape, dtype=value.dtype)
+                    dataset[...] = value
+                staging.attrs["step"] = step
+                staging.attrs["state"] = json.dumps(state or {})
+
+                f.flush()
+                group.attrs["checkpoint"] = slot
+
+            f.flush()
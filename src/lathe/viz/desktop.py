@@ -213,7 +213,7 @@ class WorldViewer(QMainWindow):
 
         # Add mesh
         self.plotter.add_mesh(
-            self.world.mesh,
+            self.world.to_polydata(),
             scalars=self.current_scalar,
             cmap="terrain" if self.current_scalar == "elevation" else "viridis",
             show_edges=False,
@@ -259,10 +259,7 @@ class WorldViewer(QMainWindow):
         if not self.world:
             return
 
-        # Update active scalars
-        self.world.mesh.set_active_scalars(self.current_scalar)
-
-        # Redisplay
+        # Redisplay with the new active scalars
         self._display_mesh()
 
     def _reset_camera(self):
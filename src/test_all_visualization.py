@@ -138,7 +138,7 @@ def test_offscreen_rendering(world):
         cmap = "terrain" if scalar == "elevation" else "viridis"
 
         plotter.add_mesh(
-            world.mesh,
+            world.to_polydata(),
             scalars=scalar,
             cmap=cmap,
             show_edges=False,
@@ -181,7 +181,7 @@ def test_interactive_features(world):
     # Test mesh addition
     print("  • Adding mesh with scalars")
     plotter.add_mesh(
-        world.mesh,
+        world.to_polydata(),
         scalars="elevation",
         cmap="terrain",
         show_edges=False,
@@ -250,7 +250,7 @@ def test_data_layer_switching(world):
             plotter.clear()
 
             plotter.add_mesh(
-                world.mesh,
+                world.to_polydata(),
                 scalars=layer,
                 cmap="viridis",
                 show_edges=False,
@@ -326,7 +326,7 @@ def test_export_formats(world):
     for ext, name in formats:
         path = Path(f"./data/worlds/test_{world.id}.{ext}")
         try:
-            world.mesh.save(str(path))
+            world.to_polydata().save(str(path))
             if path.exists():
                 size = path.stat().st_size / 1024
                 print(f"  ✓ {name}: {size:.1f} KB")
@@ -40,7 +40,7 @@ def test_viewer_components():
 
     # Add mesh with elevation
     plotter.add_mesh(
-        world.mesh,
+        world.to_polydata(),
         scalars="elevation",
         cmap="terrain",
         show_edges=False,
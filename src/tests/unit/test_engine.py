@@ -0,0 +1,237 @@
+"""Tests for WorldGenerationEngine pipeline reruns."""
+
+import asyncio
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from lathe.core.engine import PipelineExecutionError
+from lathe.storage.mesh_store import MeshStore
+
+PLUGIN_PARAMS = {
+    "terrain": {"octaves": 4},
+    "tectonics": {"simulation_steps": 5},
+}
+
+
+def layer_digests(world):
+    """Content hash of every layer of a world."""
+    return {name: world.layer_digest(name) for name in world.list_data_layers()}
+
+
+@pytest.fixture
+def generated_world(engine_with_plugins, world_params):
+    """A world generated by the terrain and tectonics pipeline."""
+    return asyncio.run(engine_with_plugins.generate_world(world_params, plugin_params=PLUGIN_PARAMS))
+
+
+@pytest.mark.unit
+class TestUpdateWorld:
+    """Tests for skipping and replaying plugins in update_world()."""
+
+    def test_update_without_params_is_noop(self, engine_with_plugins, generated_world):
+        """Plugins left out of plugin_params keep their recorded parameters."""
+        before = layer_digests(generated_world)
+
+        asyncio.run(engine_with_plugins.update_world(generated_world))
+
+        assert generated_world.metadata["skipped_steps"] == ["terrain", "tectonics"]
+        assert layer_digests(generated_world) == before
+
+    def test_changed_params_rerun_only_affected_plugins(
+        self, engine_with_plugins, world_params, generated_world
+    ):
+        """Changing tectonics reruns it from terrain's output, as a fresh run would."""
+        params = {"tectonics": {"simulation_steps": 5, "num_plates": 6}}
+
+        asyncio.run(engine_with_plugins.update_world(generated_world, plugin_params=params))
+        fresh = asyncio.run(
+            engine_with_plugins.generate_world(world_params, plugin_params={**PLUGIN_PARAMS, **params})
+        )
+
+        assert generated_world.metadata["skipped_steps"] == ["terrain"]
+        assert layer_digests(generated_world) == layer_digests(fresh)
+        np.testing.assert_array_equal(generated_world.points, fresh.points)
+
+    def test_rerun_from_replays_identically(self, engine_with_plugins, generated_world):
+        """Rerunning tectonics restores its inputs and reproduces its output."""
+        before = layer_digests(generated_world)
+
+        asyncio.run(engine_with_plugins.update_world(generated_world, rerun_from="tectonics"))
+
+        assert generated_world.metadata["skipped_steps"] == ["terrain"]
+        assert layer_digests(generated_world) == before
+
+    def test_external_geometry_change_is_repaired(self, engine_with_plugins, generated_world):
+        """Points changed outside the engine make the geometry plugins stale."""
+        before = layer_digests(generated_world)
+        points = generated_world.points.copy()
+
+        generated_world.reset_mesh_geometry()
+        asyncio.run(engine_with_plugins.update_world(generated_world))
+
+        assert generated_world.metadata["skipped_steps"] == []
+        assert layer_digests(generated_world) == before
+        np.testing.assert_array_equal(generated_world.points, points)
+
+    def test_external_layer_change_is_repaired(self, engine_with_plugins, generated_world):
+        """A layer overwritten outside the engine reruns the plugins using it."""
+        before = layer_digests(generated_world)
+        elevation = generated_world.get_data_layer("elevation")
+
+        generated_world.add_data_layer("elevation", elevation + 1, overwrite=True)
+        asyncio.run(engine_with_plugins.update_world(generated_world))
+
+        assert "tectonics" not in generated_world.metadata["skipped_steps"]
+        assert layer_digests(generated_world) == before
+
+    def test_reloaded_world_reruns_from_recorded_params(
+        self, engine_with_plugins, generated_world, temp_data_dir
+    ):
+        """Recorded parameters survive saving; replays needing lost state fail."""
+        before = layer_digests(generated_world)
+        store = MeshStore(temp_data_dir)
+        store.save_world(generated_world)
+        loaded = store.load_world(generated_world.id)
+
+        asyncio.run(engine_with_plugins.update_world(loaded))
+        assert loaded.metadata["skipped_steps"] == ["terrain", "tectonics"]
+
+        with pytest.raises(PipelineExecutionError, match="not in memory"):
+            asyncio.run(engine_with_plugins.update_world(loaded, rerun_from="tectonics"))
+
+        asyncio.run(engine_with_plugins.update_world(loaded, rerun_from="terrain"))
+        assert layer_digests(loaded) == before
+
+
+@pytest.mark.unit
+class TestParamsRecord:
+    """Tests for how plugin parameters are recorded."""
+
+    def test_params_recorded_as_json(self, generated_world):
+        """Recorded parameters are the JSON form, without the worker count."""
+        runs = generated_world.metadata["plugin_runs"]
+
+        assert runs["terrain"]["params"] == {"octaves": 4}
+        assert runs["tectonics"]["params"] == {"simulation_steps": 5}
+
+    def test_array_params_recorded_by_content(self, engine_with_plugins, world_params):
+        """Arrays differing past their printed repr are told apart."""
+        values = np.zeros(10000)
+        changed = values.copy()
+        changed[5000] = 1.0
+
+        def run(value):
+            world = asyncio.run(
+                engine_with_plugins.generate_world(
+                    world_params, pipeline=["terrain"], plugin_params={"terrain": {"weights": value}}
+                )
+            )
+            return world.metadata["plugin_runs"]["terrain"]["params"]["weights"]
+
+        assert repr(values) == repr(changed)
+        assert run(values) != run(changed)
+
+    def test_world_params_recorded_by_id_and_layers(
+        self, engine_with_plugins, world_params, generated_world
+    ):
+        """Worlds passed as parameters are recorded by id and layer hashes."""
+        refined = asyncio.run(
+            engine_with_plugins.generate_world(
+                replace(world_params, recursion=4),
+                pipeline=["terrain"],
+                plugin_params={"terrain": {"refine_from": generated_world}},
+            )
+        )
+
+        recorded = refined.metadata["plugin_runs"]["terrain"]["params"]["refine_from"]
+        assert recorded["__world__"] == str(generated_world.id)
+        assert recorded["layers"] == layer_digests(generated_world)
+
+    def test_unserializable_params_rejected(self, engine_with_plugins, world_params):
+        """Parameters JSON can't represent fail instead of hashing their repr."""
+        with pytest.raises(PipelineExecutionError, match="not JSON serializable"):
+            asyncio.run(
+                engine_with_plugins.generate_world(
+                    world_params, pipeline=["terrain"], plugin_params={"terrain": {"callback": object()}}
+                )
+            )
+
+
+@pytest.mark.unit
+class TestBaseWorld:
+    """Tests for generating variants from a base world."""
+
+    def test_variant_reuses_base_terrain(self, engine_with_plugins, world_params):
+        """Only the plugin given new parameters runs; terrain stays shared."""
+        base = asyncio.run(
+            engine_with_plugins.generate_world(
+                world_params, pipeline=["terrain"], plugin_params={"terrain": {"octaves": 4}}
+            )
+        )
+        before = layer_digests(base)
+        params = {"tectonics": {"simulation_steps": 5, "num_plates": 9}}
+
+        variant = asyncio.run(engine_with_plugins.generate_world(plugin_params=params, base_world=base))
+
+        assert variant.metadata["skipped_steps"] == ["terrain"]
+        assert variant.metadata["pipeline_steps"] == ["terrain", "tectonics"]
+        for name in ("elevation_raw", "elevation_scalars", "landforms"):
+            assert np.shares_memory(variant.get_data_layer(name), base.get_data_layer(name))
+        assert layer_digests(base) == before
+        assert base.list_data_layers() == list(before)
+
+        fresh = asyncio.run(
+            engine_with_plugins.generate_world(world_params, plugin_params={**PLUGIN_PARAMS, **params})
+        )
+        assert layer_digests(variant) == layer_digests(fresh)
+        np.testing.assert_array_equal(variant.points, fresh.points)
+
+    def test_variants_of_full_world_replay_from_saved_inputs(
+        self, engine_with_plugins, world_params, generated_world
+    ):
+        """Variants of a finished world start tectonics from terrain's output."""
+        before = layer_digests(generated_world)
+        params = {"tectonics": {"simulation_steps": 5, "num_plates": 6}}
+
+        variant = asyncio.run(
+            engine_with_plugins.generate_world(plugin_params=params, base_world=generated_world)
+        )
+        fresh = asyncio.run(
+            engine_with_plugins.generate_world(world_params, plugin_params={**PLUGIN_PARAMS, **params})
+        )
+
+        assert variant.metadata["skipped_steps"] == ["terrain"]
+        assert layer_digests(variant) == layer_digests(fresh)
+        assert layer_digests(generated_world) == before
+
+    def test_params_rejected_with_base_world(self, engine_with_plugins, world_params, generated_world):
+        """Forks keep the base world's parameters."""
+        with pytest.raises(ValueError, match="base_world"):
+            asyncio.run(engine_with_plugins.generate_world(world_params, base_world=generated_world))
+
+
+@pytest.mark.unit
+class TestConcurrentGeneration:
+    """Tests for generating several worlds at once in one process."""
+
+    @pytest.mark.parametrize("noise_backend", ["vectorized", "scalar"])
+    def test_same_seed_is_deterministic(self, engine_with_plugins, world_params, noise_backend):
+        """Interleaved runs match a run made alone, despite other seeds in flight."""
+        plugin_params = {**PLUGIN_PARAMS, "terrain": {**PLUGIN_PARAMS["terrain"], "noise_backend": noise_backend}}
+        other_params = replace(world_params, seed=world_params.seed + 1)
+
+        async def generate_concurrently():
+            return await asyncio.gather(
+                *(
+                    engine_with_plugins.generate_world(params, plugin_params=plugin_params)
+                    for params in (world_params, other_params, world_params, other_params)
+                )
+            )
+
+        alone = asyncio.run(engine_with_plugins.generate_world(world_params, plugin_params=plugin_params))
+        worlds = asyncio.run(generate_concurrently())
+
+        assert layer_digests(worlds[0]) == layer_digests(worlds[2]) == layer_digests(alone)
+        assert layer_digests(worlds[1]) == layer_digests(worlds[3]) != layer_digests(alone)
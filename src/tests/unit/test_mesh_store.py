@@ -0,0 +1,48 @@
+"""Tests for HDF5 world storage."""
+
+import h5py
+import numpy as np
+import pytest
+
+from lathe.storage.mesh_store import MeshStore
+
+
+@pytest.fixture
+def store(temp_data_dir):
+    """A mesh store in a temporary directory."""
+    return MeshStore(temp_data_dir)
+
+
+@pytest.mark.unit
+class TestLayerDtypes:
+    """Tests for the per-layer dtype policy on disk."""
+
+    def test_layers_round_trip_in_spec_dtype(self, store, world_with_plates):
+        """Masks and categories are saved compactly and load unchanged."""
+        store.save_world(world_with_plates)
+
+        loaded = store.load_world(world_with_plates.id)
+        for name in ("landforms", "plate_id", "elevation"):
+            expected = world_with_plates.get_data_layer(name)
+            assert loaded.get_data_layer(name).dtype == expected.dtype
+            np.testing.assert_array_equal(loaded.get_data_layer(name), expected)
+            np.testing.assert_array_equal(store.get_data_layer(world_with_plates.id, name), expected)
+
+        with h5py.File(store._get_file_path(world_with_plates.id), "r") as f:
+            assert f["scalars/landforms"].attrs["encoding"] == "bitpacked"
+
+    def test_old_float_layers_read_in_spec_dtype(self, store, world_with_plates):
+        """Files written before the dtype policy are cast on single-layer reads too."""
+        store.save_world(world_with_plates)
+        with h5py.File(store._get_file_path(world_with_plates.id), "r+") as f:
+            for name in ("landforms", "plate_id"):
+                del f[f"scalars/{name}"]
+                f[f"scalars/{name}"] = world_with_plates.get_data_layer(name).astype(np.float64)
+
+        landforms = store.get_data_layer(world_with_plates.id, "landforms")
+        plate_id = store.get_data_layer(world_with_plates.id, "plate_id")
+
+        assert landforms.dtype == np.bool_
+        assert plate_id.dtype == np.uint8
+        np.testing.assert_array_equal(landforms, world_with_plates.get_data_layer("landforms"))
+        np.testing.assert_array_equal(plate_id, world_with_plates.get_data_layer("plate_id"))
@@ -0,0 +1,383 @@
+"""Tests for the tectonics simulator plugin."""
+
+import asyncio
+import heapq
+import json
+from dataclasses import replace
+from uuid import uuid4
+
+import h5py
+import numpy as np
+import pytest
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import dijkstra
+from scipy.spatial import cKDTree
+
+from lathe.models.world import ICOSAHEDRON_EDGE, World
+from lathe.plugins.tectonics.simulator import (
+    BOUNDARY_CONVERGENT,
+    BOUNDARY_DIVERGENT,
+    BOUNDARY_NONE,
+    BOUNDARY_TRANSFORM,
+    PLATE_STATS_DTYPE,
+    UPLIFT_WIDTH_EDGES,
+)
+from lathe.storage.mesh_store import MeshStore
+
+
+@pytest.fixture
+def terrain_world(engine_with_plugins, world_params):
+    """A world with terrain, ready for tectonics."""
+    return asyncio.run(engine_with_plugins.generate_world(world_params, pipeline=["terrain"]))
+
+
+def run_tectonics(plugin, world, **params):
+    """Run the plugin on a world and return its result."""
+    return asyncio.run(plugin.execute(world, {"simulation_steps": 5, **params}))
+
+
+@pytest.mark.unit
+class TestTectonicsStats:
+    """Tests for the simulation statistics."""
+
+    def test_metadata_is_json_serializable(self, tectonics_plugin, terrain_world):
+        """Stats stored in metadata survive json.dumps (API and SQL store)."""
+        result = run_tectonics(tectonics_plugin, terrain_world, num_plates=6)
+        assert result.success, result.message
+
+        stats = json.loads(json.dumps(terrain_world.to_dict()))["metadata"]["tectonic_plates"]["stats"]
+
+        assert len(stats["plates"]) == 6
+        assert set(stats["plates"][0]) == set(PLATE_STATS_DTYPE.names)
+        assert sum(plate["total_points"] for plate in stats["plates"]) == terrain_world.num_points
+
+    def test_result_keeps_structured_array(self, tectonics_plugin, terrain_world):
+        """The plugin result carries the per-plate stats as a structured array."""
+        result = run_tectonics(tectonics_plugin, terrain_world, num_plates=6)
+
+        plates = result.data["plate_stats"]
+        rows = terrain_world.metadata["tectonic_plates"]["stats"]["plates"]
+
+        assert plates.dtype == PLATE_STATS_DTYPE
+        np.testing.assert_array_equal(plates["plate_id"], np.arange(6))
+        assert [row["area"] for row in rows] == plates["area"].tolist()
+
+
+@pytest.mark.unit
+class TestTectonicsCheckpoints:
+    """Tests for time-lapse frames and resuming from checkpoints."""
+
+    @pytest.fixture
+    def make_world(self, terrain_plugin, world_params):
+        """Build terrain worlds that all share one id (and so one checkpoint)."""
+        world_id = uuid4()
+
+        def make():
+            world = World(world_params, world_id=world_id)
+            asyncio.run(terrain_plugin.execute(world, {}))
+            return world
+
+        return make
+
+    def test_resumed_run_matches_uninterrupted_run(self, tectonics_plugin, make_world, temp_data_dir):
+        """Extending a checkpointed run is bit-identical to running it in one go."""
+        store = MeshStore(temp_data_dir)
+        reference = make_world()
+        path = str(store.world_path(reference.id))
+        checkpointed = {"checkpoint_file": path, "checkpoint_interval": 3}
+
+        run_tectonics(tectonics_plugin, reference, simulation_steps=10)
+        first = make_world()
+        assert run_tectonics(tectonics_plugin, first, simulation_steps=6, **checkpointed).success
+        resumed = make_world()
+        result = run_tectonics(tectonics_plugin, resumed, simulation_steps=10, **checkpointed)
+
+        assert result.success, result.message
+        assert resumed.metadata["tectonic_plates"]["resumed_from_step"] == 6
+        for name in ("elevation", "plate_id", "boundary_type", "boundary_distance"):
+            np.testing.assert_array_equal(resumed.get_data_layer(name), reference.get_data_layer(name))
+        np.testing.assert_array_equal(store.get_timelapse_steps(reference.id, "tectonics"), [0, 3, 6, 9, 10])
+
+    def test_checkpoint_from_other_input_is_rejected(self, tectonics_plugin, make_world, temp_data_dir):
+        """Same id, seed and parameters but different terrain is not resumed."""
+        path = str(MeshStore(temp_data_dir).world_path(uuid4()))
+        assert run_tectonics(tectonics_plugin, make_world(), checkpoint_file=path, checkpoint_interval=2).success
+        world = make_world()
+        world.add_data_layer("elevation", world.get_data_layer("elevation") + 1.0, overwrite=True)
+
+        result = run_tectonics(tectonics_plugin, world, checkpoint_file=path, checkpoint_interval=2)
+
+        assert not result.success
+        assert "different world" in result.message
+
+    def test_unseeded_run_discards_checkpoint(self, tectonics_plugin, world_params, terrain_plugin, temp_data_dir):
+        """With seed 0 every run starts over instead of failing on the old checkpoint."""
+        store = MeshStore(temp_data_dir)
+        world_id = uuid4()
+        path = str(store.world_path(world_id))
+
+        for _ in range(2):
+            world = World(replace(world_params, seed=0), world_id=world_id)
+            asyncio.run(terrain_plugin.execute(world, {}))
+            result = run_tectonics(tectonics_plugin, world, checkpoint_file=path, checkpoint_interval=2)
+            assert result.success, result.message
+            assert world.metadata["tectonic_plates"]["resumed_from_step"] == 0
+
+        np.testing.assert_array_equal(store.get_timelapse_steps(world_id, "tectonics"), [0, 2, 4, 5])
+
+    def test_frames_use_layer_dtypes(self, tectonics_plugin, make_world, temp_data_dir):
+        """Time-lapse frames are stored like the layers they snapshot."""
+        store = MeshStore(temp_data_dir)
+        world = make_world()
+        assert run_tectonics(tectonics_plugin, world, checkpoint_file=str(store.world_path(world.id))).success
+
+        for name in ("elevation", "plate_id"):
+            frame = store.get_timelapse_frame(world.id, "tectonics", name, -1)
+            assert frame.dtype == world.get_data_layer(name).dtype
+            np.testing.assert_array_equal(frame, world.get_data_layer(name))
+        with h5py.File(store.world_path(world.id), "r") as f:
+            assert f["timelapse/tectonics/plate_id"].dtype == np.uint8
+
+    def test_checkpoint_from_other_params_is_rejected(self, tectonics_plugin, make_world, temp_data_dir):
+        """A checkpoint is never resumed (or overwritten) by a different run."""
+        path = str(MeshStore(temp_data_dir).world_path(uuid4()))
+        assert run_tectonics(tectonics_plugin, make_world(), checkpoint_file=path).success
+
+        result = run_tectonics(tectonics_plugin, make_world(), checkpoint_file=path, num_plates=6)
+
+        assert not result.success
+        assert "different parameters" in result.message
+
+
+def face_neighbors(world):
+    """Sorted neighbor lists of every point, built edge by edge from the faces."""
+    neighbors = [set() for _ in range(world.num_points)]
+    for a, b, c in world.faces.tolist():
+        for u, v in ((a, b), (b, c), (c, a)):
+            neighbors[u].add(v)
+            neighbors[v].add(u)
+    return [sorted(n) for n in neighbors]
+
+
+@pytest.fixture
+def random_plates(world):
+    """Plates around five random centers, with random angular velocities."""
+    rng = np.random.default_rng(3)
+    centers = world.points[rng.choice(world.num_points, 5, replace=False)]
+    plate_ids = np.argmin(np.linalg.norm(world.points[:, None] - centers, axis=2), axis=1)
+    return plate_ids.astype(np.uint8), rng.standard_normal((5, 3))
+
+
+@pytest.mark.unit
+class TestBoundaryDetection:
+    """Tests for the CSR adjacency and cross-plate edge detection."""
+
+    def test_vertex_adjacency_matches_faces(self, world):
+        """Row i of the CSR arrays lists the face neighbors of point i, sorted."""
+        indptr, indices = world.vertex_adjacency()
+
+        assert len(indptr) == world.num_points + 1
+        for point, expected in enumerate(face_neighbors(world)):
+            assert indices[indptr[point] : indptr[point + 1]].tolist() == expected
+
+    def test_detected_edges_match_reference(self, tectonics_plugin, world, random_plates):
+        """Cross-plate edges are those a per-vertex neighbor walk finds, in order."""
+        plate_ids, _ = random_plates
+        indptr, indices = world.vertex_adjacency()
+        expected = [
+            (point, neighbor)
+            for point, neighbors in enumerate(face_neighbors(world))
+            for neighbor in neighbors
+            if plate_ids[neighbor] != plate_ids[point]
+        ]
+
+        sources, targets = tectonics_plugin._detect_boundaries(plate_ids, indptr, indices)
+
+        assert list(zip(sources.tolist(), targets.tolist())) == expected
+
+
+def classify_reference(world, plate_ids, angular_velocities):
+    """Boundary codes computed point by point with plain Python loops."""
+    points = world.points
+    codes = np.full(world.num_points, BOUNDARY_NONE, dtype=np.uint8)
+    for point, neighbors in enumerate(face_neighbors(world)):
+        # First (lowest index) neighbor in each other plate
+        first = {}
+        for neighbor in neighbors:
+            if plate_ids[neighbor] != plate_ids[point]:
+                first.setdefault(plate_ids[neighbor], neighbor)
+        if not first:
+            continue
+
+        up = points[point] / np.linalg.norm(points[point])
+        scores = []
+        for plate, neighbor in first.items():
+            direction = points[neighbor] - points[point]
+            direction /= np.linalg.norm(direction) + 1e-10
+            relative = np.cross(angular_velocities[plate_ids[point]] - angular_velocities[plate], up)
+            scores.append(-np.dot(relative, direction))
+        convergence = sum(scores) / len(scores)
+
+        if convergence > 0.3:
+            codes[point] = BOUNDARY_CONVERGENT
+        elif convergence < -0.3:
+            codes[point] = BOUNDARY_DIVERGENT
+        else:
+            codes[point] = BOUNDARY_TRANSFORM
+    return codes
+
+
+@pytest.mark.unit
+class TestBoundaryClassification:
+    """Tests for the vectorized boundary classification."""
+
+    def test_matches_per_point_reference(self, tectonics_plugin, world, random_plates):
+        """Edge-array classification equals the point-by-point definition."""
+        plate_ids, angular_velocities = random_plates
+        indptr, indices = world.vertex_adjacency()
+        edges = tectonics_plugin._detect_boundaries(plate_ids, indptr, indices)
+
+        codes = tectonics_plugin._classify_boundaries(world, edges, plate_ids, angular_velocities)
+
+        expected = classify_reference(world, plate_ids, angular_velocities)
+        np.testing.assert_array_equal(codes, expected)
+        assert set(np.unique(codes)) == {BOUNDARY_NONE, BOUNDARY_CONVERGENT, BOUNDARY_DIVERGENT, BOUNDARY_TRANSFORM}
+
+    def test_rows_match_full_classification(self, tectonics_plugin, world, random_plates):
+        """Classifying a subset of rows gives those rows of the full result."""
+        plate_ids, angular_velocities = random_plates
+        indptr, indices = world.vertex_adjacency()
+        rows = np.arange(0, world.num_points, 7)
+        full_edges = tectonics_plugin._detect_boundaries(plate_ids, indptr, indices)
+        row_edges = tectonics_plugin._detect_boundaries(plate_ids, indptr, indices, rows=rows)
+
+        full = tectonics_plugin._classify_boundaries(world, full_edges, plate_ids, angular_velocities)
+        partial = tectonics_plugin._classify_boundaries(world, row_edges, plate_ids, angular_velocities, rows=rows)
+
+        np.testing.assert_array_equal(partial, full[rows])
+
+
+@pytest.mark.unit
+class TestPlateMotion:
+    """Tests for rigid plate rotation and incremental boundary updates."""
+
+    def test_incremental_boundaries_match_full_recompute(self, tectonics_plugin, terrain_world):
+        """Band-limited updates over many steps equal classifying the final plates afresh."""
+        world = terrain_world.fork()
+        result = run_tectonics(tectonics_plugin, world, simulation_steps=10, rotation_rate=2.0, num_plates=6)
+        assert result.success, result.message
+        motion = world.metadata["tectonic_plates"]
+        assert motion["reassigned_vertices"] > 0
+
+        # The run classified on the terrain geometry, which the fork left unchanged
+        plate_ids = world.get_data_layer("plate_id")
+        rates = np.radians(motion["rotation_degrees_per_step"]) / np.radians(2.0)
+        angular_velocities = np.array(motion["euler_poles"]) * rates[:, None]
+        indptr, indices = terrain_world.vertex_adjacency()
+        edges = tectonics_plugin._detect_boundaries(plate_ids, indptr, indices)
+        full = tectonics_plugin._classify_boundaries(terrain_world, edges, plate_ids, angular_velocities)
+
+        np.testing.assert_array_equal(world.get_data_layer("boundary_type"), full)
+
+    def test_rotation_keeps_points_on_sphere(self, tectonics_plugin, world):
+        """Rotated points keep their radius, and rotating back restores them."""
+        unit = world.topology.points / world.params.radius
+        angular_velocities = np.random.default_rng(5).standard_normal((world.num_points, 3))
+
+        rotated = tectonics_plugin._rotate(unit, angular_velocities, 0.7)
+
+        np.testing.assert_allclose(np.linalg.norm(rotated, axis=1), np.linalg.norm(unit, axis=1), rtol=1e-12)
+        np.testing.assert_allclose(tectonics_plugin._rotate(rotated, angular_velocities, -0.7), unit, atol=1e-12)
+
+    def test_common_rotation_moves_plate_map_rigidly(self, tectonics_plugin, terrain_world, monkeypatch):
+        """If every plate shares one Euler pole, the final map is the initial map rotated."""
+        pole = np.array([0.0, 0.0, 1.0])
+        monkeypatch.setattr(
+            tectonics_plugin, "_euler_poles", lambda centers, velocities: np.tile(pole, (len(centers), 1))
+        )
+        still = terrain_world.fork()
+        moved = terrain_world.fork()
+
+        run_tectonics(tectonics_plugin, still, simulation_steps=10, rotation_rate=0.0)
+        run_tectonics(tectonics_plugin, moved, simulation_steps=10, rotation_rate=3.0)
+
+        unit = terrain_world.topology.points / terrain_world.params.radius
+        upstream = tectonics_plugin._rotate(unit, np.tile(pole, (len(unit), 1)), -np.radians(30.0))
+        _, origin = cKDTree(unit).query(upstream)
+        assert moved.metadata["tectonic_plates"]["reassigned_vertices"] > 0
+        np.testing.assert_array_equal(moved.get_data_layer("plate_id"), still.get_data_layer("plate_id")[origin])
+
+
+@pytest.mark.unit
+class TestBoundaryDistance:
+    """Tests for the geodesic boundary distance field and uplift falloff."""
+
+    def test_matches_scipy_dijkstra(self, tectonics_plugin, terrain_world):
+        """boundary_distance is a multi-source Dijkstra over edges of the original sphere."""
+        result = run_tectonics(tectonics_plugin, terrain_world)
+        assert result.success, result.message
+
+        points = terrain_world.topology.points
+        faces = terrain_world.faces
+        edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+        lengths = np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
+        graph = coo_matrix((lengths, (edges[:, 0], edges[:, 1])), shape=(len(points),) * 2).tocsr()
+        sources = np.flatnonzero(terrain_world.get_data_layer("boundary_type"))
+        expected = dijkstra(graph, directed=False, indices=sources).min(axis=0)
+
+        np.testing.assert_allclose(terrain_world.get_data_layer("boundary_distance"), expected, rtol=1e-6)
+        limited = terrain_world.geodesic_distance(sources, max_distance=2e6)
+        np.testing.assert_array_equal(np.isinf(limited), expected > 2e6)
+
+    def test_default_uplift_width_spans_mesh_edges(self, tectonics_plugin, terrain_world):
+        """By default uplift falls off over a few mesh edges, not within one."""
+        run_tectonics(tectonics_plugin, terrain_world)
+
+        edge = terrain_world.params.radius * ICOSAHEDRON_EDGE / 2**terrain_world.params.recursion
+        assert terrain_world.metadata["tectonic_plates"]["uplift_width"] == UPLIFT_WIDTH_EDGES * edge
+
+
+def flood_fill_reference(indptr, indices, costs, seeds, rates):
+    """Multi-source Dijkstra with heapq; ties go to the lowest region."""
+    num_points = len(indptr) - 1
+    region = np.full(num_points, -1, dtype=np.int64)
+    arrival = np.full(num_points, np.inf)
+    inverse_rates = 1.0 / rates
+    heap = [(0.0, owner, point) for owner, point in enumerate(seeds.tolist())]
+    heapq.heapify(heap)
+    while heap:
+        time, owner, point = heapq.heappop(heap)
+        if region[point] >= 0:
+            continue
+        region[point] = owner
+        arrival[point] = time
+        for edge in range(indptr[point], indptr[point + 1]):
+            target = indices[edge]
+            if region[target] < 0:
+                heapq.heappush(heap, (time + costs[edge] * inverse_rates[owner], owner, target))
+    return region, arrival
+
+
+@pytest.mark.unit
+class TestPlateFloodFill:
+    """Tests for the bucket-queue plate flood fill."""
+
+    @pytest.mark.parametrize("roughness", [0.0, 0.5], ids=["ties", "random-costs"])
+    def test_matches_heap_dijkstra(self, tectonics_plugin, world, roughness):
+        """Plate assignment and arrival times equal a plain heapq Dijkstra."""
+        rng = np.random.default_rng(11)
+        indptr, indices = world.vertex_adjacency()
+        seeds = rng.choice(world.num_points, 8, replace=False)
+        if roughness:
+            costs = world.edge_length_graph().data * rng.uniform(1.0 - roughness, 1.0 + roughness, len(indices))
+            rates = rng.uniform(0.5, 1.5, len(seeds))
+        else:
+            # Unit costs and equal rates: many points are reached by two plates at once
+            costs = np.ones(len(indices))
+            rates = np.ones(len(seeds))
+
+        region, arrival = tectonics_plugin._flood_fill(indptr, indices, costs, seeds, rates)
+
+        expected_region, expected_arrival = flood_fill_reference(indptr, indices, costs, seeds, rates)
+        np.testing.assert_array_equal(region, expected_region)
+        np.testing.assert_array_equal(arrival, expected_arrival)
@@ -0,0 +1,239 @@
+"""Tests for the terrain generator plugin."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from lathe.models.world import World
+from lathe.plugins.terrain.cache import NoiseFieldCache
+from lathe.plugins.terrain.generator import TerrainGeneratorPlugin
+
+
+def generate_terrain(plugin, params, **plugin_params):
+    """Run terrain on a new world and return it."""
+    world = World(params)
+    result = asyncio.run(plugin.execute(world, {"octaves": 4, **plugin_params}))
+    assert result.success, result.message
+    return world
+
+
+@pytest.mark.unit
+class TestTerrainRefinement:
+    """Tests for refining terrain from a lower-recursion world."""
+
+    @pytest.fixture
+    def parent(self, terrain_plugin, world_params):
+        """Terrain at the fixture recursion."""
+        return generate_terrain(terrain_plugin, world_params)
+
+    def test_refine_without_smoothing_equals_full_generation(self, terrain_plugin, world_params, parent):
+        """refine_smoothness=0 evaluates every octave, as a fresh run does."""
+        child_params = replace(world_params, recursion=world_params.recursion + 1)
+
+        refined = generate_terrain(terrain_plugin, child_params, refine_from=parent, refine_smoothness=0)
+        full = generate_terrain(terrain_plugin, child_params)
+
+        for name in ("elevation_raw", "elevation", "landforms"):
+            np.testing.assert_array_equal(refined.get_data_layer(name), full.get_data_layer(name))
+        np.testing.assert_array_equal(refined.points, full.points)
+
+    def test_inherited_vertices_keep_parent_values(self, terrain_plugin, world_params, parent):
+        """Vertices shared with the parent copy its raw elevation."""
+        child_params = replace(world_params, recursion=world_params.recursion + 2)
+
+        refined = generate_terrain(terrain_plugin, child_params, refine_from=parent)
+
+        np.testing.assert_array_equal(
+            refined.get_data_layer("elevation_raw")[: parent.num_points],
+            parent.get_data_layer("elevation_raw"),
+        )
+
+    def test_subdivision_parents_bisect_edges(self, world_params):
+        """Each new vertex is joined by mesh edges to the two it bisects."""
+        world = World(replace(world_params, recursion=world_params.recursion + 1))
+        faces = world.faces
+        edges = {
+            (min(a, b), max(a, b))
+            for a, b in np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]).tolist()
+        }
+
+        (parents,) = world.subdivision_parents(world_params.recursion)
+        start = world.num_points - len(parents)
+
+        assert start == World(world_params).num_points
+        for vertex, (a, b) in enumerate(parents.tolist(), start):
+            assert a < start and b < start
+            assert (a, vertex) in edges
+            assert (b, vertex) in edges
+
+    def test_refine_rejects_finer_parent(self, terrain_plugin, world_params, parent):
+        """The parent must have a lower recursion."""
+        result = asyncio.run(terrain_plugin.execute(World(world_params), {"refine_from": parent}))
+
+        assert not result.success
+        assert "must be lower" in result.message
+
+
+@pytest.mark.unit
+class TestNoiseFieldCache:
+    """Tests for the per-octave noise field cache."""
+
+    def test_cached_generation_is_bit_identical(self, world_params, tmp_path):
+        """Cache hits (memory and disk) reproduce an uncached run exactly."""
+        reference = generate_terrain(TerrainGeneratorPlugin(), world_params)
+        cache = NoiseFieldCache(tmp_path)
+        plugin = TerrainGeneratorPlugin(noise_cache=cache)
+
+        cold = generate_terrain(plugin, world_params)
+        assert cache.misses == 4 and cache.hits == 0
+        warm = generate_terrain(plugin, world_params)
+        assert cache.hits == 4
+        disk_plugin = TerrainGeneratorPlugin(noise_cache=NoiseFieldCache(tmp_path))
+        from_disk = generate_terrain(disk_plugin, world_params)
+
+        for world in (cold, warm, from_disk):
+            raw = world.get_data_layer("elevation_raw")
+            np.testing.assert_array_equal(raw, reference.get_data_layer("elevation_raw"))
+            np.testing.assert_array_equal(world.points, reference.points)
+
+    def test_amplitude_sweep_reuses_fields(self, world_params):
+        """Changing only amplitudes recomputes no octave."""
+        cache = NoiseFieldCache()
+        plugin = TerrainGeneratorPlugin(noise_cache=cache)
+
+        generate_terrain(plugin, world_params)
+        generate_terrain(plugin, world_params, init_strength=0.2, persistence=0.7)
+
+        assert cache.misses == 4
+        assert cache.hits == 4
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        """The memory tier stays within budget, dropping the oldest field."""
+        field = np.zeros(100)
+        cache = NoiseFieldCache(max_memory_bytes=2 * field.nbytes)
+
+        cache.put("a", field)
+        cache.put("b", field)
+        assert cache.get("a") is not None
+        cache.put("c", field)
+
+        assert cache.memory_bytes <= 2 * field.nbytes
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_disk_budget_evicts_oldest_files(self, tmp_path):
+        """The disk tier stays within budget and leaves no temporary files."""
+        field = np.zeros(100)
+        cache = NoiseFieldCache(tmp_path, max_memory_bytes=0, max_disk_bytes=2 * (field.nbytes + 128))
+
+        for n, key in enumerate("abc"):
+            cache.put(key, field + n)
+            os.utime(tmp_path / f"{key}.npy", (n, n))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["b.npy", "c.npy"]
+        np.testing.assert_array_equal(cache.get("c"), field + 2)
+
+    def test_concurrent_puts_do_not_collide(self, tmp_path):
+        """Writers of the same key use separate temporary files."""
+        cache = NoiseFieldCache(tmp_path, max_disk_bytes=1 << 20)
+        fields = [np.full(1000, n, dtype=np.float64) for n in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda field: cache.put("shared", field), fields * 4))
+
+        assert [p.name for p in tmp_path.iterdir()] == ["shared.npy"]
+        stored = NoiseFieldCache(tmp_path).get("shared")
+        assert any(np.array_equal(stored, field) for field in fields)
+
+
+@pytest.mark.unit
+class TestParallelGeneration:
+    """Tests for the shared-memory process pool."""
+
+    @pytest.mark.parametrize("plugin_params", [{}, {"gradients": True}], ids=["values", "gradients"])
+    def test_pool_matches_serial_bit_for_bit(self, terrain_plugin, world_params, plugin_params):
+        """Splitting vertices across workers does not change any output."""
+        serial = generate_terrain(terrain_plugin, world_params, **plugin_params)
+        pooled = generate_terrain(terrain_plugin, world_params, parallel=True, workers=2, **plugin_params)
+
+        for name in serial.list_data_layers():
+            np.testing.assert_array_equal(pooled.get_data_layer(name), serial.get_data_layer(name))
+        np.testing.assert_array_equal(pooled.points, serial.points)
+
+    def test_pooled_cache_fill_matches_serial(self, terrain_plugin, world_params):
+        """Octave fields computed by the pool are the ones the serial loop sums."""
+        serial = generate_terrain(terrain_plugin, world_params)
+        plugin = TerrainGeneratorPlugin(noise_cache=NoiseFieldCache())
+
+        pooled = generate_terrain(plugin, world_params, parallel=True, workers=2)
+
+        np.testing.assert_array_equal(pooled.get_data_layer("elevation_raw"), serial.get_data_layer("elevation_raw"))
+
+
+@pytest.mark.unit
+class TestTerrainPatches:
+    """Tests for regional high-resolution patches."""
+
+    def test_patch_matches_global_world(self, terrain_plugin, world_params):
+        """Patch vertices and raw elevations are those of the global recursion-7 world."""
+        coarse = generate_terrain(terrain_plugin, world_params)
+        fine = generate_terrain(terrain_plugin, replace(world_params, recursion=7))
+
+        patch = asyncio.run(terrain_plugin.generate_patch(coarse, "region", (10.0, 20.0), (30.0, 45.0), 7))
+
+        index = {tuple(point): i for i, point in enumerate(fine.topology.points.tolist())}
+        vertices = np.array([index[tuple(point)] for point in patch.points.tolist()])
+        assert len(np.unique(vertices)) == patch.num_points
+        np.testing.assert_array_equal(
+            patch.get_data_layer("elevation_raw").astype(np.float32),
+            fine.get_data_layer("elevation_raw")[vertices],
+        )
+
+    def test_warped_world_samples_undeformed_sphere(self, world_params):
+        """Fields cached from a warped world are those of the undeformed sphere."""
+        reference = generate_terrain(TerrainGeneratorPlugin(), world_params)
+        plugin = TerrainGeneratorPlugin(noise_cache=NoiseFieldCache())
+
+        warped = World(world_params)
+        warped.set_points(warped.points * 1.01)
+        asyncio.run(plugin.execute(warped, {"octaves": 4}))
+        clean = generate_terrain(plugin, world_params)
+
+        assert plugin.noise_cache.hits == 4
+        for world in (warped, clean):
+            raw = world.get_data_layer("elevation_raw")
+            np.testing.assert_array_equal(raw, reference.get_data_layer("elevation_raw"))
+
+
+def normal_error_degrees(world):
+    """Angle between the analytic normals and mesh normals of the warped world."""
+    analytic = world.get_data_layer("Normals").astype(np.float64)
+    world.compute_normals()
+    mesh = world.get_data_layer("Normals").astype(np.float64)
+    return np.degrees(np.arccos(np.clip(np.einsum("ij,ij->i", analytic, mesh), -1.0, 1.0)))
+
+
+@pytest.mark.unit
+class TestAnalyticGradients:
+    """Tests for normals and slope derived from analytic noise gradients."""
+
+    def test_normals_match_mesh_normals(self, terrain_plugin, world_params):
+        """Where the recursion-7 mesh resolves the noise, normals agree within 0.2 degrees."""
+        world = generate_terrain(terrain_plugin, replace(world_params, recursion=7), octaves=2, gradients=True)
+
+        assert normal_error_degrees(world).max() < 0.2
+
+    def test_mesh_normals_converge_to_analytic(self, terrain_plugin, world_params):
+        """Octaves too fine for the mesh: the discretization error drops ~4x per level."""
+        errors = [
+            normal_error_degrees(
+                generate_terrain(terrain_plugin, replace(world_params, recursion=recursion), gradients=True)
+            ).mean()
+            for recursion in (6, 7)
+        ]
+
+        assert errors[1] < errors[0] / 3
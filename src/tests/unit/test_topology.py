@@ -0,0 +1,230 @@
+"""Tests for the shared icosphere topology."""
+
+import json
+import shutil
+import sys
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from lathe.main import main
+from lathe.models.topology import (
+    PACK_ARRAYS,
+    SphereTopology,
+    build_icosphere,
+    clear_topologies,
+    get_topology,
+    icosphere_num_points,
+    pack_name,
+    write_topology_pack,
+)
+from lathe.models.world import World, WorldParameters
+
+RADIUS = 6378100
+
+
+@pytest.mark.unit
+class TestBuildIcosphere:
+    """Tests for the NumPy icosphere builder."""
+
+    @pytest.mark.parametrize("recursion", range(6))
+    def test_matches_pyvista_bit_for_bit(self, recursion):
+        """Points and faces equal pyvista.Icosphere, in the same order."""
+        pv = pytest.importorskip("pyvista")
+        reference = pv.Icosphere(radius=RADIUS, nsub=recursion)
+
+        points, faces = build_icosphere(recursion, RADIUS)
+
+        assert points.dtype == np.float64
+        np.testing.assert_array_equal(points, reference.points)
+        np.testing.assert_array_equal(faces, reference.faces.reshape(-1, 4)[:, 1:])
+
+    @pytest.mark.parametrize("recursion", range(6))
+    def test_point_and_face_counts(self, recursion):
+        """An icosphere of level k has 10 * 4**k + 2 points and 20 * 4**k faces."""
+        points, faces = build_icosphere(recursion, RADIUS)
+
+        assert len(points) == icosphere_num_points(recursion) == 10 * 4**recursion + 2
+        assert len(faces) == 20 * 4**recursion
+
+    def test_subdivision_is_hierarchical(self):
+        """The first vertices of level k are the vertices of level k - 1."""
+        coarse, _ = build_icosphere(3, RADIUS)
+        fine, _ = build_icosphere(4, RADIUS)
+
+        np.testing.assert_array_equal(fine[: len(coarse)], coarse)
+
+    def test_points_lie_on_sphere(self):
+        """Projected points are at the requested radius (to float32 precision, as in VTK)."""
+        points, _ = build_icosphere(4, RADIUS)
+
+        np.testing.assert_allclose(np.linalg.norm(points, axis=1), RADIUS, rtol=1e-6)
+
+
+@pytest.fixture
+def pack_dir(tmp_path, monkeypatch):
+    """Topology directory for the test, with the registry cleared around it."""
+    monkeypatch.setenv("LATHE_TOPOLOGY_DIR", str(tmp_path))
+    clear_topologies()
+    yield tmp_path
+    clear_topologies()
+
+
+def build_pack(monkeypatch, recursion):
+    """Run `lathe topology build <recursion>` with the default radius."""
+    monkeypatch.setattr(sys, "argv", ["lathe", "topology", "build", str(recursion)])
+    main()
+
+
+@pytest.mark.unit
+class TestTopologyPack:
+    """Tests for writing and memory-mapping topology packs."""
+
+    def test_cli_pack_round_trip(self, pack_dir, monkeypatch, capsys):
+        """A pack built by the CLI is memory-mapped and equals a fresh build."""
+        build_pack(monkeypatch, 3)
+        assert "Wrote" in capsys.readouterr().out
+
+        topology = get_topology(3, RADIUS)
+
+        assert topology.pack_dir == pack_dir / pack_name(3, RADIUS)
+        fresh = SphereTopology(3, RADIUS)
+        for name in PACK_ARRAYS:
+            array = topology._array(name)
+            assert isinstance(array, np.memmap)
+            assert not array.flags.writeable
+            np.testing.assert_array_equal(array, fresh._array(name))
+        assert World(WorldParameters(recursion=3, radius=RADIUS)).points is topology.points
+
+    def test_existing_pack_needs_force(self, pack_dir, monkeypatch, capsys):
+        """Building over an existing pack is refused without --force."""
+        build_pack(monkeypatch, 2)
+        build_pack(monkeypatch, 2)
+
+        assert "already exists" in capsys.readouterr().out
+        with pytest.raises(FileExistsError):
+            write_topology_pack(2, RADIUS)
+
+    @pytest.mark.parametrize("damage", ["truncated", "wrong-radius", "wrong-recursion"])
+    def test_damaged_pack_is_rejected(self, pack_dir, damage):
+        """A corrupt or mismatched pack is ignored and the topology is computed."""
+        path = write_topology_pack(3, RADIUS)
+        if damage == "truncated":
+            points = path / "points.npy"
+            points.write_bytes(points.read_bytes()[:-8])
+        elif damage == "wrong-radius":
+            manifest = json.loads((path / "pack.json").read_text())
+            (path / "pack.json").write_text(json.dumps({**manifest, "radius": 1.0}))
+        else:
+            # A recursion-2 pack under the recursion-3 name, manifest edited to match
+            shutil.rmtree(path)
+            write_topology_pack(2, RADIUS).rename(path)
+            manifest = json.loads((path / "pack.json").read_text())
+            (path / "pack.json").write_text(json.dumps({**manifest, "recursion": 3}))
+
+        topology = get_topology(3, RADIUS)
+
+        assert topology.pack_dir is None
+        assert not isinstance(topology.points, np.memmap)
+        np.testing.assert_array_equal(topology.points, build_icosphere(3, RADIUS)[0])
+
+
+def face_neighbor_sets(faces, num_points):
+    """Each point together with its neighbors, from the triangle edges."""
+    neighbors = [{point} for point in range(num_points)]
+    for a, b, c in faces.tolist():
+        for u, v in ((a, b), (b, c), (c, a)):
+            neighbors[u].add(v)
+            neighbors[v].add(u)
+    return neighbors
+
+
+@pytest.mark.unit
+class TestWorldNeighbors:
+    """Tests for radius neighbor queries against brute force."""
+
+    def test_one_edge_radius_gives_face_neighbors(self, world):
+        """Just beyond the longest edge, the neighbors are exactly the face neighbors."""
+        faces = world.faces
+        edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+        radius = 1.1 * np.linalg.norm(world.points[edges[:, 0]] - world.points[edges[:, 1]], axis=1).max()
+        expected = face_neighbor_sets(faces, world.num_points)
+
+        indptr, indices = world.get_neighbors_many(np.arange(world.num_points), radius)
+
+        for point in range(world.num_points):
+            assert indices[indptr[point] : indptr[point + 1]].tolist() == sorted(expected[point])
+            assert world.get_neighbors(point, radius).tolist() == sorted(expected[point])
+
+    def test_matches_brute_force_after_warping(self, world):
+        """Queries follow the current geometry, like a scan over all points."""
+        world.add_data_layer("elevation", np.random.default_rng(2).uniform(-1e5, 1e5, world.num_points))
+        world.get_neighbors(0, 1.0)  # build the index on the undeformed sphere
+        world.warp_by_elevation(factor=1.0)
+        radius = 2e6
+        centers = np.arange(0, world.num_points, 13)
+
+        indptr, indices = world.get_neighbors_many(centers, radius)
+
+        for i, center in enumerate(centers):
+            distances = np.linalg.norm(world.points - world.points[center], axis=1)
+            expected = np.flatnonzero(distances <= radius)
+            np.testing.assert_array_equal(indices[indptr[i] : indptr[i + 1]], expected)
+            np.testing.assert_array_equal(world.get_neighbors(center, radius), expected)
+
+
+def bfs_ring(neighbors, start, k):
+    """Points within k edges of start, by breadth-first search."""
+    seen = {start}
+    frontier = [start]
+    for _ in range(k):
+        frontier = [n for point in frontier for n in neighbors[point] if n not in seen]
+        seen.update(frontier)
+    return sorted(seen)
+
+
+@pytest.mark.unit
+class TestKRing:
+    """Tests for k-ring neighborhoods and reductions over them."""
+
+    @pytest.fixture
+    def small_world(self, world_params):
+        """A recursion-2 world; points 0-11 are the icosahedron's pentagon vertices."""
+        return World(replace(world_params, recursion=2))
+
+    @pytest.mark.parametrize("k", [0, 1, 2, 3])
+    def test_matches_breadth_first_search(self, small_world, k):
+        """Row i of the k-ring holds exactly the points a BFS reaches in k steps."""
+        neighbors = face_neighbor_sets(small_world.faces, small_world.num_points)
+
+        ring = small_world.k_ring(k)
+
+        np.testing.assert_array_equal(ring.data, 1)
+        for point in range(small_world.num_points):
+            row = ring.indices[ring.indptr[point] : ring.indptr[point + 1]]
+            assert row.tolist() == bfs_ring(neighbors, point, k)
+
+    def test_pentagon_vertices_have_smaller_rings(self, small_world):
+        """The 12 degree-5 vertices have 6-point 1-rings; every other point has 7."""
+        sizes = np.diff(small_world.k_ring(1).indptr)
+
+        np.testing.assert_array_equal(sizes[:12], 6)
+        np.testing.assert_array_equal(sizes[12:], 7)
+
+    @pytest.mark.parametrize("reduction", ["mean", "var", "max", "min"])
+    @pytest.mark.parametrize("k", [0, 2])
+    def test_reductions_match_numpy(self, small_world, reduction, k):
+        """Sparse reductions equal numpy reductions over each BFS neighborhood."""
+        neighbors = face_neighbor_sets(small_world.faces, small_world.num_points)
+        rng = np.random.default_rng(4)
+        scalar = rng.normal(1000.0, 50.0, small_world.num_points)
+        vector = rng.normal(size=(small_world.num_points, 3))
+
+        for values in (scalar, vector):
+            reduced = small_world.neighborhood_reduce(values, k=k, reduction=reduction)
+
+            reduce = getattr(np, reduction)
+            expected = np.array([reduce(values[bfs_ring(neighbors, point, k)], axis=0) for point in range(len(values))])
+            assert reduced.shape == values.shape
+            np.testing.assert_allclose(reduced, expected, rtol=1e-9, atol=1e-9)
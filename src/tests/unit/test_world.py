@@ -0,0 +1,148 @@
+"""Tests for the World model."""
+
+import numpy as np
+import pytest
+
+from lathe.models.topology import clear_topologies
+from lathe.models.world import World
+
+
+@pytest.mark.unit
+class TestWorldPoints:
+    """Tests for sharing the topology's points."""
+
+    def test_new_world_shares_topology_points(self, world_params):
+        """A new world allocates no points of its own."""
+        world = World(world_params)
+
+        assert world.points is world.topology.points
+        assert not world.points.flags.writeable
+
+    def test_geometry_changes_leave_topology_untouched(self, world_with_elevation):
+        """Warping copies the points; resetting shares the topology's again."""
+        world = world_with_elevation
+        original = world.topology.points.copy()
+
+        world.warp_by_elevation()
+        assert not np.shares_memory(world.points, world.topology.points)
+        np.testing.assert_array_equal(world.topology.points, original)
+
+        world.update_geometry(factor=1.0)
+        world.reset_mesh_geometry()
+        assert world.points is world.topology.points
+        np.testing.assert_array_equal(world.topology.points, original)
+
+
+@pytest.mark.unit
+class TestWorldFork:
+    """Tests for copy-on-write forks."""
+
+    def test_fork_shares_layers_and_points(self, world_with_elevation):
+        """A new fork holds no copies of the parent's arrays."""
+        fork = world_with_elevation.fork("variant")
+
+        assert fork.id != world_with_elevation.id
+        assert fork.params.name == "variant"
+        assert fork.topology is world_with_elevation.topology
+        assert fork.metadata["forked_from"] == str(world_with_elevation.id)
+        assert np.shares_memory(fork.points, world_with_elevation.points)
+        for name in world_with_elevation.list_data_layers():
+            assert np.shares_memory(fork.get_data_layer(name), world_with_elevation.get_data_layer(name))
+            assert fork.layer_digest(name) == world_with_elevation.layer_digest(name)
+
+    def test_fork_copies_only_written_layers(self, world_with_elevation):
+        """Replacing a layer in the fork leaves the parent's layer in place."""
+        elevation = world_with_elevation.get_data_layer("elevation").copy()
+        fork = world_with_elevation.fork()
+
+        fork.add_data_layer("elevation", elevation + 1, overwrite=True)
+        fork.add_data_layer("slope", np.zeros(fork.num_points))
+
+        np.testing.assert_array_equal(world_with_elevation.get_data_layer("elevation"), elevation)
+        assert not world_with_elevation.has_data_layer("slope")
+        landforms = world_with_elevation.get_data_layer("landforms")
+        assert np.shares_memory(fork.get_data_layer("landforms"), landforms)
+        records = world_with_elevation.layer_records
+        assert fork.layer_records["elevation"].version > records["elevation"].version
+
+    def test_shared_arrays_are_read_only(self, world_with_elevation):
+        """Neither side can write through an array the other still uses."""
+        fork = world_with_elevation.fork()
+
+        for world in (world_with_elevation, fork):
+            with pytest.raises(ValueError, match="read-only"):
+                world.get_data_layer("elevation")[0] = 0.0
+            with pytest.raises(ValueError, match="read-only"):
+                world.points[0] = 0.0
+
+    def test_geometry_changes_copy_points(self, world_with_elevation):
+        """Warping either side copies its points first."""
+        original = world_with_elevation.points.copy()
+        fork = world_with_elevation.fork()
+
+        fork.warp_by_elevation()
+        np.testing.assert_array_equal(world_with_elevation.points, original)
+
+        world_with_elevation.warp_by_elevation(factor=-1.0)
+        fork.reset_mesh_geometry()
+        np.testing.assert_array_equal(fork.points, original)
+        assert not np.array_equal(world_with_elevation.points, original)
+
+    def test_fork_bookkeeping_is_independent(self, world_with_elevation):
+        """Metadata and layer records are copied, not shared."""
+        fork = world_with_elevation.fork()
+
+        fork.metadata["pipeline_steps"].append("terrain")
+        fork.layer_records["elevation"].producer = "terrain"
+
+        assert world_with_elevation.metadata["pipeline_steps"] == []
+        assert world_with_elevation.layer_records["elevation"].producer is None
+
+    def test_fork_copies_patches(self, world_with_elevation):
+        """Each patch is a new object sharing its arrays read-only."""
+        patch = world_with_elevation.create_patch("region", (10.0, 20.0), (30.0, 45.0), 4)
+        patch.add_data_layer("elevation", np.zeros(patch.num_points))
+        fork = world_with_elevation.fork()
+        fork_patch = fork.get_patch("region")
+
+        fork_patch.add_data_layer("elevation", np.ones(patch.num_points), overwrite=True)
+        fork_patch.add_data_layer("slope", np.ones(patch.num_points))
+
+        assert fork_patch is not patch
+        assert np.shares_memory(fork_patch.points, patch.points)
+        np.testing.assert_array_equal(patch.get_data_layer("elevation"), 0.0)
+        assert patch.get_data_layer("slope") is None
+        with pytest.raises(ValueError, match="read-only"):
+            patch.points[0] = 0.0
+
+    def test_fork_reuses_topology(self, world_with_elevation):
+        """The fork is built on the same topology object, even after the registry is cleared."""
+        clear_topologies()
+        fork = world_with_elevation.fork()
+
+        assert fork.topology is world_with_elevation.topology
+        assert fork.points is world_with_elevation.points
+
+
+@pytest.mark.unit
+class TestWorldPolyData:
+    """Tests for the PyVista view of a world."""
+
+    def test_to_polydata_shares_points_and_layers(self, world_with_elevation):
+        """The mesh wraps the world's arrays instead of copying them."""
+        mesh = world_with_elevation.to_polydata()
+
+        assert mesh.n_points == world_with_elevation.num_points
+        assert mesh.n_cells == world_with_elevation.num_faces
+        assert np.shares_memory(mesh.points, world_with_elevation.points)
+        elevation = world_with_elevation.get_data_layer("elevation")
+        np.testing.assert_array_equal(mesh.point_data["elevation"], elevation)
+
+    def test_mesh_property_is_deprecated(self, world_with_elevation):
+        """World.mesh still works for older plugins, with a warning."""
+        with pytest.deprecated_call():
+            mesh = world_with_elevation.mesh
+
+        assert mesh is world_with_elevation.to_polydata()
+        assert tuple(mesh.points[0]) == tuple(world_with_elevation.points[0])
+